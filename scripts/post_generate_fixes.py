@@ -8,6 +8,7 @@ handled by datamodel-code-generator directly:
 1. Adds model_validators to types requiring mutual exclusivity checks
 2. Fixes self-referential RootModel type annotations
 3. Fixes BrandManifest forward references
+4. Adds discriminators to unions of Literal-tagged variants
 """
 
 from __future__ import annotations
@@ -110,6 +111,52 @@ def fix_enum_defaults():
     print("  brand_manifest.py enum defaults fixed")
 
 
+# (file, union as generated, discriminator field) for unions whose variants all
+# carry a required Literal tag. The schemas don't declare a discriminator for
+# these, so without one Pydantic tries each variant in turn.
+TAGGED_UNIONS = [
+    ("activate_signal_request.py", "destination.Destination1 | destination.Destination2", "type"),
+    ("get_signals_request.py", "destination.Destination1 | destination.Destination2", "type"),
+    ("activate_signal_response.py", "deployment.Deployment1 | deployment.Deployment2", "type"),
+    ("get_signals_response.py", "deployment.Deployment1 | deployment.Deployment2", "type"),
+    ("list_creatives_response.py", "sub_asset.SubAsset1 | sub_asset.SubAsset2", "asset_kind"),
+    (
+        "adagents.py",
+        "AuthorizedAgents | AuthorizedAgents1 | AuthorizedAgents2 | AuthorizedAgents3",
+        "authorization_type",
+    ),
+]
+
+
+def add_union_discriminators():
+    """Tag list-of-union fields with their Literal discriminator field."""
+    for filename, union, field in TAGGED_UNIONS:
+        path = OUTPUT_DIR / filename
+
+        if not path.exists():
+            print(f"  {filename} not found (skipping)")
+            continue
+
+        with open(path) as f:
+            content = f.read()
+
+        tagged = f"list[Annotated[{union}, Field(discriminator='{field}')]]"
+        if tagged in content:
+            print(f"  {filename} discriminator already applied")
+            continue
+
+        if f"list[{union}]" not in content:
+            print(f"  {filename} union not found (skipping)")
+            continue
+
+        content = content.replace(f"list[{union}]", tagged)
+
+        with open(path, "w") as f:
+            f.write(content)
+
+        print(f"  {filename} discriminator added on '{field}'")
+
+
 def main():
     """Apply all post-generation fixes."""
     print("Applying post-generation fixes...")
@@ -118,6 +165,7 @@ def main():
     fix_preview_render_self_reference()
     fix_brand_manifest_references()
     fix_enum_defaults()
+    add_union_discriminators()
 
     print("\n✓ Post-generation fixes complete\n")
 
@@ -7,19 +7,9 @@ Official Python client for the Ad Context Protocol (AdCP).
 Supports both A2A and MCP protocols with full type safety.
 """
 
-from adcp.adagents import (
-    AuthorizationContext,
-    domain_matches,
-    fetch_adagents,
-    fetch_agent_authorizations,
-    get_all_properties,
-    get_all_tags,
-    get_properties_by_agent,
-    identifiers_match,
-    verify_agent_authorization,
-    verify_agent_for_property,
-)
-from adcp.client import ADCPClient, ADCPMultiAgentClient
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from adcp.exceptions import (
     AdagentsNotFoundError,
     AdagentsTimeoutError,
@@ -33,155 +23,348 @@ from adcp.exceptions import (
     ADCPWebhookError,
     ADCPWebhookSignatureError,
 )
+from adcp.types.core import AgentConfig, Protocol, TaskResult, TaskStatus, WebhookMetadata
 
-# Test helpers
-from adcp.testing import (
-    CREATIVE_AGENT_CONFIG,
-    TEST_AGENT_A2A_CONFIG,
-    TEST_AGENT_A2A_NO_AUTH_CONFIG,
-    TEST_AGENT_MCP_CONFIG,
-    TEST_AGENT_MCP_NO_AUTH_CONFIG,
-    TEST_AGENT_TOKEN,
-    create_test_agent,
-    creative_agent,
-    test_agent,
-    test_agent_a2a,
-    test_agent_a2a_no_auth,
-    test_agent_client,
-    test_agent_no_auth,
-)
+if TYPE_CHECKING:
+    from adcp.adagents import (
+        AuthorizationContext,
+        domain_matches,
+        fetch_adagents,
+        fetch_agent_authorizations,
+        get_all_properties,
+        get_all_tags,
+        get_properties_by_agent,
+        identifiers_match,
+        verify_agent_authorization,
+        verify_agent_for_property,
+        verify_agents_authorization,
+    )
+    from adcp.client import ADCPClient, ADCPMultiAgentClient
 
-# Re-export commonly-used request/response types for convenience
-# Users should import from main package (e.g., `from adcp import GetProductsRequest`)
-# rather than internal modules for better API stability
-# Re-export core domain types and pricing options
-# These are commonly used in typical workflows
-from adcp.types import (
-    # Audience & Targeting
-    ActivateSignalRequest,
-    ActivateSignalResponse,
-    # Type enums from PR #222
-    AssetContentType,
-    # Core domain types
-    BrandManifest,
-    # Creative Operations
-    BuildCreativeRequest,
-    BuildCreativeResponse,
-    # Pricing options (all 9 types for product creation)
-    CpcPricingOption,
-    CpcvPricingOption,
-    CpmAuctionPricingOption,
-    CpmFixedRatePricingOption,
-    CppPricingOption,
-    CpvPricingOption,
-    # Media Buy Operations
-    CreateMediaBuyRequest,
-    CreateMediaBuyResponse,
-    Creative,
-    CreativeFilters,
-    CreativeManifest,
-    # Status enums (for control flow)
-    CreativeStatus,
-    # Common data types
-    Error,
-    FlatRatePricingOption,
-    Format,
-    FormatCategory,
-    FormatId,
-    GeneratedTaskStatus,
-    GetMediaBuyDeliveryRequest,
-    GetMediaBuyDeliveryResponse,
-    GetProductsRequest,
-    GetProductsResponse,
-    GetSignalsRequest,
-    GetSignalsResponse,
-    ListAuthorizedPropertiesRequest,
-    ListAuthorizedPropertiesResponse,
-    ListCreativeFormatsRequest,
-    ListCreativeFormatsResponse,
-    ListCreativesRequest,
-    ListCreativesResponse,
-    MediaBuy,
-    MediaBuyStatus,
-    Package,
-    PackageRequest,
-    PackageStatus,
-    PreviewCreativeRequest,
-    PreviewCreativeResponse,
-    PriceGuidance,
-    PricingModel,
-    Product,
-    ProductFilters,
-    Property,
-    ProvidePerformanceFeedbackRequest,
-    ProvidePerformanceFeedbackResponse,
-    PushNotificationConfig,
-    SignalFilters,
-    SyncCreativesRequest,
-    SyncCreativesResponse,
-    UpdateMediaBuyRequest,
-    UpdateMediaBuyResponse,
-    VcpmAuctionPricingOption,
-    VcpmFixedRatePricingOption,
-    aliases,
-)
+    # Test helpers
+    from adcp.testing import (
+        CREATIVE_AGENT_CONFIG,
+        TEST_AGENT_A2A_CONFIG,
+        TEST_AGENT_A2A_NO_AUTH_CONFIG,
+        TEST_AGENT_MCP_CONFIG,
+        TEST_AGENT_MCP_NO_AUTH_CONFIG,
+        TEST_AGENT_TOKEN,
+        create_test_agent,
+        creative_agent,
+        test_agent,
+        test_agent_a2a,
+        test_agent_a2a_no_auth,
+        test_agent_client,
+        test_agent_no_auth,
+    )
 
-# Import generated types modules - for internal use
-# Note: Users should import specific types, not the whole module
-from adcp.types import _generated as generated
+    # Re-export commonly-used request/response types for convenience
+    # Users should import from main package (e.g., `from adcp import GetProductsRequest`)
+    # rather than internal modules for better API stability
+    # Re-export core domain types and pricing options
+    # These are commonly used in typical workflows
+    from adcp.types import (
+        # Audience & Targeting
+        ActivateSignalRequest,
+        ActivateSignalResponse,
+        # Type enums from PR #222
+        AssetContentType,
+        # Core domain types
+        BrandManifest,
+        # Creative Operations
+        BuildCreativeRequest,
+        BuildCreativeResponse,
+        # Pricing options (all 9 types for product creation)
+        CpcPricingOption,
+        CpcvPricingOption,
+        CpmAuctionPricingOption,
+        CpmFixedRatePricingOption,
+        CppPricingOption,
+        CpvPricingOption,
+        # Media Buy Operations
+        CreateMediaBuyRequest,
+        CreateMediaBuyResponse,
+        Creative,
+        CreativeFilters,
+        CreativeManifest,
+        # Status enums (for control flow)
+        CreativeStatus,
+        # Common data types
+        Error,
+        FlatRatePricingOption,
+        Format,
+        FormatCategory,
+        FormatId,
+        GeneratedTaskStatus,
+        GetMediaBuyDeliveryRequest,
+        GetMediaBuyDeliveryResponse,
+        GetProductsRequest,
+        GetProductsResponse,
+        GetSignalsRequest,
+        GetSignalsResponse,
+        ListAuthorizedPropertiesRequest,
+        ListAuthorizedPropertiesResponse,
+        ListCreativeFormatsRequest,
+        ListCreativeFormatsResponse,
+        ListCreativesRequest,
+        ListCreativesResponse,
+        MediaBuy,
+        MediaBuyStatus,
+        Package,
+        PackageRequest,
+        PackageStatus,
+        PreviewCreativeRequest,
+        PreviewCreativeResponse,
+        PriceGuidance,
+        PricingModel,
+        Product,
+        ProductFilters,
+        Property,
+        ProvidePerformanceFeedbackRequest,
+        ProvidePerformanceFeedbackResponse,
+        PushNotificationConfig,
+        SignalFilters,
+        SyncCreativesRequest,
+        SyncCreativesResponse,
+        UpdateMediaBuyRequest,
+        UpdateMediaBuyResponse,
+        VcpmAuctionPricingOption,
+        VcpmFixedRatePricingOption,
+        aliases,
+    )
 
-# Re-export semantic type aliases for better ergonomics
-from adcp.types.aliases import (
-    ActivateSignalErrorResponse,
-    ActivateSignalSuccessResponse,
-    AgentDeployment,
-    AgentDestination,
-    BothPreviewRender,
-    BuildCreativeErrorResponse,
-    BuildCreativeSuccessResponse,
-    CreateMediaBuyErrorResponse,
-    CreateMediaBuySuccessResponse,
-    HtmlPreviewRender,
-    InlineDaastAsset,
-    InlineVastAsset,
-    MediaSubAsset,
-    PlatformDeployment,
-    PlatformDestination,
-    PreviewCreativeFormatRequest,
-    PreviewCreativeInteractiveResponse,
-    PreviewCreativeManifestRequest,
-    PreviewCreativeStaticResponse,
-    PropertyId,
-    PropertyIdActivationKey,
-    PropertyTag,
-    PropertyTagActivationKey,
-    ProvidePerformanceFeedbackErrorResponse,
-    ProvidePerformanceFeedbackSuccessResponse,
-    PublisherPropertiesAll,
-    PublisherPropertiesById,
-    PublisherPropertiesByTag,
-    SyncCreativesErrorResponse,
-    SyncCreativesSuccessResponse,
-    TextSubAsset,
-    UpdateMediaBuyErrorResponse,
-    UpdateMediaBuyPackagesRequest,
-    UpdateMediaBuyPropertiesRequest,
-    UpdateMediaBuySuccessResponse,
-    UrlDaastAsset,
-    UrlPreviewRender,
-    UrlVastAsset,
-)
-from adcp.types.core import AgentConfig, Protocol, TaskResult, TaskStatus, WebhookMetadata
-from adcp.validation import (
-    ValidationError,
-    validate_adagents,
-    validate_agent_authorization,
-    validate_product,
-    validate_publisher_properties_item,
-)
+    # Import generated types modules - for internal use
+    # Note: Users should import specific types, not the whole module
+    from adcp.types import _generated as generated
+
+    # Re-export semantic type aliases for better ergonomics
+    from adcp.types.aliases import (
+        ActivateSignalErrorResponse,
+        ActivateSignalSuccessResponse,
+        AgentDeployment,
+        AgentDestination,
+        BothPreviewRender,
+        BuildCreativeErrorResponse,
+        BuildCreativeSuccessResponse,
+        CreateMediaBuyErrorResponse,
+        CreateMediaBuySuccessResponse,
+        HtmlPreviewRender,
+        InlineDaastAsset,
+        InlineVastAsset,
+        MediaSubAsset,
+        PlatformDeployment,
+        PlatformDestination,
+        PreviewCreativeFormatRequest,
+        PreviewCreativeInteractiveResponse,
+        PreviewCreativeManifestRequest,
+        PreviewCreativeStaticResponse,
+        PropertyId,
+        PropertyIdActivationKey,
+        PropertyTag,
+        PropertyTagActivationKey,
+        ProvidePerformanceFeedbackErrorResponse,
+        ProvidePerformanceFeedbackSuccessResponse,
+        PublisherPropertiesAll,
+        PublisherPropertiesById,
+        PublisherPropertiesByTag,
+        SyncCreativesErrorResponse,
+        SyncCreativesSuccessResponse,
+        TextSubAsset,
+        UpdateMediaBuyErrorResponse,
+        UpdateMediaBuyPackagesRequest,
+        UpdateMediaBuyPropertiesRequest,
+        UpdateMediaBuySuccessResponse,
+        UrlDaastAsset,
+        UrlPreviewRender,
+        UrlVastAsset,
+    )
+    from adcp.validation import (
+        ValidationError,
+        validate_adagents,
+        validate_agent_authorization,
+        validate_product,
+        validate_publisher_properties_item,
+    )
 
 __version__ = "2.11.1"
 
+# Everything except exceptions and core types is resolved on first attribute
+# access (PEP 562), so `import adcp` does not load the client, the protocol
+# adapters or the generated models until they are used.
+_LAZY_EXPORTS: dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "AuthorizationContext",
+            "domain_matches",
+            "fetch_adagents",
+            "fetch_agent_authorizations",
+            "get_all_properties",
+            "get_all_tags",
+            "get_properties_by_agent",
+            "identifiers_match",
+            "verify_agent_authorization",
+            "verify_agent_for_property",
+            "verify_agents_authorization",
+        ),
+        "adcp.adagents",
+    ),
+    **dict.fromkeys(
+        (
+            "ADCPClient",
+            "ADCPMultiAgentClient",
+        ),
+        "adcp.client",
+    ),
+    **dict.fromkeys(
+        (
+            "CREATIVE_AGENT_CONFIG",
+            "TEST_AGENT_A2A_CONFIG",
+            "TEST_AGENT_A2A_NO_AUTH_CONFIG",
+            "TEST_AGENT_MCP_CONFIG",
+            "TEST_AGENT_MCP_NO_AUTH_CONFIG",
+            "TEST_AGENT_TOKEN",
+            "create_test_agent",
+            "creative_agent",
+            "test_agent",
+            "test_agent_a2a",
+            "test_agent_a2a_no_auth",
+            "test_agent_client",
+            "test_agent_no_auth",
+        ),
+        "adcp.testing",
+    ),
+    **dict.fromkeys(
+        (
+            "ActivateSignalRequest",
+            "ActivateSignalResponse",
+            "AssetContentType",
+            "BrandManifest",
+            "BuildCreativeRequest",
+            "BuildCreativeResponse",
+            "CpcPricingOption",
+            "CpcvPricingOption",
+            "CpmAuctionPricingOption",
+            "CpmFixedRatePricingOption",
+            "CppPricingOption",
+            "CpvPricingOption",
+            "CreateMediaBuyRequest",
+            "CreateMediaBuyResponse",
+            "Creative",
+            "CreativeFilters",
+            "CreativeManifest",
+            "CreativeStatus",
+            "Error",
+            "FlatRatePricingOption",
+            "Format",
+            "FormatCategory",
+            "FormatId",
+            "GeneratedTaskStatus",
+            "GetMediaBuyDeliveryRequest",
+            "GetMediaBuyDeliveryResponse",
+            "GetProductsRequest",
+            "GetProductsResponse",
+            "GetSignalsRequest",
+            "GetSignalsResponse",
+            "ListAuthorizedPropertiesRequest",
+            "ListAuthorizedPropertiesResponse",
+            "ListCreativeFormatsRequest",
+            "ListCreativeFormatsResponse",
+            "ListCreativesRequest",
+            "ListCreativesResponse",
+            "MediaBuy",
+            "MediaBuyStatus",
+            "Package",
+            "PackageRequest",
+            "PackageStatus",
+            "PreviewCreativeRequest",
+            "PreviewCreativeResponse",
+            "PriceGuidance",
+            "PricingModel",
+            "Product",
+            "ProductFilters",
+            "Property",
+            "ProvidePerformanceFeedbackRequest",
+            "ProvidePerformanceFeedbackResponse",
+            "PushNotificationConfig",
+            "SignalFilters",
+            "SyncCreativesRequest",
+            "SyncCreativesResponse",
+            "UpdateMediaBuyRequest",
+            "UpdateMediaBuyResponse",
+            "VcpmAuctionPricingOption",
+            "VcpmFixedRatePricingOption",
+        ),
+        "adcp.types",
+    ),
+    **dict.fromkeys(
+        (
+            "ActivateSignalErrorResponse",
+            "ActivateSignalSuccessResponse",
+            "AgentDeployment",
+            "AgentDestination",
+            "BothPreviewRender",
+            "BuildCreativeErrorResponse",
+            "BuildCreativeSuccessResponse",
+            "CreateMediaBuyErrorResponse",
+            "CreateMediaBuySuccessResponse",
+            "HtmlPreviewRender",
+            "InlineDaastAsset",
+            "InlineVastAsset",
+            "MediaSubAsset",
+            "PlatformDeployment",
+            "PlatformDestination",
+            "PreviewCreativeFormatRequest",
+            "PreviewCreativeInteractiveResponse",
+            "PreviewCreativeManifestRequest",
+            "PreviewCreativeStaticResponse",
+            "PropertyId",
+            "PropertyIdActivationKey",
+            "PropertyTag",
+            "PropertyTagActivationKey",
+            "ProvidePerformanceFeedbackErrorResponse",
+            "ProvidePerformanceFeedbackSuccessResponse",
+            "PublisherPropertiesAll",
+            "PublisherPropertiesById",
+            "PublisherPropertiesByTag",
+            "SyncCreativesErrorResponse",
+            "SyncCreativesSuccessResponse",
+            "TextSubAsset",
+            "UpdateMediaBuyErrorResponse",
+            "UpdateMediaBuyPackagesRequest",
+            "UpdateMediaBuyPropertiesRequest",
+            "UpdateMediaBuySuccessResponse",
+            "UrlDaastAsset",
+            "UrlPreviewRender",
+            "UrlVastAsset",
+        ),
+        "adcp.types.aliases",
+    ),
+    **dict.fromkeys(
+        (
+            "ValidationError",
+            "validate_adagents",
+            "validate_agent_authorization",
+            "validate_product",
+            "validate_publisher_properties_item",
+        ),
+        "adcp.validation",
+    ),
+}
+_LAZY_SUBMODULES: dict[str, str] = {
+    "aliases": "adcp.types.aliases",
+    "generated": "adcp.types._generated",
+    # Package submodules, so `import adcp; adcp.client` keeps working without
+    # importing them up front
+    "adagents": "adcp.adagents",
+    "client": "adcp.client",
+    "config": "adcp.config",
+    "protocols": "adcp.protocols",
+    "simple": "adcp.simple",
+    "testing": "adcp.testing",
+    "utils": "adcp.utils",
+    "validation": "adcp.validation",
+}
+
 __all__ = [
     # Client classes
     "ADCPClient",
@@ -261,6 +444,7 @@ __all__ = [
     "fetch_agent_authorizations",
     "verify_agent_authorization",
     "verify_agent_for_property",
+    "verify_agents_authorization",
     "domain_matches",
     "identifiers_match",
     "get_all_properties",
@@ -342,3 +526,21 @@ __all__ = [
     "UrlPreviewRender",
     "UrlVastAsset",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY_SUBMODULES.get(name)
+    if submodule is not None:
+        return importlib.import_module(submodule)
+
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_EXPORTS.keys() | _LAZY_SUBMODULES.keys())
@@ -71,7 +71,7 @@ async def execute_tool(
 
     # Convert string protocol to enum
     if isinstance(agent_config["protocol"], str):
-        agent_config["protocol"] = Protocol(agent_config["protocol"].lower())
+        agent_config["protocol"] = Protocol.coerce(agent_config["protocol"].lower())
 
     config = AgentConfig(**agent_config)
 
@@ -162,7 +162,7 @@ async def _dispatch_tool(client: ADCPClient, tool_name: str, payload: dict[str,
     method_name, request_type = TOOL_DISPATCH[tool_name]
     method = getattr(client, method_name)
 
-    # Special case: list_tools takes no parameters and returns list[str], not TaskResult
+    # Special case: list_tools takes no parameters and returns tuple[str, ...], not TaskResult
     if tool_name == "list_tools":
         try:
             tools = await method()
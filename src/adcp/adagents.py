@@ -8,10 +8,15 @@ https://{publisher_domain}/.well-known/adagents.json. This module provides utili
 for sales agents to verify they are authorized for specific properties.
 """
 
+import asyncio
+import codecs
+from collections.abc import Iterator
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
 import httpx
+from pydantic_core import from_json
 
 from adcp.exceptions import AdagentsNotFoundError, AdagentsTimeoutError, AdagentsValidationError
 from adcp.validation import ValidationError, validate_adagents
@@ -89,6 +94,7 @@ def _validate_publisher_domain(domain: str) -> str:
     return domain
 
 
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
     """Normalize URL by removing protocol and trailing slash.
 
@@ -103,6 +109,18 @@ def normalize_url(url: str) -> str:
     return normalized.rstrip("/")
 
 
+@lru_cache(maxsize=4096)
+def _domain_labels(domain: str) -> tuple[str, ...] | None:
+    """Return the normalized domain's labels, top-level first, or None if invalid.
+
+    Cached because the same publisher and pattern domains recur across checks.
+    """
+    try:
+        return tuple(reversed(_normalize_domain(domain).split(".")))
+    except AdagentsValidationError:
+        return None
+
+
 def domain_matches(property_domain: str, agent_domain_pattern: str) -> bool:
     """Check if domains match per AdCP rules.
 
@@ -119,35 +137,33 @@ def domain_matches(property_domain: str, agent_domain_pattern: str) -> bool:
     Returns:
         True if domains match per AdCP rules
     """
-    # Normalize both domains for comparison
-    try:
-        property_domain = _normalize_domain(property_domain)
-        agent_domain_pattern = _normalize_domain(agent_domain_pattern)
-    except AdagentsValidationError:
+    # Compare normalized labels from the top-level domain down
+    property_labels = _domain_labels(property_domain)
+    pattern_labels = _domain_labels(agent_domain_pattern)
+    if property_labels is None or pattern_labels is None:
         # Invalid domain format - no match
         return False
 
     # Exact match
-    if property_domain == agent_domain_pattern:
+    if property_labels == pattern_labels:
         return True
 
-    # Wildcard pattern (*.example.com)
-    if agent_domain_pattern.startswith("*."):
-        base_domain = agent_domain_pattern[2:]
-        return property_domain.endswith(f".{base_domain}")
-
-    # Bare domain matches common subdomains (www, m)
-    # If agent pattern is a bare domain (no subdomain), match www/m subdomains
-    if "." in agent_domain_pattern and not agent_domain_pattern.startswith("www."):
-        # Check if this looks like a bare domain (e.g., example.com)
-        parts = agent_domain_pattern.split(".")
-        if len(parts) == 2:  # Looks like bare domain
-            common_subdomains = ["www", "m"]
-            for subdomain in common_subdomains:
-                if property_domain == f"{subdomain}.{agent_domain_pattern}":
-                    return True
+    # Wildcard pattern (*.example.com) matches any deeper domain under the base
+    if len(pattern_labels) > 1 and pattern_labels[-1] == "*":
+        base_labels = pattern_labels[:-1]
+        return (
+            len(property_labels) > len(base_labels)
+            and property_labels[: len(base_labels)] == base_labels
+        )
 
-    return False
+    # Bare domain (e.g. example.com, but not www.com) matches common subdomains (www, m)
+    return (
+        len(pattern_labels) == 2
+        and pattern_labels[1] != "www"
+        and len(property_labels) == 3
+        and property_labels[:2] == pattern_labels
+        and property_labels[2] in ("www", "m")
+    )
 
 
 def identifiers_match(
@@ -168,26 +184,103 @@ def identifiers_match(
         - Domain identifiers use AdCP domain matching rules
         - Other identifiers (bundle_id, roku_store_id, etc.) require exact match
     """
+    # Index the agent side once: exact (type, value) pairs plus domain patterns
+    agent_exact: set[tuple[str, Any]] = set()
+    agent_domains: list[str] = []
+    for agent_id in agent_identifiers:
+        agent_type = agent_id.get("type", "")
+        agent_value = agent_id.get("value", "")
+        if agent_type == "domain":
+            agent_domains.append(agent_value)
+        else:
+            try:
+                agent_exact.add((agent_type, agent_value))
+            except TypeError:
+                # Unhashable values from malformed JSON never match
+                continue
+
     for prop_id in property_identifiers:
         prop_type = prop_id.get("type", "")
         prop_value = prop_id.get("value", "")
 
-        for agent_id in agent_identifiers:
-            agent_type = agent_id.get("type", "")
-            agent_value = agent_id.get("value", "")
+        # Domain identifiers use special matching rules
+        if prop_type == "domain":
+            for pattern in agent_domains:
+                if domain_matches(prop_value, pattern):
+                    return True
+        else:
+            # Other identifier types require exact match
+            try:
+                if (prop_type, prop_value) in agent_exact:
+                    return True
+            except TypeError:
+                continue
+
+    return False
+
+
+def _matching_agents(authorized_agents: list[Any], agent_url: str) -> Iterator[dict[str, Any]]:
+    """Yield entries of authorized_agents whose URL matches agent_url (protocol-agnostic)."""
+    normalized_agent_url = normalize_url(agent_url)
+    for agent in authorized_agents:
+        if not isinstance(agent, dict):
+            continue
+
+        agent_url_from_json = agent.get("url", "")
+        if agent_url_from_json and normalize_url(agent_url_from_json) == normalized_agent_url:
+            yield agent
 
-            # Type must match
-            if prop_type != agent_type:
+
+def _authorized_agents(adagents_data: dict[str, Any]) -> list[Any]:
+    """Return the authorized_agents array, raising if adagents_data is malformed."""
+    if not isinstance(adagents_data, dict):
+        raise AdagentsValidationError("adagents_data must be a dictionary")
+
+    authorized_agents = adagents_data.get("authorized_agents")
+    if not isinstance(authorized_agents, list):
+        raise AdagentsValidationError("adagents.json must have 'authorized_agents' array")
+    return authorized_agents
+
+
+def _agent_authorized_for(
+    agent: dict[str, Any],
+    property_type: str | None,
+    property_identifiers: list[dict[str, str]] | None,
+) -> bool:
+    """Check whether one matching authorized_agents entry covers the property."""
+    properties = agent.get("properties")
+
+    # If properties field is missing or empty, agent is authorized for all properties
+    if properties is None or (isinstance(properties, list) and len(properties) == 0):
+        return True
+
+    # If no property filters specified, we found the agent - authorized
+    if property_type is None and property_identifiers is None:
+        return True
+
+    # Check specific property authorization
+    if isinstance(properties, list):
+        for prop in properties:
+            if not isinstance(prop, dict):
                 continue
 
-            # Domain identifiers use special matching rules
-            if prop_type == "domain":
-                if domain_matches(prop_value, agent_value):
+            # Check property type if specified
+            if property_type is not None:
+                prop_type = prop.get("property_type", "")
+                if prop_type != property_type:
+                    continue
+
+            # Check identifiers if specified
+            if property_identifiers is not None:
+                prop_identifiers = prop.get("identifiers", [])
+                if not isinstance(prop_identifiers, list):
+                    continue
+
+                if identifiers_match(property_identifiers, prop_identifiers):
                     return True
             else:
-                # Other identifier types require exact match
-                if prop_value == agent_value:
-                    return True
+                # Property type matched and no identifier check needed
+                return True
 
     return False
 
@@ -218,66 +311,49 @@ def verify_agent_authorization(
         - Implements AdCP domain matching rules
         - Agent URLs are matched ignoring protocol and trailing slash
     """
-    # Validate structure
-    if not isinstance(adagents_data, dict):
-        raise AdagentsValidationError("adagents_data must be a dictionary")
+    authorized_agents = _authorized_agents(adagents_data)
 
-    authorized_agents = adagents_data.get("authorized_agents")
-    if not isinstance(authorized_agents, list):
-        raise AdagentsValidationError("adagents.json must have 'authorized_agents' array")
-
-    # Normalize the agent URL for comparison
-    normalized_agent_url = normalize_url(agent_url)
-
-    # Check each authorized agent
-    for agent in authorized_agents:
-        if not isinstance(agent, dict):
-            continue
+    # Check each authorized agent entry for this agent URL
+    return any(
+        _agent_authorized_for(agent, property_type, property_identifiers)
+        for agent in _matching_agents(authorized_agents, agent_url)
+    )
 
-        agent_url_from_json = agent.get("url", "")
-        if not agent_url_from_json:
-            continue
 
-        # Match agent URL (protocol-agnostic)
-        if normalize_url(agent_url_from_json) != normalized_agent_url:
-            continue
-
-        # Found matching agent - now check properties
-        properties = agent.get("properties")
+def verify_agents_authorization(
+    adagents_data: dict[str, Any],
+    queries: list[tuple[str, str | None, list[dict[str, str]] | None]],
+) -> list[bool]:
+    """Check many (agent_url, property_type, property_identifiers) queries at once.
 
-        # If properties field is missing or empty, agent is authorized for all properties
-        if properties is None or (isinstance(properties, list) and len(properties) == 0):
-            return True
+    Equivalent to calling verify_agent_authorization for each query, but
+    validates adagents_data and indexes its agents by normalized URL only once.
 
-        # If no property filters specified, we found the agent - authorized
-        if property_type is None and property_identifiers is None:
-            return True
+    Args:
+        adagents_data: Parsed adagents.json data
+        queries: (agent_url, property_type, property_identifiers) tuples
 
-        # Check specific property authorization
-        if isinstance(properties, list):
-            for prop in properties:
-                if not isinstance(prop, dict):
-                    continue
+    Returns:
+        One authorization result per query, in order
 
-                # Check property type if specified
-                if property_type is not None:
-                    prop_type = prop.get("property_type", "")
-                    if prop_type != property_type:
-                        continue
-
-                # Check identifiers if specified
-                if property_identifiers is not None:
-                    prop_identifiers = prop.get("identifiers", [])
-                    if not isinstance(prop_identifiers, list):
-                        continue
-
-                    if identifiers_match(property_identifiers, prop_identifiers):
-                        return True
-                else:
-                    # Property type matched and no identifier check needed
-                    return True
+    Raises:
+        AdagentsValidationError: If adagents_data is malformed
+    """
+    agents_by_url: dict[str, list[dict[str, Any]]] = {}
+    for agent in _authorized_agents(adagents_data):
+        if not isinstance(agent, dict):
+            continue
+        agent_url_from_json = agent.get("url", "")
+        if agent_url_from_json:
+            agents_by_url.setdefault(normalize_url(agent_url_from_json), []).append(agent)
 
-    return False
+    return [
+        any(
+            _agent_authorized_for(agent, property_type, property_identifiers)
+            for agent in agents_by_url.get(normalize_url(agent_url), ())
+        )
+        for agent_url, property_type, property_identifiers in queries
+    ]
 
 
 async def fetch_adagents(
@@ -343,11 +419,16 @@ async def fetch_adagents(
                 f"Failed to fetch adagents.json: HTTP {response.status_code}"
             )
 
-        # Parse JSON
+        # Parse JSON with pydantic-core's parser, which is faster than the stdlib
+        # decoder behind response.json() but reads UTF-8 only (a BOM is stripped).
+        # Bodies it rejects go through response.json(), which also detects UTF-16/32.
         try:
-            data = response.json()
-        except Exception as e:
-            raise AdagentsValidationError(f"Invalid JSON in adagents.json: {e}") from e
+            data = from_json(response.content.removeprefix(codecs.BOM_UTF8))
+        except Exception:
+            try:
+                data = response.json()
+            except Exception as e:
+                raise AdagentsValidationError(f"Invalid JSON in adagents.json: {e}") from e
 
         # Validate basic structure
         if not isinstance(data, dict):
@@ -420,12 +501,7 @@ def get_all_properties(adagents_data: dict[str, Any]) -> list[dict[str, Any]]:
     Raises:
         AdagentsValidationError: If adagents_data is malformed
     """
-    if not isinstance(adagents_data, dict):
-        raise AdagentsValidationError("adagents_data must be a dictionary")
-
-    authorized_agents = adagents_data.get("authorized_agents")
-    if not isinstance(authorized_agents, list):
-        raise AdagentsValidationError("adagents.json must have 'authorized_agents' array")
+    authorized_agents = _authorized_agents(adagents_data)
 
     properties = []
     for agent in authorized_agents:
@@ -462,15 +538,24 @@ def get_all_tags(adagents_data: dict[str, Any]) -> set[str]:
     Raises:
         AdagentsValidationError: If adagents_data is malformed
     """
-    properties = get_all_properties(adagents_data)
-    tags = set()
+    authorized_agents = _authorized_agents(adagents_data)
 
-    for prop in properties:
-        prop_tags = prop.get("tags", [])
-        if isinstance(prop_tags, list):
-            for tag in prop_tags:
-                if isinstance(tag, str):
-                    tags.add(tag)
+    # Same properties as get_all_properties, read in place instead of copied
+    tags: set[str] = set()
+    for agent in authorized_agents:
+        if not isinstance(agent, dict) or not agent.get("url"):
+            continue
+
+        agent_properties = agent.get("properties", [])
+        if not isinstance(agent_properties, list):
+            continue
+
+        for prop in agent_properties:
+            prop_tags = prop.get("tags") if isinstance(prop, dict) else None
+            if isinstance(prop_tags, list):
+                for tag in prop_tags:
+                    if isinstance(tag, str):
+                        tags.add(tag)
 
     return tags
 
@@ -488,36 +573,22 @@ def get_properties_by_agent(adagents_data: dict[str, Any], agent_url: str) -> li
     Raises:
         AdagentsValidationError: If adagents_data is malformed
     """
-    if not isinstance(adagents_data, dict):
-        raise AdagentsValidationError("adagents_data must be a dictionary")
+    authorized_agents = _authorized_agents(adagents_data)
 
-    authorized_agents = adagents_data.get("authorized_agents")
-    if not isinstance(authorized_agents, list):
-        raise AdagentsValidationError("adagents.json must have 'authorized_agents' array")
-
-    # Normalize the agent URL for comparison
-    normalized_agent_url = normalize_url(agent_url)
-
-    for agent in authorized_agents:
-        if not isinstance(agent, dict):
-            continue
-
-        agent_url_from_json = agent.get("url", "")
-        if not agent_url_from_json:
-            continue
+    for agent in _matching_agents(authorized_agents, agent_url):
+        # Found the agent - return their properties
+        return _agent_properties(agent)
 
-        # Match agent URL (protocol-agnostic)
-        if normalize_url(agent_url_from_json) != normalized_agent_url:
-            continue
+    return []
 
-        # Found the agent - return their properties
-        properties = agent.get("properties", [])
-        if not isinstance(properties, list):
-            return []
 
-        return [p for p in properties if isinstance(p, dict)]
+def _agent_properties(agent: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the property dicts listed on one authorized_agents entry."""
+    properties = agent.get("properties", [])
+    if not isinstance(properties, list):
+        return []
 
-    return []
+    return [p for p in properties if isinstance(p, dict)]
 
 
 class AuthorizationContext:
@@ -607,10 +678,15 @@ async def fetch_agent_authorizations(
     Notes:
         - Silently skips domains where adagents.json is not found or invalid
         - Only returns domains where the agent is explicitly authorized
-        - For production use with many domains, pass a shared httpx.AsyncClient
-          to enable connection pooling
+        - Without a client, one pooled httpx.AsyncClient is shared by all fetches
+          and closed afterwards; pass your own to reuse it across calls
     """
-    import asyncio
+    if client is None:
+        # Share one pooled client across the fan-out rather than opening one per domain
+        async with httpx.AsyncClient() as shared_client:
+            return await fetch_agent_authorizations(
+                agent_url, publisher_domains, timeout=timeout, client=shared_client
+            )
 
     # Create tasks to fetch all adagents.json files in parallel
     async def fetch_authorization_for_domain(
@@ -620,15 +696,15 @@ async def fetch_agent_authorizations(
         try:
             adagents_data = await fetch_adagents(domain, timeout=timeout, client=client)
 
-            # Check if agent is authorized
-            if not verify_agent_authorization(adagents_data, agent_url):
+            # Without property filters the agent is authorized iff it is listed, and
+            # its properties come from the first matching entry - so walk the list once
+            authorized_agents = _authorized_agents(adagents_data)
+            agent = next(_matching_agents(authorized_agents, agent_url), None)
+            if agent is None:
                 return (domain, None)
 
-            # Get properties for this agent
-            properties = get_properties_by_agent(adagents_data, agent_url)
-
             # Create authorization context
-            return (domain, AuthorizationContext(properties))
+            return (domain, AuthorizationContext(_agent_properties(agent)))
 
         except (AdagentsNotFoundError, AdagentsValidationError, AdagentsTimeoutError):
             # Silently skip domains with missing or invalid adagents.json
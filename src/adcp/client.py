@@ -9,8 +9,9 @@ import logging
 import os
 from collections.abc import Callable
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import httpx
 from pydantic import BaseModel
 
 from adcp.exceptions import ADCPWebhookSignatureError
@@ -57,8 +58,20 @@ from adcp.types.core import (
 )
 from adcp.utils.operation_id import create_operation_id
 
+if TYPE_CHECKING:
+    from adcp.utils.preview_cache import PreviewURLGenerator
+
 logger = logging.getLogger(__name__)
 
+# Map generated webhook status values to core TaskStatus values
+_WEBHOOK_STATUS_MAP: dict[GeneratedTaskStatus, TaskStatus] = {
+    GeneratedTaskStatus.completed: TaskStatus.COMPLETED,
+    GeneratedTaskStatus.submitted: TaskStatus.SUBMITTED,
+    GeneratedTaskStatus.working: TaskStatus.WORKING,
+    GeneratedTaskStatus.failed: TaskStatus.FAILED,
+    GeneratedTaskStatus.input_required: TaskStatus.NEEDS_INPUT,
+}
+
 
 class ADCPClient:
     """Client for interacting with a single AdCP agent."""
@@ -69,6 +82,7 @@ class ADCPClient:
         webhook_url_template: str | None = None,
         webhook_secret: str | None = None,
         on_activity: Callable[[Activity], None] | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """
         Initialize ADCP client for a single agent.
@@ -79,6 +93,8 @@ class ADCPClient:
                 {task_type}, {operation_id}
             webhook_secret: Secret for webhook signature verification
             on_activity: Callback for activity events
+            http_client: Shared HTTP client for A2A agents, so several clients reuse
+                one connection pool. Not closed by close(); the caller owns it.
         """
         self.agent_config = agent_config
         self.webhook_url_template = webhook_url_template
@@ -88,7 +104,7 @@ class ADCPClient:
         # Initialize protocol adapter
         self.adapter: ProtocolAdapter
         if agent_config.protocol == Protocol.A2A:
-            self.adapter = A2AAdapter(agent_config)
+            self.adapter = A2AAdapter(agent_config, http_client=http_client)
         elif agent_config.protocol == Protocol.MCP:
             self.adapter = MCPAdapter(agent_config)
         else:
@@ -99,6 +115,9 @@ class ADCPClient:
 
         self.simple = SimpleAPI(self)
 
+        # Created on first preview request; keeps the preview cache for this client's lifetime
+        self._preview_generator: PreviewURLGenerator | None = None
+
     def get_webhook_url(self, task_type: str, operation_id: str) -> str:
         """Generate webhook URL for a task."""
         if not self.webhook_url_template:
@@ -110,10 +129,36 @@ class ADCPClient:
             operation_id=operation_id,
         )
 
-    def _emit_activity(self, activity: Activity) -> None:
-        """Emit activity event."""
-        if self.on_activity:
-            self.on_activity(activity)
+    def _emit_activity(
+        self,
+        activity_type: ActivityType,
+        operation_id: str,
+        task_type: str,
+        status: TaskStatus | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Emit activity event (built only when an on_activity callback is set)."""
+        if not self.on_activity:
+            return
+        self.on_activity(
+            Activity(
+                type=activity_type,
+                operation_id=operation_id,
+                agent_id=self.agent_config.id,
+                task_type=task_type,
+                status=status,
+                timestamp=datetime.now(timezone.utc),
+                metadata=metadata,
+            )
+        )
+
+    def _get_preview_generator(self) -> PreviewURLGenerator:
+        """Return the preview generator that uses this client as the creative agent."""
+        if self._preview_generator is None:
+            from adcp.utils.preview_cache import PreviewURLGenerator
+
+            self._preview_generator = PreviewURLGenerator(self)
+        return self._preview_generator
 
     async def get_products(
         self,
@@ -147,26 +192,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="get_products",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "get_products",
         )
 
         raw_result = await self.adapter.get_products(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="get_products",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "get_products",
+            status=raw_result.status,
         )
 
         result: TaskResult[GetProductsResponse] = self.adapter._parse_response(
@@ -181,9 +218,16 @@ class ADCPClient:
                 creative_agent_client,
                 use_batch=True,
                 output_format=preview_output_format,
+                generator=creative_agent_client._get_preview_generator(),
+            )
+            result = result.model_copy(
+                update={
+                    "metadata": {
+                        **(result.metadata or {}),
+                        "products_with_previews": products_with_previews,
+                    }
+                }
             )
-            result.metadata = result.metadata or {}
-            result.metadata["products_with_previews"] = products_with_previews
 
         return result
 
@@ -210,26 +254,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="list_creative_formats",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "list_creative_formats",
         )
 
         raw_result = await self.adapter.list_creative_formats(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="list_creative_formats",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "list_creative_formats",
+            status=raw_result.status,
         )
 
         result: TaskResult[ListCreativeFormatsResponse] = self.adapter._parse_response(
@@ -244,9 +280,16 @@ class ADCPClient:
                 self,
                 use_batch=True,
                 output_format=preview_output_format,
+                generator=self._get_preview_generator(),
+            )
+            result = result.model_copy(
+                update={
+                    "metadata": {
+                        **(result.metadata or {}),
+                        "formats_with_previews": formats_with_previews,
+                    }
+                }
             )
-            result.metadata = result.metadata or {}
-            result.metadata["formats_with_previews"] = formats_with_previews
 
         return result
 
@@ -267,26 +310,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="preview_creative",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "preview_creative",
         )
 
         raw_result = await self.adapter.preview_creative(params)  # type: ignore[attr-defined]
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="preview_creative",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "preview_creative",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, PreviewCreativeResponse)
@@ -308,26 +343,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="sync_creatives",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "sync_creatives",
         )
 
         raw_result = await self.adapter.sync_creatives(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="sync_creatives",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "sync_creatives",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, SyncCreativesResponse)
@@ -349,26 +376,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="list_creatives",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "list_creatives",
         )
 
         raw_result = await self.adapter.list_creatives(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="list_creatives",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "list_creatives",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, ListCreativesResponse)
@@ -390,26 +409,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="get_media_buy_delivery",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "get_media_buy_delivery",
         )
 
         raw_result = await self.adapter.get_media_buy_delivery(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="get_media_buy_delivery",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "get_media_buy_delivery",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, GetMediaBuyDeliveryResponse)
@@ -431,26 +442,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="list_authorized_properties",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "list_authorized_properties",
         )
 
         raw_result = await self.adapter.list_authorized_properties(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="list_authorized_properties",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "list_authorized_properties",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, ListAuthorizedPropertiesResponse)
@@ -472,26 +475,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="get_signals",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "get_signals",
         )
 
         raw_result = await self.adapter.get_signals(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="get_signals",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "get_signals",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, GetSignalsResponse)
@@ -513,26 +508,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="activate_signal",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "activate_signal",
         )
 
         raw_result = await self.adapter.activate_signal(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="activate_signal",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "activate_signal",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, ActivateSignalResponse)
@@ -554,26 +541,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="provide_performance_feedback",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "provide_performance_feedback",
         )
 
         raw_result = await self.adapter.provide_performance_feedback(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="provide_performance_feedback",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "provide_performance_feedback",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, ProvidePerformanceFeedbackResponse)
@@ -619,26 +598,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="create_media_buy",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "create_media_buy",
         )
 
         raw_result = await self.adapter.create_media_buy(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="create_media_buy",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "create_media_buy",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, CreateMediaBuyResponse)
@@ -683,26 +654,18 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="update_media_buy",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "update_media_buy",
         )
 
         raw_result = await self.adapter.update_media_buy(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="update_media_buy",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "update_media_buy",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, UpdateMediaBuyResponse)
@@ -748,44 +711,35 @@ class ADCPClient:
         params = request.model_dump(exclude_none=True)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_REQUEST,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="build_creative",
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_REQUEST,
+            operation_id,
+            "build_creative",
         )
 
         raw_result = await self.adapter.build_creative(params)
 
         self._emit_activity(
-            Activity(
-                type=ActivityType.PROTOCOL_RESPONSE,
-                operation_id=operation_id,
-                agent_id=self.agent_config.id,
-                task_type="build_creative",
-                status=raw_result.status,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-            )
+            ActivityType.PROTOCOL_RESPONSE,
+            operation_id,
+            "build_creative",
+            status=raw_result.status,
         )
 
         return self.adapter._parse_response(raw_result, BuildCreativeResponse)
 
-    async def list_tools(self) -> list[str]:
+    async def list_tools(self) -> tuple[str, ...]:
         """
         List available tools from the agent.
 
         Returns:
-            List of tool names
+            Tuple of tool names
         """
         return await self.adapter.list_tools()
 
     async def close(self) -> None:
         """Close the adapter and clean up resources."""
-        if hasattr(self.adapter, "close"):
-            logger.debug(f"Closing adapter for agent {self.agent_config.id}")
-            await self.adapter.close()
+        logger.debug(f"Closing adapter for agent {self.agent_config.id}")
+        await self.adapter.close()
 
     async def __aenter__(self) -> ADCPClient:
         """Async context manager entry."""
@@ -842,14 +796,16 @@ class ADCPClient:
             "provide_performance_feedback": ProvidePerformanceFeedbackResponse,
         }
 
-        # Handle completed tasks with result parsing
+        # Enum members are singletons, so an identity check is enough here
+        is_completed = webhook.status is GeneratedTaskStatus.completed
 
-        if webhook.status == GeneratedTaskStatus.completed and webhook.result is not None:
+        # Handle completed tasks with result parsing
+        if is_completed and webhook.result is not None:
             response_type = response_type_map.get(webhook.task_type.value)
             if response_type:
                 try:
                     parsed_result: Any = parse_json_or_text(webhook.result, response_type)
-                    return TaskResult[Any](
+                    return TaskResult(
                         status=TaskStatus.COMPLETED,
                         data=parsed_result,
                         success=True,
@@ -866,20 +822,12 @@ class ADCPClient:
 
         # Handle failed, input-required, or unparseable results
         # Convert webhook status to core TaskStatus enum
-        # Map generated enum values to core enum values
-        status_map = {
-            GeneratedTaskStatus.completed: TaskStatus.COMPLETED,
-            GeneratedTaskStatus.submitted: TaskStatus.SUBMITTED,
-            GeneratedTaskStatus.working: TaskStatus.WORKING,
-            GeneratedTaskStatus.failed: TaskStatus.FAILED,
-            GeneratedTaskStatus.input_required: TaskStatus.NEEDS_INPUT,
-        }
-        task_status = status_map.get(webhook.status, TaskStatus.FAILED)
+        task_status = _WEBHOOK_STATUS_MAP.get(webhook.status, TaskStatus.FAILED)
 
-        return TaskResult[Any](
+        return TaskResult(
             status=task_status,
             data=webhook.result,
-            success=webhook.status == GeneratedTaskStatus.completed,
+            success=is_completed,
             error=webhook.error if isinstance(webhook.error, str) else None,
             metadata={
                 "task_id": webhook.task_id,
@@ -933,14 +881,10 @@ class ADCPClient:
 
         # Emit activity for monitoring
         self._emit_activity(
-            Activity(
-                type=ActivityType.WEBHOOK_RECEIVED,
-                operation_id=webhook.operation_id or "unknown",
-                agent_id=self.agent_config.id,
-                task_type=webhook.task_type.value,
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                metadata={"payload": payload},
-            )
+            ActivityType.WEBHOOK_RECEIVED,
+            webhook.operation_id or "unknown",
+            webhook.task_type.value,
+            metadata={"payload": payload},
         )
 
         # Parse and return typed result
@@ -957,6 +901,7 @@ class ADCPMultiAgentClient:
         webhook_secret: str | None = None,
         on_activity: Callable[[Activity], None] | None = None,
         handlers: dict[str, Callable[..., Any]] | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """
         Initialize multi-agent client.
@@ -967,6 +912,7 @@ class ADCPMultiAgentClient:
             webhook_secret: Secret for webhook verification
             on_activity: Callback for activity events
             handlers: Task completion handlers
+            http_client: Shared HTTP client for all A2A agents (owned by the caller)
         """
         self.agents = {
             agent.id: ADCPClient(
@@ -974,6 +920,7 @@ class ADCPMultiAgentClient:
                 webhook_url_template=webhook_url_template,
                 webhook_secret=webhook_secret,
                 on_activity=on_activity,
+                http_client=http_client,
             )
             for agent in agents
         }
@@ -27,10 +27,18 @@ logger = logging.getLogger(__name__)
 class A2AAdapter(ProtocolAdapter):
     """Adapter for A2A protocol following the Agent2Agent specification."""
 
-    def __init__(self, agent_config: AgentConfig):
-        """Initialize A2A adapter with reusable HTTP client."""
+    def __init__(self, agent_config: AgentConfig, http_client: httpx.AsyncClient | None = None):
+        """
+        Initialize A2A adapter with reusable HTTP client.
+
+        Args:
+            agent_config: Agent configuration
+            http_client: Optional shared HTTP client. Its connection pool is reused
+                across adapters, and the caller remains responsible for closing it.
+        """
         super().__init__(agent_config)
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = http_client
+        self._owns_client = http_client is None
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client with connection pooling."""
@@ -49,7 +57,7 @@ class A2AAdapter(ProtocolAdapter):
 
     async def close(self) -> None:
         """Close the HTTP client and clean up resources."""
-        if self._client is not None:
+        if self._client is not None and self._owns_client:
             logger.debug(f"Closing A2A adapter client for agent {self.agent_config.id}")
             await self._client.aclose()
             self._client = None
@@ -135,23 +143,19 @@ class A2AAdapter(ProtocolAdapter):
                 # Extract the result from the response message
                 result_data = self._extract_result(data)
 
-                return TaskResult[Any](
-                    status=TaskStatus.COMPLETED,
-                    data=result_data,
-                    success=True,
+                return TaskResult.completed(
+                    result_data,
                     metadata={"task_id": data.get("task", {}).get("id")},
                     debug_info=debug_info,
                 )
             elif task_status == "failed":
-                return TaskResult[Any](
-                    status=TaskStatus.FAILED,
-                    error=data.get("message", {}).get("parts", [{}])[0].get("text", "Task failed"),
-                    success=False,
+                return TaskResult.failed(
+                    data.get("message", {}).get("parts", [{}])[0].get("text", "Task failed"),
                     debug_info=debug_info,
                 )
             else:
                 # Handle other states (submitted, input-required)
-                return TaskResult[Any](
+                return TaskResult(
                     status=TaskStatus.SUBMITTED,
                     data=data,
                     success=True,
@@ -167,12 +171,7 @@ class A2AAdapter(ProtocolAdapter):
                     response={"error": str(e)},
                     duration_ms=duration_ms,
                 )
-            return TaskResult[Any](
-                status=TaskStatus.FAILED,
-                error=str(e),
-                success=False,
-                debug_info=debug_info,
-            )
+            return TaskResult.failed(str(e), debug_info=debug_info)
 
     def _format_tool_request(self, tool_name: str, params: dict[str, Any]) -> str:
         """Format tool request as natural language for A2A."""
@@ -260,7 +259,7 @@ class A2AAdapter(ProtocolAdapter):
         """Build creative."""
         return await self._call_a2a_tool("build_creative", params)
 
-    async def list_tools(self) -> list[str]:
+    async def list_tools(self) -> tuple[str, ...]:
         """
         List available tools from A2A agent.
 
@@ -293,7 +292,7 @@ class A2AAdapter(ProtocolAdapter):
 
             # Extract skills from agent card
             skills = data.get("skills", [])
-            tool_names = [skill.get("name", "") for skill in skills if skill.get("name")]
+            tool_names = tuple(skill["name"] for skill in skills if skill.get("name"))
 
             logger.info(f"Found {len(tool_names)} tools from A2A agent {self.agent_config.id}")
             return tool_names
@@ -7,7 +7,7 @@ from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
-from adcp.types.core import AgentConfig, TaskResult, TaskStatus
+from adcp.types.core import AgentConfig, TaskResult
 from adcp.utils.response_parser import parse_json_or_text, parse_mcp_content
 
 T = TypeVar("T", bound=BaseModel)
@@ -48,15 +48,13 @@ class ProtocolAdapter(ABC):
         """
         # Handle failed results or missing data
         if not raw_result.success or raw_result.data is None:
-            # Explicitly construct typed result to satisfy type checker
-            return TaskResult[T](
-                status=raw_result.status,
-                data=None,
-                message=raw_result.message,
-                success=False,
-                error=raw_result.error or "No data returned from adapter",
-                metadata=raw_result.metadata,
-                debug_info=raw_result.debug_info,
+            # raw_result is already validated, so copy it rather than re-validating
+            return raw_result.model_copy(
+                update={
+                    "data": None,
+                    "success": False,
+                    "error": raw_result.error or "No data returned from adapter",
+                }
             )
 
         try:
@@ -67,22 +65,13 @@ class ProtocolAdapter(ABC):
                 # Handle A2A or direct responses
                 parsed_data = parse_json_or_text(raw_result.data, response_type)
 
-            return TaskResult[T](
-                status=raw_result.status,
-                data=parsed_data,
-                message=raw_result.message,  # Preserve human-readable message from protocol
-                success=raw_result.success,
-                error=raw_result.error,
-                metadata=raw_result.metadata,
-                debug_info=raw_result.debug_info,
-            )
+            # Preserves status, message, metadata and debug info from the protocol
+            return raw_result.model_copy(update={"data": parsed_data})
         except ValueError as e:
             # Parsing failed - return error result
-            return TaskResult[T](
-                status=TaskStatus.FAILED,
-                error=f"Failed to parse response: {e}",
+            return TaskResult.failed(
+                f"Failed to parse response: {e}",
                 message=raw_result.message,
-                success=False,
                 debug_info=raw_result.debug_info,
             )
 
@@ -152,12 +141,12 @@ class ProtocolAdapter(ABC):
         pass
 
     @abstractmethod
-    async def list_tools(self) -> list[str]:
+    async def list_tools(self) -> tuple[str, ...]:
         """
         List available tools from the agent.
 
         Returns:
-            List of tool names
+            Tuple of tool names
         """
         pass
 
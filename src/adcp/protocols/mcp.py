@@ -25,7 +25,7 @@ except ImportError:
 
 from adcp.exceptions import ADCPConnectionError, ADCPTimeoutError
 from adcp.protocols.base import ProtocolAdapter
-from adcp.types.core import DebugInfo, TaskResult, TaskStatus
+from adcp.types.core import DebugInfo, TaskResult
 
 
 class MCPAdapter(ProtocolAdapter):
@@ -39,6 +39,8 @@ class MCPAdapter(ProtocolAdapter):
             )
         self._session: Any = None
         self._exit_stack: Any = None
+        self._connect_lock = asyncio.Lock()
+        self._tools_cache: tuple[str, ...] | None = None
 
     async def _cleanup_failed_connection(self, context: str) -> None:
         """
@@ -54,6 +56,7 @@ class MCPAdapter(ProtocolAdapter):
             old_stack = self._exit_stack
             self._exit_stack = None
             self._session = None
+            self._tools_cache = None
             try:
                 await old_stack.aclose()
             except asyncio.CancelledError:
@@ -83,6 +86,14 @@ class MCPAdapter(ProtocolAdapter):
         if self._session is not None:
             return self._session  # type: ignore[no-any-return]
 
+        # Serialize first connect so concurrent callers share one session
+        async with self._connect_lock:
+            if self._session is not None:
+                return self._session
+            return await self._create_session()
+
+    async def _create_session(self) -> ClientSession:
+        """Open a new MCP session, trying each candidate URL in turn."""
         logger.debug(f"Creating MCP session for agent {self.agent_config.id}")
 
         # Parse the agent URI to determine transport type
@@ -103,13 +114,8 @@ class MCPAdapter(ProtocolAdapter):
                 else:
                     headers[self.agent_config.auth_header] = self.agent_config.auth_token
 
-            # Try the user's exact URL first
-            urls_to_try = [self.agent_config.agent_uri]
-
-            # If URL doesn't end with /mcp, also try with /mcp suffix
-            if not self.agent_config.agent_uri.rstrip("/").endswith("/mcp"):
-                base_uri = self.agent_config.agent_uri.rstrip("/")
-                urls_to_try.append(f"{base_uri}/mcp")
+            # Try the user's exact URL first, then with /mcp suffix if missing
+            urls_to_try = self.agent_config.mcp_url_candidates
 
             last_error = None
             for url in urls_to_try:
@@ -274,12 +280,7 @@ class MCPAdapter(ProtocolAdapter):
                         },
                         duration_ms=duration_ms,
                     )
-                return TaskResult[Any](
-                    status=TaskStatus.FAILED,
-                    error=error_message,
-                    success=False,
-                    debug_info=debug_info,
-                )
+                return TaskResult.failed(error_message, debug_info=debug_info)
 
             # For successful responses, structuredContent is required
             if not hasattr(result, "structuredContent") or result.structuredContent is None:
@@ -306,13 +307,7 @@ class MCPAdapter(ProtocolAdapter):
                 )
 
             # Return both the structured data and the human-readable message
-            return TaskResult[Any](
-                status=TaskStatus.COMPLETED,
-                data=data_to_return,
-                message=message_text,
-                success=True,
-                debug_info=debug_info,
-            )
+            return TaskResult.completed(data_to_return, message=message_text, debug_info=debug_info)
 
         except Exception as e:
             if self.agent_config.debug and start_time:
@@ -322,12 +317,7 @@ class MCPAdapter(ProtocolAdapter):
                     response={"error": str(e)},
                     duration_ms=duration_ms,
                 )
-            return TaskResult[Any](
-                status=TaskStatus.FAILED,
-                error=str(e),
-                success=False,
-                debug_info=debug_info,
-            )
+            return TaskResult.failed(str(e), debug_info=debug_info)
 
     # ========================================================================
     # ADCP Protocol Methods
@@ -385,12 +375,29 @@ class MCPAdapter(ProtocolAdapter):
         """Build creative."""
         return await self._call_mcp_tool("build_creative", params)
 
-    async def list_tools(self) -> list[str]:
-        """List available tools from MCP agent."""
+    async def list_tools(self) -> tuple[str, ...]:
+        """List available tools from MCP agent (cached for the session lifetime)."""
+        if self._tools_cache is not None:
+            return self._tools_cache
         session = await self._get_session()
         result = await session.list_tools()
-        return [tool.name for tool in result.tools]
+        self._tools_cache = tuple(tool.name for tool in result.tools)
+        return self._tools_cache
 
     async def close(self) -> None:
         """Close the MCP session and clean up resources."""
         await self._cleanup_failed_connection("during close")
+
+    async def __aenter__(self) -> MCPAdapter:
+        """
+        Async context manager entry.
+
+        Establishes the MCP session up front so the connection handshake happens
+        at scope entry instead of on the first tool call.
+        """
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        await self.close()
@@ -20,7 +20,9 @@ Usage:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar, get_args
+
+from pydantic import BaseModel, RootModel
 
 from adcp.exceptions import ADCPSimpleAPIError
 from adcp.types import (
@@ -55,6 +57,46 @@ from adcp.types import (
 if TYPE_CHECKING:
     from adcp.client import ADCPClient
 
+RequestT = TypeVar("RequestT", bound=BaseModel)
+
+
+def _build_request(
+    request_type: type[RequestT], kwargs: dict[str, Any], validate: bool
+) -> RequestT:
+    """Build a request model from kwargs.
+
+    With validate=False the model is assembled via model_construct(), skipping
+    pydantic validation for callers that pass already-validated values. Nested
+    values are not converted either, so model-typed fields must be given model
+    instances; raw dicts for them raise TypeError. RootModel-based requests
+    (discriminated unions) are always validated so the correct variant is
+    selected.
+    """
+    if validate or issubclass(request_type, RootModel):
+        return request_type(**kwargs)
+    for name, value in kwargs.items():
+        field = request_type.model_fields.get(name)
+        if field is not None and _is_raw_dict(value) and _expects_model(field.annotation):
+            raise TypeError(
+                f"{request_type.__name__}.{name} needs a model instance when validate=False; "
+                "pass the model or use validate=True"
+            )
+    return request_type.model_construct(**kwargs)
+
+
+def _expects_model(annotation: Any) -> bool:
+    """Whether a field annotation accepts a pydantic model, directly or nested."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_expects_model(arg) for arg in get_args(annotation))
+
+
+def _is_raw_dict(value: Any) -> bool:
+    """Whether a value is a plain dict, or a list or tuple holding one."""
+    if isinstance(value, dict):
+        return True
+    return isinstance(value, (list, tuple)) and any(isinstance(item, dict) for item in value)
+
 
 class SimpleAPI:
     """Simplified API accessor for ergonomic usage.
@@ -81,6 +123,8 @@ class SimpleAPI:
 
     async def get_products(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> GetProductsResponse:
         """Get advertising products (simplified).
@@ -94,6 +138,8 @@ class SimpleAPI:
 
         Args:
             **kwargs: Arguments for GetProductsRequest (brief, brand_manifest, etc.)
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             GetProductsResponse directly (no TaskResult wrapper)
@@ -107,7 +153,7 @@ class SimpleAPI:
             )
             print(f"Found {len(products.products)} products")
         """
-        request = GetProductsRequest(**kwargs)
+        request = _build_request(GetProductsRequest, kwargs, validate)
         result = await self._client.get_products(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -119,12 +165,16 @@ class SimpleAPI:
 
     async def list_creative_formats(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> ListCreativeFormatsResponse:
         """List supported creative formats.
 
         Args:
             **kwargs: Arguments passed to ListCreativeFormatsRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             ListCreativeFormatsResponse with formats list
@@ -136,7 +186,7 @@ class SimpleAPI:
             formats = await client.simple.list_creative_formats()
             print(f"Found {len(formats.formats)} formats")
         """
-        request = ListCreativeFormatsRequest(**kwargs)
+        request = _build_request(ListCreativeFormatsRequest, kwargs, validate)
         result = await self._client.list_creative_formats(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -148,12 +198,16 @@ class SimpleAPI:
 
     async def preview_creative(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> PreviewCreativeResponse:
         """Preview creative manifest.
 
         Args:
             **kwargs: Arguments passed to PreviewCreativeRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             PreviewCreativeResponse with preview data
@@ -167,7 +221,7 @@ class SimpleAPI:
             )
             print(f"Preview: {preview.previews[0]}")
         """
-        request = PreviewCreativeRequest(**kwargs)
+        request = _build_request(PreviewCreativeRequest, kwargs, validate)
         result = await self._client.preview_creative(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -179,12 +233,16 @@ class SimpleAPI:
 
     async def sync_creatives(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> SyncCreativesResponse:
         """Sync creatives.
 
         Args:
             **kwargs: Arguments passed to SyncCreativesRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             SyncCreativesResponse
@@ -192,7 +250,7 @@ class SimpleAPI:
         Raises:
             Exception: If the request fails
         """
-        request = SyncCreativesRequest(**kwargs)
+        request = _build_request(SyncCreativesRequest, kwargs, validate)
         result = await self._client.sync_creatives(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -204,12 +262,16 @@ class SimpleAPI:
 
     async def list_creatives(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> ListCreativesResponse:
         """List creatives.
 
         Args:
             **kwargs: Arguments passed to ListCreativesRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             ListCreativesResponse
@@ -217,7 +279,7 @@ class SimpleAPI:
         Raises:
             Exception: If the request fails
         """
-        request = ListCreativesRequest(**kwargs)
+        request = _build_request(ListCreativesRequest, kwargs, validate)
         result = await self._client.list_creatives(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -229,12 +291,16 @@ class SimpleAPI:
 
     async def get_media_buy_delivery(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> GetMediaBuyDeliveryResponse:
         """Get media buy delivery.
 
         Args:
             **kwargs: Arguments passed to GetMediaBuyDeliveryRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             GetMediaBuyDeliveryResponse
@@ -242,7 +308,7 @@ class SimpleAPI:
         Raises:
             Exception: If the request fails
         """
-        request = GetMediaBuyDeliveryRequest(**kwargs)
+        request = _build_request(GetMediaBuyDeliveryRequest, kwargs, validate)
         result = await self._client.get_media_buy_delivery(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -254,12 +320,16 @@ class SimpleAPI:
 
     async def list_authorized_properties(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> ListAuthorizedPropertiesResponse:
         """List authorized properties.
 
         Args:
             **kwargs: Arguments passed to ListAuthorizedPropertiesRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             ListAuthorizedPropertiesResponse
@@ -267,7 +337,7 @@ class SimpleAPI:
         Raises:
             Exception: If the request fails
         """
-        request = ListAuthorizedPropertiesRequest(**kwargs)
+        request = _build_request(ListAuthorizedPropertiesRequest, kwargs, validate)
         result = await self._client.list_authorized_properties(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -279,12 +349,16 @@ class SimpleAPI:
 
     async def get_signals(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> GetSignalsResponse:
         """Get signals.
 
         Args:
             **kwargs: Arguments passed to GetSignalsRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             GetSignalsResponse
@@ -292,7 +366,7 @@ class SimpleAPI:
         Raises:
             Exception: If the request fails
         """
-        request = GetSignalsRequest(**kwargs)
+        request = _build_request(GetSignalsRequest, kwargs, validate)
         result = await self._client.get_signals(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -304,12 +378,16 @@ class SimpleAPI:
 
     async def activate_signal(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> ActivateSignalResponse:
         """Activate signal.
 
         Args:
             **kwargs: Arguments passed to ActivateSignalRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             ActivateSignalResponse
@@ -317,7 +395,7 @@ class SimpleAPI:
         Raises:
             Exception: If the request fails
         """
-        request = ActivateSignalRequest(**kwargs)
+        request = _build_request(ActivateSignalRequest, kwargs, validate)
         result = await self._client.activate_signal(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -329,12 +407,16 @@ class SimpleAPI:
 
     async def provide_performance_feedback(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> ProvidePerformanceFeedbackResponse:
         """Provide performance feedback.
 
         Args:
             **kwargs: Arguments passed to ProvidePerformanceFeedbackRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             ProvidePerformanceFeedbackResponse
@@ -342,7 +424,7 @@ class SimpleAPI:
         Raises:
             Exception: If the request fails
         """
-        request = ProvidePerformanceFeedbackRequest(**kwargs)
+        request = _build_request(ProvidePerformanceFeedbackRequest, kwargs, validate)
         result = await self._client.provide_performance_feedback(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -354,12 +436,16 @@ class SimpleAPI:
 
     async def create_media_buy(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> CreateMediaBuyResponse:
         """Create media buy.
 
         Args:
             **kwargs: Arguments passed to CreateMediaBuyRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             CreateMediaBuyResponse
@@ -375,7 +461,7 @@ class SimpleAPI:
             )
             print(f"Created media buy: {media_buy.media_buy_id}")
         """
-        request = CreateMediaBuyRequest(**kwargs)
+        request = _build_request(CreateMediaBuyRequest, kwargs, validate)
         result = await self._client.create_media_buy(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -387,12 +473,16 @@ class SimpleAPI:
 
     async def update_media_buy(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> UpdateMediaBuyResponse:
         """Update media buy.
 
         Args:
             **kwargs: Arguments passed to UpdateMediaBuyRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             UpdateMediaBuyResponse
@@ -407,7 +497,7 @@ class SimpleAPI:
             )
             print(f"Updated media buy: {updated.media_buy_id}")
         """
-        request = UpdateMediaBuyRequest(**kwargs)
+        request = _build_request(UpdateMediaBuyRequest, kwargs, validate)
         result = await self._client.update_media_buy(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -419,12 +509,16 @@ class SimpleAPI:
 
     async def build_creative(
         self,
+        *,
+        validate: bool = True,
         **kwargs: Any,
     ) -> BuildCreativeResponse:
         """Build creative.
 
         Args:
             **kwargs: Arguments passed to BuildCreativeRequest
+            validate: If False, skip request validation (kwargs must already be valid,
+                with model instances for nested fields)
 
         Returns:
             BuildCreativeResponse
@@ -440,7 +534,7 @@ class SimpleAPI:
             )
             print(f"Built creative: {creative.assets[0].url}")
         """
-        request = BuildCreativeRequest(**kwargs)
+        request = _build_request(BuildCreativeRequest, kwargs, validate)
         result = await self._client.build_creative(request)
         if not result.success or not result.data:
             raise ADCPSimpleAPIError(
@@ -10,305 +10,101 @@ Examples:
 
 from __future__ import annotations
 
-# Also make submodules available for advanced use
-from adcp.types import _generated as generated  # noqa: F401
-from adcp.types import aliases  # noqa: F401
+import importlib
+from typing import Any
 
-# Import all types from generated code
-from adcp.types._generated import (
-    # Core request/response types
-    ActivateSignalRequest,
-    ActivateSignalResponse,
-    AggregatedTotals,
-    # Assets
-    Asset,
-    AssetContentType,
-    AssetSelectors,
-    AssetsRequired,
-    AssignedPackage,
-    Assignments,
-    AudioAsset,
-    Authentication,
-    AuthenticationScheme,
-    AuthorizedAgents,
-    AuthorizedSalesAgents,
-    AvailableMetric,
-    BrandManifest,
-    BuildCreativeRequest,
-    BuildCreativeResponse,
-    ByPackageItem,
-    CoBrandingRequirement,
-    Colors,
-    Contact,
-    Country,
-    # Pricing options
-    CpcPricingOption,
-    CpcvPricingOption,
-    CpmAuctionPricingOption,
-    CpmFixedRatePricingOption,
-    CppPricingOption,
-    CpvPricingOption,
-    CreateMediaBuyRequest,
-    CreateMediaBuyResponse,
-    Creative,
-    CreativeAction,
-    CreativeAgent,
-    CreativeAgentCapability,
-    CreativeAsset,
-    CreativeAssignment,
-    CreativeFilters,
-    CreativeManifest,
-    CreativePolicy,
-    # Enums and constants
-    CreativeStatus,
-    CssAsset,
-    DaastTrackingEvent,
-    DaastVersion,
-    DailyBreakdownItem,
-    DeliverTo,
-    DeliveryMeasurement,
-    DeliveryMetrics,
-    DeliveryType,
-    Details,
-    DimensionUnit,
-    Disclaimer,
-    Domain,
-    DomainBreakdown,
-    DoohMetrics,
-    Embedding,
-    Error,
-    FeedbackSource,
-    FieldModel,
-    Filters,
-    FlatRatePricingOption,
-    Fonts,
-    Format,
-    FormatCard,
-    FormatCardDetailed,
-    FormatCategory,
-    FormatId,
-    FrequencyCap,
-    FrequencyCapScope,
-    GeoCountryAnyOfItem,
-    GetMediaBuyDeliveryRequest,
-    GetMediaBuyDeliveryResponse,
-    GetProductsRequest,
-    GetProductsResponse,
-    GetSignalsRequest,
-    GetSignalsResponse,
-    HistoryItem,
-    HtmlAsset,
-    HttpMethod,
-    Identifier,
-    ImageAsset,
-    Input,
-    JavascriptAsset,
-    JavascriptModuleType,
-    LandingPageRequirement,
-    ListAuthorizedPropertiesRequest,
-    ListAuthorizedPropertiesResponse,
-    ListCreativeFormatsRequest,
-    ListCreativeFormatsResponse,
-    ListCreativesRequest,
-    ListCreativesResponse,
-    Logo,
-    MarkdownAsset,
-    MarkdownFlavor,
-    Measurement,
-    MeasurementPeriod,
-    MediaBuy,
-    MediaBuyDelivery,
-    MediaBuyStatus,
-    Metadata,
-    MetricType,
-    NotificationType,
-    Offering,
-    Pacing,
-    PackageRequest,
-    Packages,
-    PackageStatus,
-    Pagination,
-    Parameters,
-    Performance,
-    PerformanceFeedback,
-    Placement,
-    Preview,
-    PreviewCreativeRequest,
-    PreviewCreativeResponse,
-    PreviewOutputFormat,
-    PreviewRender,
-    PriceGuidance,
-    Pricing,
-    PricingModel,
-    PrimaryCountry,
-    Product,
-    ProductCard,
-    ProductCardDetailed,
-    ProductCatalog,
-    ProductFilters,
-    Progress,
-    PromotedOfferings,
-    PromotedProducts,
-    Property,
-    PropertyIdentifierTypes,
-    PropertyType,
-    ProtocolEnvelope,
-    ProtocolResponse,
-    ProvidePerformanceFeedbackRequest,
-    ProvidePerformanceFeedbackResponse,
-    PublisherDomain,
-    PublisherIdentifierTypes,
-    PushNotificationConfig,
-    QuartileData,
-    QuerySummary,
-    Render,
-    ReportingCapabilities,
-    ReportingFrequency,
-    ReportingPeriod,
-    ReportingWebhook,
-    Request,
-    RequestedMetric,
-    Response,
-    Responsive,
-    Results,
-    Security,
-    Signal,
-    SignalCatalogType,
-    SignalFilters,
-    Sort,
-    SortApplied,
-    StandardFormatIds,
-    Status,
-    StatusSummary,
-    SyncCreativesRequest,
-    SyncCreativesResponse,
-    Tags,
-    TargetingOverlay,
-    Task,
-    TasksGetRequest,
-    TasksGetResponse,
-    TasksListRequest,
-    TasksListResponse,
-    TaskType,
-    TextAsset,
-    Totals,
-    UpdateFrequency,
-    UpdateMediaBuyRequest,
-    UpdateMediaBuyResponse,
-    UrlAsset,
-    UrlAssetType,
-    ValidationMode,
-    VastTrackingEvent,
-    VastVersion,
-    VcpmAuctionPricingOption,
-    VcpmFixedRatePricingOption,
-    VenueBreakdownItem,
-    VideoAsset,
-    ViewThreshold,
-    WebhookAsset,
-    WebhookPayload,
-    WebhookResponseType,
-)
-from adcp.types._generated import (
-    TaskStatus as GeneratedTaskStatus,
-)
-from adcp.types._generated import (
-    _PackageFromPackage as Package,
-)
-
-# Import semantic aliases for discriminated unions
-from adcp.types.aliases import (
-    # Activation responses
-    ActivateSignalErrorResponse,
-    ActivateSignalSuccessResponse,
-    # Agent deployment aliases
-    AgentDeployment,
-    AgentDestination,
-    # Authorized agent variants
-    AuthorizedAgent,
-    AuthorizedAgentsByInlineProperties,
-    AuthorizedAgentsByPropertyId,
-    AuthorizedAgentsByPropertyTag,
-    AuthorizedAgentsByPublisherProperties,
-    # Preview/render aliases
-    BothPreviewRender,
-    # Build creative responses
-    BuildCreativeErrorResponse,
-    BuildCreativeSuccessResponse,
-    # Create media buy responses
-    CreateMediaBuyErrorResponse,
-    CreateMediaBuySuccessResponse,
-    # Deployment union
-    Deployment,
-    # Destination union
-    Destination,
-    # Preview renders
-    HtmlPreviewRender,
-    # Asset aliases
-    InlineDaastAsset,
-    InlineVastAsset,
-    # SubAsset aliases
-    MediaSubAsset,
-    # Platform deployment
-    PlatformDeployment,
-    PlatformDestination,
-    # Preview requests
-    PreviewCreativeFormatRequest,
-    PreviewCreativeInteractiveResponse,
-    PreviewCreativeManifestRequest,
-    PreviewCreativeStaticResponse,
-    # Publisher property selectors
-    PropertyId,
-    PropertyIdActivationKey,
-    PropertyTag,
-    PropertyTagActivationKey,
-    ProvidePerformanceFeedbackErrorResponse,
-    ProvidePerformanceFeedbackSuccessResponse,
-    # Publisher properties variants
-    PublisherPropertiesAll,
-    PublisherPropertiesById,
-    PublisherPropertiesByTag,
-    # Sync responses
-    SyncCreativesErrorResponse,
-    SyncCreativesSuccessResponse,
-    # Text subassets
-    TextSubAsset,
-    # Update media buy variants
-    UpdateMediaBuyErrorResponse,
-    UpdateMediaBuyPackagesRequest,
-    UpdateMediaBuyPropertiesRequest,
-    UpdateMediaBuySuccessResponse,
-    # URL aliases
-    UrlDaastAsset,
-    UrlPreviewRender,
-    UrlVastAsset,
-)
+# Every export is resolved on first attribute access (PEP 562) so that importing
+# adcp.types does not build pydantic schemas for models the caller never uses.
+# Public names not listed below resolve from adcp.types._generated.
+# Type checkers read the static exports from __init__.pyi instead.
+_GENERATED_MODULE = "adcp.types._generated"
 
-# Re-export core types (not in generated, but part of public API)
-# Note: We don't import TaskStatus here to avoid shadowing GeneratedTaskStatus
-# Users should import TaskStatus from adcp.types.core directly if they need the core enum
-from adcp.types.core import AgentConfig, Protocol, TaskResult, WebhookMetadata
+_LAZY_EXPORTS: dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "ActivateSignalErrorResponse",
+            "ActivateSignalSuccessResponse",
+            "AgentDeployment",
+            "AgentDestination",
+            "AuthorizedAgent",
+            "AuthorizedAgentsByInlineProperties",
+            "AuthorizedAgentsByPropertyId",
+            "AuthorizedAgentsByPropertyTag",
+            "AuthorizedAgentsByPublisherProperties",
+            "BothPreviewRender",
+            "BuildCreativeErrorResponse",
+            "BuildCreativeSuccessResponse",
+            "CreateMediaBuyErrorResponse",
+            "CreateMediaBuySuccessResponse",
+            "Deployment",
+            "Destination",
+            "HtmlPreviewRender",
+            "InlineDaastAsset",
+            "InlineVastAsset",
+            "MediaSubAsset",
+            "PlatformDeployment",
+            "PlatformDestination",
+            "PreviewCreativeFormatRequest",
+            "PreviewCreativeInteractiveResponse",
+            "PreviewCreativeManifestRequest",
+            "PreviewCreativeStaticResponse",
+            "PropertyId",
+            "PropertyIdActivationKey",
+            "PropertyTag",
+            "PropertyTagActivationKey",
+            "ProvidePerformanceFeedbackErrorResponse",
+            "ProvidePerformanceFeedbackSuccessResponse",
+            "PublisherPropertiesAll",
+            "PublisherPropertiesById",
+            "PublisherPropertiesByTag",
+            "SyncCreativesErrorResponse",
+            "SyncCreativesSuccessResponse",
+            "TextSubAsset",
+            "UpdateMediaBuyErrorResponse",
+            "UpdateMediaBuyPackagesRequest",
+            "UpdateMediaBuyPropertiesRequest",
+            "UpdateMediaBuySuccessResponse",
+            "UrlDaastAsset",
+            "UrlPreviewRender",
+            "UrlVastAsset",
+        ),
+        "adcp.types.aliases",
+    ),
+    **dict.fromkeys(
+        ("AgentConfig", "Protocol", "TaskResult", "WebhookMetadata"),
+        "adcp.types.core",
+    ),
+}
+_LAZY_SUBMODULES: dict[str, str] = {
+    "aliases": "adcp.types.aliases",
+    "generated": _GENERATED_MODULE,
+}
 
-# Backward compatibility aliases
-AssetType = AssetContentType  # Use AssetContentType instead
+# Public names that differ from their name in adcp.types._generated
+_GENERATED_RENAMES: dict[str, str] = {
+    "GeneratedTaskStatus": "TaskStatus",
+    "Package": "_PackageFromPackage",
+    # Backward compatibility aliases
+    "AssetType": "AssetContentType",  # Use AssetContentType instead
+    # Schema renames from filter ref split (v1.0.0)
+    "Action": "CreativeAction",
+    "Capability": "CreativeAgentCapability",
+    "CatalogType": "SignalCatalogType",
+    "CoBranding": "CoBrandingRequirement",
+    "FormatType": "FormatCategory",
+    "LandingPage": "LandingPageRequirement",
+    "Method": "HttpMethod",
+    "ModuleType": "JavascriptModuleType",
+    "TrackingEvent": "VastTrackingEvent",  # Split into DaastTrackingEvent and VastTrackingEvent
+    "Unit": "DimensionUnit",
+    "OutputFormat": "PreviewOutputFormat",
+    "ResponseType": "WebhookResponseType",
+    "Scheme": "AuthenticationScheme",
+    "SignalType": "SignalCatalogType",
+    "UrlType": "UrlAssetType",
+    "AvailableReportingFrequency": "ReportingFrequency",
+}
 
-# Schema renames from filter ref split (v1.0.0)
-Action = CreativeAction
-Capability = CreativeAgentCapability
-CatalogType = SignalCatalogType
-CoBranding = CoBrandingRequirement
-FormatType = FormatCategory
-LandingPage = LandingPageRequirement
-Method = HttpMethod
-ModuleType = JavascriptModuleType
-TrackingEvent = VastTrackingEvent  # Split into DaastTrackingEvent and VastTrackingEvent
-Unit = DimensionUnit
-OutputFormat = PreviewOutputFormat
-ResponseType = WebhookResponseType
-Scheme = AuthenticationScheme
-SignalType = SignalCatalogType
-UrlType = UrlAssetType
-AvailableReportingFrequency = ReportingFrequency
 
 __all__ = [
     # Request/Response types
@@ -583,3 +379,31 @@ __all__ = [
     "generated",
     "aliases",
 ]
+
+_PUBLIC_NAMES = frozenset(__all__)
+
+
+def __getattr__(name: str) -> Any:
+    submodule = _LAZY_SUBMODULES.get(name)
+    if submodule is not None:
+        return importlib.import_module(submodule)
+
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name), name)
+    elif name in _GENERATED_RENAMES:
+        value = getattr(importlib.import_module(_GENERATED_MODULE), _GENERATED_RENAMES[name])
+    elif name in _PUBLIC_NAMES:
+        try:
+            value = getattr(importlib.import_module(_GENERATED_MODULE), name)
+        except AttributeError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _PUBLIC_NAMES)
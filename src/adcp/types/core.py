@@ -2,13 +2,31 @@ from __future__ import annotations
 
 """Core type definitions."""
 
+import sys
+from datetime import datetime
 from enum import Enum
-from typing import Any, Generic, Literal, TypeVar
+from typing import Any, Generic, Literal, TypeVar, cast
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, field_validator
 
+E = TypeVar("E", bound="_StrEnum")
 
-class Protocol(str, Enum):
+
+class _StrEnum(str, Enum):
+    """String enum with a dict-lookup constructor for raw wire values."""
+
+    @classmethod
+    def coerce(cls: type[E], value: str | E) -> E:
+        """Return the member for value, looking it up in the value table directly."""
+        if type(value) is cls:
+            return value
+        member = cls._value2member_map_.get(value)
+        if member is None:
+            return cls(value)  # Raises the usual ValueError
+        return cast(E, member)
+
+
+class Protocol(_StrEnum):
     """Supported protocols."""
 
     A2A = "a2a"
@@ -18,6 +36,8 @@ class Protocol(str, Enum):
 class AgentConfig(BaseModel):
     """Agent configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     agent_uri: str
     protocol: Protocol
@@ -31,6 +51,18 @@ class AgentConfig(BaseModel):
     )
     debug: bool = False  # Enable debug mode to capture request/response details
 
+    @property
+    def mcp_url_candidates(self) -> tuple[str, ...]:
+        """URLs to try when connecting over MCP: the configured URI, then with /mcp appended.
+
+        Computed on access rather than cached, so copies made with
+        model_copy(update={"agent_uri": ...}) never see the original's URLs.
+        """
+        base_uri = self.agent_uri.rstrip("/")
+        if base_uri.endswith("/mcp"):
+            return (self.agent_uri,)
+        return (self.agent_uri, f"{base_uri}/mcp")
+
     @field_validator("agent_uri")
     @classmethod
     def validate_agent_uri(cls, v: str) -> str:
@@ -47,6 +79,12 @@ class AgentConfig(BaseModel):
         # Remove trailing slash for consistency
         return v.rstrip("/")
 
+    @field_validator("auth_header")
+    @classmethod
+    def validate_auth_header(cls, v: str) -> str:
+        """Intern the header name; most configs share one of a few values."""
+        return sys.intern(v)
+
     @field_validator("timeout")
     @classmethod
     def validate_timeout(cls, v: float) -> float:
@@ -72,7 +110,7 @@ class AgentConfig(BaseModel):
                 f"mcp_transport must be one of {valid_transports}, got: {v}\n"
                 "Use 'streamable_http' for modern agents (recommended)"
             )
-        return v
+        return sys.intern(v)  # Share one string across configs loaded from JSON
 
     @field_validator("auth_type")
     @classmethod
@@ -84,10 +122,10 @@ class AgentConfig(BaseModel):
                 f"auth_type must be one of {valid_types}, got: {v}\n"
                 "Use 'bearer' for OAuth2/standard Authorization header"
             )
-        return v
+        return sys.intern(v)
 
 
-class TaskStatus(str, Enum):
+class TaskStatus(_StrEnum):
     """Task execution status."""
 
     COMPLETED = "completed"
@@ -103,6 +141,8 @@ T = TypeVar("T")
 class SubmittedInfo(BaseModel):
     """Information about submitted async task."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     webhook_url: str
     operation_id: str
 
@@ -110,6 +150,8 @@ class SubmittedInfo(BaseModel):
 class NeedsInputInfo(BaseModel):
     """Information when agent needs clarification."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     message: str
     field: str | None = None
 
@@ -117,15 +159,18 @@ class NeedsInputInfo(BaseModel):
 class DebugInfo(BaseModel):
     """Debug information for troubleshooting."""
 
-    request: dict[str, Any]
-    response: dict[str, Any]
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    # Pass-through payloads: stored as given rather than re-validated key by key
+    request: SkipValidation[dict[str, Any]]
+    response: SkipValidation[dict[str, Any]]
     duration_ms: float | None = None
 
 
 class TaskResult(BaseModel, Generic[T]):
     """Result from task execution."""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
     status: TaskStatus
     data: T | None = None
@@ -134,11 +179,21 @@ class TaskResult(BaseModel, Generic[T]):
     needs_input: NeedsInputInfo | None = None
     error: str | None = None
     success: bool = Field(default=True)
-    metadata: dict[str, Any] | None = None
+    metadata: SkipValidation[dict[str, Any] | None] = None
     debug_info: DebugInfo | None = None
 
+    @classmethod
+    def completed(cls, data: T | None = None, **kwargs: Any) -> TaskResult[T]:
+        """Build a successful result carrying data."""
+        return cls(status=TaskStatus.COMPLETED, data=data, success=True, **kwargs)
+
+    @classmethod
+    def failed(cls, error: str, **kwargs: Any) -> TaskResult[T]:
+        """Build a failed result carrying an error message."""
+        return cls(status=TaskStatus.FAILED, error=error, success=False, **kwargs)
+
 
-class ActivityType(str, Enum):
+class ActivityType(_StrEnum):
     """Types of activity events."""
 
     PROTOCOL_REQUEST = "protocol_request"
@@ -158,13 +213,15 @@ class Activity(BaseModel):
     agent_id: str
     task_type: str
     status: TaskStatus | None = None
-    timestamp: str
-    metadata: dict[str, Any] | None = None
+    timestamp: datetime  # Serialized as ISO 8601 by model_dump_json
+    metadata: SkipValidation[dict[str, Any] | None] = None
 
 
 class WebhookMetadata(BaseModel):
     """Metadata passed to webhook handlers."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     operation_id: str
     agent_id: str
     task_type: str
@@ -23,7 +23,7 @@ class ActivateSignalRequest(AdCPBaseModel):
         ),
     ] = None
     deployments: Annotated[
-        list[destination.Destination1 | destination.Destination2],
+        list[Annotated[destination.Destination1 | destination.Destination2, Field(discriminator='type')]],
         Field(
             description='Target deployment(s) for activation. If the authenticated caller matches one of these deployment targets, activation keys will be included in the response.',
             min_length=1,
@@ -23,7 +23,7 @@ class ActivateSignalResponse1(AdCPBaseModel):
         ),
     ] = None
     deployments: Annotated[
-        list[deployment.Deployment1 | deployment.Deployment2],
+        list[Annotated[deployment.Deployment1 | deployment.Deployment2, Field(discriminator='type')]],
         Field(description='Array of deployment results for each deployment target'),
     ]
 
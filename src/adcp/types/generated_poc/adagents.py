@@ -184,7 +184,7 @@ class AuthorizedSalesAgents(AdCPBaseModel):
         Field(alias='$schema', description='JSON Schema identifier for this adagents.json file'),
     ] = 'https://adcontextprotocol.org/schemas/v1/adagents.json'
     authorized_agents: Annotated[
-        list[AuthorizedAgents | AuthorizedAgents1 | AuthorizedAgents2 | AuthorizedAgents3],
+        list[Annotated[AuthorizedAgents | AuthorizedAgents1 | AuthorizedAgents2 | AuthorizedAgents3, Field(discriminator='authorization_type')]],
         Field(
             description='Array of sales agents authorized to sell inventory for properties in this file',
             min_length=1,
@@ -24,7 +24,7 @@ class DeliverTo(AdCPBaseModel):
         list[Country], Field(description='Countries where signals will be used (ISO codes)')
     ]
     deployments: Annotated[
-        list[destination.Destination1 | destination.Destination2],
+        list[Annotated[destination.Destination1 | destination.Destination2, Field(discriminator='type')]],
         Field(
             description='List of deployment targets (DSPs, sales agents, etc.). If the authenticated caller matches one of these deployment targets, activation keys will be included in the response.',
             min_length=1,
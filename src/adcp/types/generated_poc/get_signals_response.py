@@ -29,7 +29,7 @@ class Signal(AdCPBaseModel):
     ]
     data_provider: Annotated[str, Field(description='Name of the data provider')]
     deployments: Annotated[
-        list[deployment.Deployment1 | deployment.Deployment2],
+        list[Annotated[deployment.Deployment1 | deployment.Deployment2, Field(discriminator='type')]],
         Field(description='Array of deployment targets'),
     ]
     description: Annotated[str, Field(description='Detailed signal description')]
@@ -177,7 +177,7 @@ class Creative(AdCPBaseModel):
         creative_status.CreativeStatus, Field(description='Current approval status of the creative')
     ]
     sub_assets: Annotated[
-        list[sub_asset.SubAsset1 | sub_asset.SubAsset2] | None,
+        list[Annotated[sub_asset.SubAsset1 | sub_asset.SubAsset2, Field(discriminator='asset_kind')]] | None,
         Field(
             description='Sub-assets for multi-asset formats (included when include_sub_assets=true)'
         ),
@@ -4,24 +4,43 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import logging
+from collections import OrderedDict
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+from adcp.types import (
+    CreativeManifest,
+    HtmlAsset,
+    ImageAsset,
+    TextAsset,
+    UrlAsset,
+    VideoAsset,
+)
+from adcp.types.aliases import PreviewCreativeFormatRequest, PreviewCreativeManifestRequest
+
 if TYPE_CHECKING:
     from adcp.client import ADCPClient
-    from adcp.types import CreativeManifest, Format, FormatId, Product
+    from adcp.types import Format, FormatId, Product
 
 logger = logging.getLogger(__name__)
 
 
-def _make_manifest_cache_key(format_id: FormatId | str, manifest_dict: dict[str, Any]) -> str:
+def _make_manifest_cache_key(
+    format_id: FormatId | str,
+    manifest: CreativeManifest | dict[str, Any],
+    output_format: str = "url",
+) -> str:
     """
-    Create a cache key for a format_id and manifest.
+    Create a cache key for a format_id, manifest and output format.
 
     Args:
         format_id: Format identifier (FormatId object or string)
-        manifest_dict: Creative manifest dict
+        manifest: Creative manifest model or dict
+        output_format: Preview output format; "url" and "html" previews are cached apart
 
     Returns:
         Cache key string
@@ -33,26 +52,70 @@ def _make_manifest_cache_key(format_id: FormatId | str, manifest_dict: dict[str,
         # FormatId is a Pydantic model with agent_url and id
         format_id_str = f"{format_id.agent_url}:{format_id.id}"
 
-    manifest_str = str(sorted(manifest_dict.items()))
-    combined = f"{format_id_str}:{manifest_str}"
-    return hashlib.sha256(combined.encode()).hexdigest()[:16]
+    if not isinstance(manifest, dict):
+        manifest = manifest.model_dump(mode="json", exclude_none=True)
+    # Canonical JSON sorts nested keys too, so equal manifests always hash alike,
+    # whether passed as a model or a dict
+    payload = json.dumps(manifest, sort_keys=True, separators=(",", ":"), default=str)
+
+    # The key is only a dedup handle, so a 64-bit blake2b digest is enough
+    digest = hashlib.blake2b(format_id_str.encode(), digest_size=8)
+    digest.update(f":{output_format}:".encode())
+    digest.update(payload.encode())
+    return digest.hexdigest()
+
+
+def _preview_expired(preview_data: dict[str, Any]) -> bool:
+    """Whether preview data is past the expires_at the creative agent returned."""
+    expires_at = preview_data.get("expires_at")
+    if not expires_at:
+        return False
+    try:
+        expiry = datetime.fromisoformat(str(expires_at).replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    if expiry.tzinfo is None:
+        expiry = expiry.replace(tzinfo=timezone.utc)
+    return expiry <= datetime.now(timezone.utc)
 
 
 class PreviewURLGenerator:
     """Helper class for generating preview URLs from creative agents."""
 
-    def __init__(self, creative_agent_client: ADCPClient):
+    def __init__(self, creative_agent_client: ADCPClient, max_cache_size: int = 1024):
         """
         Initialize preview URL generator.
 
         Args:
             creative_agent_client: ADCPClient configured to talk to a creative agent
+            max_cache_size: Maximum cached previews; least recently used are evicted first
         """
         self.creative_agent_client = creative_agent_client
-        self._preview_cache: dict[str, dict[str, Any]] = {}
+        self.max_cache_size = max_cache_size
+        self._preview_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # Lookups already on the wire, so concurrent callers share one request
+        self._inflight: dict[str, asyncio.Future[dict[str, Any] | None]] = {}
+
+    def _get_cached(self, cache_key: str) -> dict[str, Any] | None:
+        """Return cached preview data, dropping it if the preview has expired."""
+        preview_data = self._preview_cache.get(cache_key)
+        if preview_data is None:
+            return None
+        if _preview_expired(preview_data):
+            del self._preview_cache[cache_key]
+            return None
+        self._preview_cache.move_to_end(cache_key)
+        return preview_data
+
+    def _store_cached(self, cache_key: str, preview_data: dict[str, Any]) -> None:
+        """Cache preview data, evicting the least recently used entries past the limit."""
+        self._preview_cache[cache_key] = preview_data
+        self._preview_cache.move_to_end(cache_key)
+        while len(self._preview_cache) > self.max_cache_size:
+            self._preview_cache.popitem(last=False)
 
     async def get_preview_data_for_manifest(
-        self, format_id: FormatId, manifest: CreativeManifest
+        self, format_id: FormatId, manifest: CreativeManifest, output_format: str = "url"
     ) -> dict[str, Any] | None:
         """
         Generate preview data for a creative manifest.
@@ -63,22 +126,47 @@ class PreviewURLGenerator:
         Args:
             format_id: Format identifier
             manifest: Creative manifest
+            output_format: "url" for iframe URLs, "html" for direct embedding
 
         Returns:
             Preview data with preview_url and metadata, or None if generation fails
         """
-        from adcp.types.aliases import PreviewCreativeFormatRequest
+        cache_key = _make_manifest_cache_key(format_id, manifest, output_format)
 
-        cache_key = _make_manifest_cache_key(format_id, manifest.model_dump(exclude_none=True))
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
 
-        if cache_key in self._preview_cache:
-            return self._preview_cache[cache_key]
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            # Shielded so that cancelling one waiter leaves the shared future intact
+            return await asyncio.shield(inflight)
 
+        future: asyncio.Future[dict[str, Any] | None] = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        preview_data = None
+        try:
+            preview_data = await self._fetch_preview_data(
+                format_id, manifest, output_format, cache_key
+            )
+        finally:
+            del self._inflight[cache_key]
+            # If this caller is cancelled, waiters get None (as for a failed preview)
+            # rather than a cancellation they did not ask for
+            if not future.done():
+                future.set_result(preview_data)
+        return preview_data
+
+    async def _fetch_preview_data(
+        self, format_id: FormatId, manifest: CreativeManifest, output_format: str, cache_key: str
+    ) -> dict[str, Any] | None:
+        """Request preview data for one manifest and cache it on success."""
         try:
             request = PreviewCreativeFormatRequest(
                 request_type="single",
                 format_id=format_id,
                 creative_manifest=manifest,
+                output_format=output_format,  # type: ignore[arg-type]
             )
             result = await self.creative_agent_client.preview_creative(request)
 
@@ -98,7 +186,7 @@ class PreviewURLGenerator:
                         "expires_at": str(result.data.expires_at),
                     }
 
-                    self._preview_cache[cache_key] = preview_data
+                    self._store_cached(cache_key, preview_data)
                     return preview_data
 
         except Exception as e:
@@ -123,34 +211,33 @@ class PreviewURLGenerator:
         Returns:
             List of preview data dicts (or None for failures), in same order as requests
         """
-        from adcp.types import PreviewCreativeRequest
-
         if not requests:
             return []
 
         # Check cache first
         cache_keys = [
-            _make_manifest_cache_key(fid, manifest.model_dump(exclude_none=True))
-            for fid, manifest in requests
+            _make_manifest_cache_key(fid, manifest, output_format) for fid, manifest in requests
         ]
 
-        # Separate cached vs uncached requests
-        uncached_indices: list[int] = []
+        # Separate cached vs uncached requests; repeats of one manifest (e.g. products
+        # sharing a format) are sent once and the result fanned out to every index
+        uncached_indices: list[list[int]] = []
+        uncached_slots: dict[str, list[int]] = {}
         uncached_requests: list[dict[str, Any]] = []
         results: list[dict[str, Any] | None] = [None] * len(requests)
 
         for idx, (cache_key, (format_id, manifest)) in enumerate(zip(cache_keys, requests)):
-            if cache_key in self._preview_cache:
-                results[idx] = self._preview_cache[cache_key]
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                results[idx] = cached
+            elif cache_key in uncached_slots:
+                uncached_slots[cache_key].append(idx)
             else:
-                uncached_indices.append(idx)
-                fid_dict = format_id.model_dump() if hasattr(format_id, "model_dump") else format_id
-                uncached_requests.append(
-                    {
-                        "format_id": fid_dict,
-                        "creative_manifest": manifest.model_dump(exclude_none=True),
-                    }
-                )
+                uncached_slots[cache_key] = [idx]
+                uncached_indices.append(uncached_slots[cache_key])
+                # Pass the models through: the batch request accepts them without
+                # re-validation, and they are serialized once when the request is sent
+                uncached_requests.append({"format_id": format_id, "creative_manifest": manifest})
 
         # If everything was cached, return early
         if not uncached_requests:
@@ -165,7 +252,8 @@ class PreviewURLGenerator:
                 chunk_requests = uncached_requests[chunk_start:chunk_end]
                 chunk_indices = uncached_indices[chunk_start:chunk_end]
 
-                batch_request = PreviewCreativeRequest(
+                batch_request = PreviewCreativeManifestRequest(
+                    request_type="batch",
                     requests=chunk_requests,
                     output_format=output_format,  # type: ignore[arg-type]
                     context=None,
@@ -175,7 +263,10 @@ class PreviewURLGenerator:
                 if result.success and result.data and result.data.results:
                     # Process batch results
                     for result_idx, batch_result in enumerate(result.data.results):
-                        original_idx = chunk_indices[result_idx]
+                        if hasattr(batch_result, "model_dump"):
+                            batch_result = batch_result.model_dump(mode="json", exclude_none=True)
+                        original_indices = chunk_indices[result_idx]
+                        original_idx = original_indices[0]
                         cache_key = cache_keys[original_idx]
 
                         if batch_result.get("success") and batch_result.get("response"):
@@ -193,8 +284,9 @@ class PreviewURLGenerator:
                                     "expires_at": response.get("expires_at"),
                                 }
                                 # Cache and store
-                                self._preview_cache[cache_key] = preview_data
-                                results[original_idx] = preview_data
+                                self._store_cached(cache_key, preview_data)
+                                for idx in original_indices:
+                                    results[idx] = preview_data
                         else:
                             # Request failed
                             error = batch_result.get("error", {})
@@ -214,6 +306,8 @@ async def add_preview_urls_to_formats(
     creative_agent_client: ADCPClient,
     use_batch: bool = True,
     output_format: str = "url",
+    concurrency: int = 16,
+    generator: PreviewURLGenerator | None = None,
 ) -> list[dict[str, Any]]:
     """
     Add preview URLs to each format by generating sample manifests.
@@ -225,6 +319,9 @@ async def add_preview_urls_to_formats(
         creative_agent_client: Client for the creative agent
         use_batch: If True, use batch API (default). Set False to use individual requests.
         output_format: "url" for iframe URLs, "html" for direct embedding
+        concurrency: Maximum preview requests in flight when not using batch mode
+        generator: Generator whose preview cache to reuse across calls; a fresh one
+            is created for creative_agent_client when omitted
 
     Returns:
         List of format dicts with added preview_data fields
@@ -232,14 +329,14 @@ async def add_preview_urls_to_formats(
     if not formats:
         return []
 
-    generator = PreviewURLGenerator(creative_agent_client)
+    if generator is None:
+        generator = PreviewURLGenerator(creative_agent_client)
 
-    # Prepare all requests
-    format_requests = []
-    for fmt in formats:
-        sample_manifest = _create_sample_manifest_for_format(fmt)
-        if sample_manifest:
-            format_requests.append((fmt, sample_manifest))
+    # Prepare all requests; each sample manifest is built once and reused by either path
+    sample_manifests = [_create_sample_manifest_for_format(fmt) for fmt in formats]
+    format_requests = [
+        (fmt, manifest) for fmt, manifest in zip(formats, sample_manifests) if manifest
+    ]
 
     if not format_requests:
         return [fmt.model_dump(exclude_none=True) for fmt in formats]
@@ -252,33 +349,33 @@ async def add_preview_urls_to_formats(
             batch_requests, output_format=output_format
         )
 
-        # Merge preview data back with formats
+        # Merge preview data back with formats (results follow the formats that had a manifest)
         result = []
-        preview_idx = 0
-        for fmt in formats:
+        preview_data_iter = iter(preview_data_list)
+        for fmt, sample_manifest in zip(formats, sample_manifests):
             format_dict = fmt.model_dump(exclude_none=True)
-            # Check if this format had a manifest
-            if preview_idx < len(format_requests) and format_requests[preview_idx][0] == fmt:
-                preview_data = preview_data_list[preview_idx]
+            if sample_manifest:
+                preview_data = next(preview_data_iter)
                 if preview_data:
                     format_dict["preview_data"] = preview_data
-                preview_idx += 1
             result.append(format_dict)
         return result
     else:
         # Fallback to individual requests (for single format or when batch disabled)
-        import asyncio
+        semaphore = asyncio.Semaphore(concurrency)
 
-        async def process_format(fmt: Format) -> dict[str, Any]:
+        async def process_format(
+            fmt: Format, sample_manifest: CreativeManifest | None
+        ) -> dict[str, Any]:
             """Process a single format and add preview data."""
             format_dict = fmt.model_dump(exclude_none=True)
 
             try:
-                sample_manifest = _create_sample_manifest_for_format(fmt)
                 if sample_manifest:
-                    preview_data = await generator.get_preview_data_for_manifest(
-                        fmt.format_id, sample_manifest
-                    )
+                    async with semaphore:
+                        preview_data = await generator.get_preview_data_for_manifest(
+                            fmt.format_id, sample_manifest, output_format
+                        )
                     if preview_data:
                         format_dict["preview_data"] = preview_data
             except Exception as e:
@@ -286,7 +383,12 @@ async def add_preview_urls_to_formats(
 
             return format_dict
 
-        return await asyncio.gather(*[process_format(fmt) for fmt in formats])
+        return await asyncio.gather(
+            *[
+                process_format(fmt, sample_manifest)
+                for fmt, sample_manifest in zip(formats, sample_manifests)
+            ]
+        )
 
 
 async def add_preview_urls_to_products(
@@ -294,6 +396,8 @@ async def add_preview_urls_to_products(
     creative_agent_client: ADCPClient,
     use_batch: bool = True,
     output_format: str = "url",
+    concurrency: int = 16,
+    generator: PreviewURLGenerator | None = None,
 ) -> list[dict[str, Any]]:
     """
     Add preview URLs to products for their supported formats.
@@ -305,6 +409,9 @@ async def add_preview_urls_to_products(
         creative_agent_client: Client for the creative agent
         use_batch: If True, use batch API (default). Set False to use individual requests.
         output_format: "url" for iframe URLs, "html" for direct embedding
+        concurrency: Maximum preview requests in flight when not using batch mode
+        generator: Generator whose preview cache to reuse across calls; a fresh one
+            is created for creative_agent_client when omitted
 
     Returns:
         List of product dicts with added format_previews field
@@ -312,15 +419,21 @@ async def add_preview_urls_to_products(
     if not products:
         return []
 
-    generator = PreviewURLGenerator(creative_agent_client)
+    if generator is None:
+        generator = PreviewURLGenerator(creative_agent_client)
 
-    # Collect all unique format_id + manifest combinations across all products
+    # Collect all unique format_id + manifest combinations across all products; each
+    # sample manifest is built once and reused by either path
+    product_manifests: list[list[tuple[FormatId, CreativeManifest]]] = []
     all_requests: list[tuple[Product, FormatId, CreativeManifest]] = []
     for product in products:
+        manifests = []
         for format_id in product.format_ids:
             sample_manifest = _create_sample_manifest_for_format_id(format_id, product)
             if sample_manifest:
+                manifests.append((format_id, sample_manifest))
                 all_requests.append((product, format_id, sample_manifest))
+        product_manifests.append(manifests)
 
     if not all_requests:
         return [p.model_dump(exclude_none=True) for p in products]
@@ -352,21 +465,24 @@ async def add_preview_urls_to_products(
         return result
     else:
         # Fallback to individual requests (for single product/format or when batch disabled)
-        import asyncio
+        semaphore = asyncio.Semaphore(concurrency)
 
-        async def process_product(product: Product) -> dict[str, Any]:
+        async def process_product(
+            product: Product, manifests: list[tuple[FormatId, CreativeManifest]]
+        ) -> dict[str, Any]:
             """Process a single product and add preview data for all its formats."""
             product_dict = product.model_dump(exclude_none=True)
 
-            async def process_format(format_id: FormatId) -> tuple[str, dict[str, Any] | None]:
+            async def process_format(
+                format_id: FormatId, sample_manifest: CreativeManifest
+            ) -> tuple[str, dict[str, Any] | None]:
                 """Process a single format for this product."""
                 try:
-                    sample_manifest = _create_sample_manifest_for_format_id(format_id, product)
-                    if sample_manifest:
+                    async with semaphore:
                         preview_data = await generator.get_preview_data_for_manifest(
-                            format_id, sample_manifest
+                            format_id, sample_manifest, output_format
                         )
-                        return (format_id.id, preview_data)
+                    return (format_id.id, preview_data)
                 except Exception as e:
                     logger.warning(
                         f"Failed to generate preview for product {product.product_id}, "
@@ -374,7 +490,7 @@ async def add_preview_urls_to_products(
                     )
                 return (format_id.id, None)
 
-            format_tasks = [process_format(fid) for fid in product.format_ids]
+            format_tasks = [process_format(fid, manifest) for fid, manifest in manifests]
             format_results = await asyncio.gather(*format_tasks)
             format_previews = {fid: data for fid, data in format_results if data is not None}
 
@@ -383,7 +499,12 @@ async def add_preview_urls_to_products(
 
             return product_dict
 
-        return await asyncio.gather(*[process_product(product) for product in products])
+        return await asyncio.gather(
+            *[
+                process_product(product, manifests)
+                for product, manifests in zip(products, product_manifests)
+            ]
+        )
 
 
 def _create_sample_manifest_for_format(fmt: Format) -> CreativeManifest | None:
@@ -396,8 +517,6 @@ def _create_sample_manifest_for_format(fmt: Format) -> CreativeManifest | None:
     Returns:
         Sample CreativeManifest, or None if unable to create one
     """
-    from adcp.types import CreativeManifest
-
     if not fmt.assets_required:
         return None
 
@@ -436,8 +555,6 @@ def _create_sample_manifest_for_format_id(
     Returns:
         Sample CreativeManifest with placeholder assets
     """
-    from adcp.types import CreativeManifest, ImageAsset, UrlAsset
-
     assets = {
         "primary_asset": ImageAsset(url="https://example.com/sample-image.jpg"),
         "clickthrough_url": UrlAsset(url="https://example.com"),
@@ -446,6 +563,21 @@ def _create_sample_manifest_for_format_id(
     return CreativeManifest(format_id=format_id, promoted_offering=product.name, assets=assets)
 
 
+# asset_type -> (asset model, sample field values) used for preview manifests
+_SAMPLE_ASSETS: dict[str | None, tuple[type[Any], dict[str, str]]] = {
+    "image": (ImageAsset, {"url": "https://via.placeholder.com/300x250.png"}),
+    "video": (VideoAsset, {"url": "https://example.com/sample-video.mp4"}),
+    "text": (TextAsset, {"content": "Sample advertising text"}),
+    "url": (UrlAsset, {"url": "https://example.com"}),
+    "html": (HtmlAsset, {"content": "<div>Sample HTML</div>"}),
+}
+# Default to URL asset for unknown types
+_DEFAULT_SAMPLE_ASSET: tuple[type[Any], dict[str, str]] = (
+    UrlAsset,
+    {"url": "https://example.com/sample-asset"},
+)
+
+
 def _create_sample_asset(asset_type: str | None) -> Any:
     """
     Create a sample asset value based on asset type.
@@ -456,24 +588,5 @@ def _create_sample_asset(asset_type: str | None) -> Any:
     Returns:
         Sample asset object (Pydantic model)
     """
-    from adcp.types import (
-        HtmlAsset,
-        ImageAsset,
-        TextAsset,
-        UrlAsset,
-        VideoAsset,
-    )
-
-    if asset_type == "image":
-        return ImageAsset(url="https://via.placeholder.com/300x250.png")
-    elif asset_type == "video":
-        return VideoAsset(url="https://example.com/sample-video.mp4")
-    elif asset_type == "text":
-        return TextAsset(content="Sample advertising text")
-    elif asset_type == "url":
-        return UrlAsset(url="https://example.com")
-    elif asset_type == "html":
-        return HtmlAsset(content="<div>Sample HTML</div>")
-    else:
-        # Default to URL asset for unknown types
-        return UrlAsset(url="https://example.com/sample-asset")
+    asset_cls, fields = _SAMPLE_ASSETS.get(asset_type, _DEFAULT_SAMPLE_ASSET)
+    return asset_cls(**fields)
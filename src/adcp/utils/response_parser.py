@@ -4,18 +4,46 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, TypeVar, Union, cast, get_args, get_origin
+from functools import cache
+from types import UnionType
+from typing import Annotated, Any, TypeVar, Union, cast, get_args, get_origin
 
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
 
+@cache
+def _union_adapter(response_type: Any) -> tuple[TypeAdapter[Any], tuple[str, ...]] | None:
+    """
+    Return a cached validator for a Union response type, or None for plain models.
+
+    Building a TypeAdapter compiles a core schema, so each Union is compiled once
+    and reused for every response of that type.
+
+    Args:
+        response_type: Expected response type (model class or Union of model classes)
+
+    Returns:
+        (adapter, variant names) for Union types, otherwise None
+    """
+    # In Python 3.10+, X | Y creates a types.UnionType, not typing.Union
+    if get_origin(response_type) is not Union and not isinstance(response_type, UnionType):
+        return None
+
+    variants = get_args(response_type)
+    # Match variants in declaration order, like the AdCP oneOf schemas
+    adapter: TypeAdapter[Any] = TypeAdapter(
+        Annotated[response_type, Field(union_mode="left_to_right")]
+    )
+    return adapter, tuple(variant.__name__ for variant in variants)
+
+
 def _validate_union_type(data: dict[str, Any], response_type: type[T]) -> T:
     """
-    Validate data against a Union type by trying each variant.
+    Validate data against a Union type, trying each variant in order.
 
     Args:
         data: Data to validate
@@ -25,42 +53,24 @@ def _validate_union_type(data: dict[str, Any], response_type: type[T]) -> T:
         Validated model instance
 
     Raises:
-        ValidationError: If data doesn't match any Union variant
+        ValueError: If data doesn't match any Union variant
+        ValidationError: If data doesn't match a non-Union response type
     """
-    # Check if this is a Union type (handles both typing.Union and types.UnionType)
-    origin = get_origin(response_type)
-
-    # In Python 3.10+, X | Y creates a types.UnionType, not typing.Union
-    # We need to check both the origin and the type itself
-    is_union = origin is Union or str(type(response_type).__name__) == "UnionType"
-
-    if is_union:
-        # Get union args - works for both typing.Union and types.UnionType
-        args = get_args(response_type)
-        if not args:  # types.UnionType case
-            # For types.UnionType, we need to access __args__ directly
-            args = getattr(response_type, "__args__", ())
-
-        errors = []
-        for variant in args:
-            try:
-                return cast(T, variant.model_validate(data))
-            except ValidationError as e:
-                errors.append((variant.__name__, e))
-                continue
-
-        # If we get here, none of the variants worked
-        error_msgs = [f"{name}: {str(e)}" for name, e in errors]
+    union = _union_adapter(response_type)
+    if union is None:
+        # Cast is needed because response_type is typed as type[T] | Any
+        return cast(T, response_type.model_validate(data))  # type: ignore[redundant-cast]
+
+    adapter, variant_names = union
+    try:
+        return cast(T, adapter.validate_python(data))
+    except ValidationError as e:
         # Raise a ValueError instead of ValidationError for better error messages
         raise ValueError(
             f"Data doesn't match any Union variant. "
-            f"Attempted variants: {', '.join([e[0] for e in errors])}. "
-            f"Errors: {'; '.join(error_msgs)}"
-        )
-
-    # Not a Union type, use regular validation
-    # Cast is needed because response_type is typed as type[T] | Any
-    return cast(T, response_type.model_validate(data))  # type: ignore[redundant-cast]
+            f"Attempted variants: {', '.join(variant_names)}. "
+            f"Errors: {e}"
+        ) from e
 
 
 def parse_mcp_content(content: list[dict[str, Any]], response_type: type[T]) -> T:
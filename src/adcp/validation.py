@@ -27,6 +27,19 @@ class ValidationError(ValueError):
     pass
 
 
+# Authorization fields in the order they are reported in error messages
+_AUTH_FIELDS = ("properties", "property_ids", "property_tags", "publisher_properties")
+_AUTH_FIELDS_DISPLAY = ", ".join(_AUTH_FIELDS)
+
+# authorization_type discriminator -> field it requires
+_AUTHORIZATION_TYPE_FIELDS = {
+    "property_ids": "property_ids",
+    "property_tags": "property_tags",
+    "inline_properties": "properties",
+    "publisher_properties": "publisher_properties",
+}
+
+
 def validate_publisher_properties_item(item: dict[str, Any]) -> None:
     """Validate publisher_properties item discriminated union.
 
@@ -43,8 +56,15 @@ def validate_publisher_properties_item(item: dict[str, Any]) -> None:
         ValidationError: If discriminator or field constraints are violated
     """
     selection_type = item.get("selection_type")
-    has_property_ids = "property_ids" in item and item["property_ids"] is not None
-    has_property_tags = "property_tags" in item and item["property_tags"] is not None
+    has_property_ids = item.get("property_ids") is not None
+    has_property_tags = item.get("property_tags") is not None
+
+    # Well-formed items (the common case) carry exactly one selector matching selection_type
+    if has_property_ids is not has_property_tags and selection_type in (
+        None,
+        "by_id" if has_property_ids else "by_tag",
+    ):
+        return
 
     # If selection_type discriminator is present, validate discriminated union
     if selection_type:
@@ -93,53 +113,31 @@ def validate_agent_authorization(agent: dict[str, Any]) -> None:
         ValidationError: If discriminator or field constraints are violated
     """
     authorization_type = agent.get("authorization_type")
-    auth_fields = ["properties", "property_ids", "property_tags", "publisher_properties"]
-    present_fields = [field for field in auth_fields if field in agent and agent[field] is not None]
+    present_fields = [field for field in _AUTH_FIELDS if agent.get(field) is not None]
 
     # If authorization_type discriminator is present, validate discriminated union
     if authorization_type:
-        if authorization_type == "property_ids" and "property_ids" not in present_fields:
-            raise ValidationError(
-                "Agent with authorization_type='property_ids' must have property_ids"
-            )
-        elif authorization_type == "property_tags" and "property_tags" not in present_fields:
-            raise ValidationError(
-                "Agent with authorization_type='property_tags' must have property_tags"
-            )
-        elif authorization_type == "inline_properties" and "properties" not in present_fields:
-            raise ValidationError(
-                "Agent with authorization_type='inline_properties' must have properties"
-            )
-        elif (
-            authorization_type == "publisher_properties"
-            and "publisher_properties" not in present_fields
-        ):
+        required_field = _AUTHORIZATION_TYPE_FIELDS.get(authorization_type)
+        if required_field is None:
+            raise ValidationError(f"Agent has invalid authorization_type: {authorization_type}")
+        if required_field not in present_fields:
             raise ValidationError(
-                "Agent with authorization_type='publisher_properties' "
-                "must have publisher_properties"
+                f"Agent with authorization_type='{authorization_type}' must have {required_field}"
             )
-        elif authorization_type not in (
-            "property_ids",
-            "property_tags",
-            "inline_properties",
-            "publisher_properties",
-        ):
-            raise ValidationError(f"Agent has invalid authorization_type: {authorization_type}")
 
     # Validate mutual exclusivity (for both old and new formats)
-    if len(present_fields) > 1:
-        raise ValidationError(
-            f"Agent authorization cannot have multiple fields: {', '.join(present_fields)}. "
-            f"Only one of {', '.join(auth_fields)} is allowed."
-        )
-
-    if len(present_fields) == 0:
+    if len(present_fields) != 1:
+        if present_fields:
+            raise ValidationError(
+                f"Agent authorization cannot have multiple fields: {', '.join(present_fields)}. "
+                f"Only one of {_AUTH_FIELDS_DISPLAY} is allowed."
+            )
         raise ValidationError(
-            f"Agent authorization must have exactly one of: {', '.join(auth_fields)}."
+            f"Agent authorization must have exactly one of: {_AUTH_FIELDS_DISPLAY}."
         )
 
     # If using publisher_properties, validate each item
-    if "publisher_properties" in present_fields:
+    if present_fields[0] == "publisher_properties":
         for pub_prop in agent["publisher_properties"]:
             validate_publisher_properties_item(pub_prop)
 
@@ -13,6 +13,8 @@ import asyncio
 import json
 import os
 import sys
+import traceback
+from contextvars import ContextVar
 from typing import Any
 
 from dotenv import load_dotenv
@@ -20,6 +22,11 @@ from dotenv import load_dotenv
 from src.adcp.client import ADCPClient
 from src.adcp.types.core import AgentConfig, Protocol
 
+# Agents tested at once; each agent's output is buffered and printed when it finishes
+MAX_CONCURRENT_TESTS = 4
+
+_agent_output: ContextVar[list[str] | None] = ContextVar("_agent_output", default=None)
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -33,31 +40,40 @@ class Colors:
     BOLD = "\033[1m"
 
 
+def emit(line: str) -> None:
+    """Print a line, or buffer it while the current agent test is running."""
+    buffer = _agent_output.get()
+    if buffer is None:
+        print(line)
+    else:
+        buffer.append(line)
+
+
 def print_header(text: str) -> None:
     """Print a formatted header."""
-    print(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 80}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{text}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.CYAN}{'=' * 80}{Colors.RESET}\n")
+    emit(f"\n{Colors.BOLD}{Colors.CYAN}{'=' * 80}{Colors.RESET}")
+    emit(f"{Colors.BOLD}{Colors.CYAN}{text}{Colors.RESET}")
+    emit(f"{Colors.BOLD}{Colors.CYAN}{'=' * 80}{Colors.RESET}\n")
 
 
 def print_success(text: str) -> None:
     """Print success message."""
-    print(f"{Colors.GREEN}✓ {text}{Colors.RESET}")
+    emit(f"{Colors.GREEN}✓ {text}{Colors.RESET}")
 
 
 def print_error(text: str) -> None:
     """Print error message."""
-    print(f"{Colors.RED}✗ {text}{Colors.RESET}")
+    emit(f"{Colors.RED}✗ {text}{Colors.RESET}")
 
 
 def print_info(text: str) -> None:
     """Print info message."""
-    print(f"{Colors.BLUE}ℹ {text}{Colors.RESET}")
+    emit(f"{Colors.BLUE}ℹ {text}{Colors.RESET}")
 
 
 def print_warning(text: str) -> None:
     """Print warning message."""
-    print(f"{Colors.YELLOW}⚠ {text}{Colors.RESET}")
+    emit(f"{Colors.YELLOW}⚠ {text}{Colors.RESET}")
 
 
 def load_agents_from_env() -> list[tuple[str, AgentConfig]]:
@@ -104,71 +120,69 @@ async def test_agent_connection(name: str, config: AgentConfig) -> dict[str, Any
     print_info(f"Auth: {'Yes' if config.auth_token else 'No'}")
 
     try:
-        # Create client
         client = ADCPClient(config)
-
-        # Try to list tools
-        print_info("Listing available tools...")
         try:
-            tools = await client.list_tools()
-            print_info(f"Got response: {len(tools)} tools")
-        except Exception as e:
-            print_warning(f"Error listing tools: {e}")
-            import traceback
-
-            traceback.print_exc()
-            tools = []
-
-        # Always mark as connected if we got this far
-        result["connected"] = True
-
-        if tools:
-            result["tools"] = tools
-            print_success(f"Connected! Found {len(tools)} tools:")
-            # Tools are just strings (tool names)
-            for tool_name in tools:
-                print(f"  • {Colors.BOLD}{tool_name}{Colors.RESET}")
-
-            # Try a simple test call if possible
-            test_tool = None
-            if "list_creative_formats" in tools:
-                test_tool = "list_creative_formats"
-            elif "get_products" in tools:
-                test_tool = "get_products"
-            elif tools:
-                test_tool = tools[0]
-
-            if test_tool:
-                print_info(f"Testing tool call: {test_tool}...")
-                try:
-                    test_result = await client.call_tool(test_tool, {})
-                    result["test_call_result"] = {
-                        "tool": test_tool,
-                        "success": test_result.success,
-                        "status": test_result.status.value,
-                    }
-                    if test_result.success:
-                        print_success(f"Tool call succeeded! Status: {test_result.status.value}")
-                        if test_result.data:
-                            print_info(
-                                f"Response data: {json.dumps(test_result.data, indent=2)[:200]}..."
+            # Try to list tools
+            print_info("Listing available tools...")
+            try:
+                tools = await client.list_tools()
+                print_info(f"Got response: {len(tools)} tools")
+            except Exception as e:
+                print_warning(f"Error listing tools: {e}")
+                # Through emit() so the traceback stays inside this agent's output block
+                emit(traceback.format_exc())
+                tools = []
+
+            # Always mark as connected if we got this far
+            result["connected"] = True
+
+            if tools:
+                result["tools"] = tools
+                print_success(f"Connected! Found {len(tools)} tools:")
+                # Tools are just strings (tool names)
+                for tool_name in tools:
+                    emit(f"  • {Colors.BOLD}{tool_name}{Colors.RESET}")
+
+                # Try a simple test call if possible
+                test_tool = None
+                if "list_creative_formats" in tools:
+                    test_tool = "list_creative_formats"
+                elif "get_products" in tools:
+                    test_tool = "get_products"
+                elif tools:
+                    test_tool = tools[0]
+
+                if test_tool:
+                    print_info(f"Testing tool call: {test_tool}...")
+                    try:
+                        test_result = await client.call_tool(test_tool, {})
+                        result["test_call_result"] = {
+                            "tool": test_tool,
+                            "success": test_result.success,
+                            "status": test_result.status.value,
+                        }
+                        if test_result.success:
+                            print_success(
+                                f"Tool call succeeded! Status: {test_result.status.value}"
                             )
-                    else:
-                        print_warning(f"Tool call status: {test_result.status.value}")
-                        if test_result.error:
-                            print_warning(f"Error: {test_result.error}")
-                except Exception as e:
-                    print_error(f"Tool call failed: {e}")
-                    result["test_call_result"] = {"tool": test_tool, "error": str(e)}
-        else:
-            print_warning("Connected but no tools found")
-
-        # Close the adapter
-        if hasattr(client.adapter, "close"):
+                            if test_result.data:
+                                response_json = json.dumps(test_result.data, indent=2)
+                                print_info(f"Response data: {response_json[:200]}...")
+                        else:
+                            print_warning(f"Tool call status: {test_result.status.value}")
+                            if test_result.error:
+                                print_warning(f"Error: {test_result.error}")
+                    except Exception as e:
+                        print_error(f"Tool call failed: {e}")
+                        result["test_call_result"] = {"tool": test_tool, "error": str(e)}
+            else:
+                print_warning("Connected but no tools found")
+        finally:
             try:
-                await client.adapter.close()
-            except Exception:
-                pass  # Ignore errors during cleanup
+                await client.close()
+            except Exception as e:
+                # A failed teardown doesn't make an otherwise working agent fail
+                print_warning(f"Error closing client: {e}")
 
     except Exception as e:
         result["error"] = str(e)
@@ -187,13 +201,19 @@ async def test_all_agents() -> list[dict[str, Any]]:
 
     print_header(f"Testing {len(agents)} AdCP Agents")
 
-    results = []
-    for name, config in agents:
-        result = await test_agent_connection(name, config)
-        results.append(result)
-        await asyncio.sleep(1)  # Brief pause between tests
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TESTS)
 
-    return results
+    async def test_one(name: str, config: AgentConfig) -> dict[str, Any]:
+        async with semaphore:
+            # Each gathered task has its own context, so buffers don't mix
+            buffer: list[str] = []
+            _agent_output.set(buffer)
+            try:
+                return await test_agent_connection(name, config)
+            finally:
+                print("\n".join(buffer))
+
+    return list(await asyncio.gather(*(test_one(name, config) for name, config in agents)))
 
 
 def print_summary(results: list[dict[str, Any]]) -> None:
@@ -242,8 +262,6 @@ async def main() -> None:
         sys.exit(130)
     except Exception as e:
         print_error(f"Fatal error: {e}")
-        import traceback
-
         traceback.print_exc()
         sys.exit(1)
 
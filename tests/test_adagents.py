@@ -2,8 +2,9 @@ from __future__ import annotations
 
 """Tests for adagents.json validation functionality."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 
 from adcp.adagents import (
@@ -17,20 +18,21 @@ from adcp.adagents import (
     get_properties_by_agent,
     identifiers_match,
     verify_agent_authorization,
+    verify_agents_authorization,
 )
 from adcp.exceptions import (
     AdagentsValidationError,
 )
 
 
-def create_mock_httpx_client(mock_response):
-    """Helper to create a properly mocked httpx.AsyncClient."""
-    mock_get = AsyncMock(return_value=mock_response)
-    mock_client_instance = MagicMock()
-    mock_client_instance.get = mock_get
-    mock_client_instance.__aenter__.return_value = mock_client_instance
-    mock_client_instance.__aexit__.return_value = AsyncMock()
-    return mock_client_instance
+def make_client(payload, requests, status_code=200):
+    """Helper to create an httpx.AsyncClient that serves payload and records requests."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code, json=payload)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
 
 
 class TestDomainNormalization:
@@ -164,6 +166,18 @@ class TestDomainMatching:
         assert not domain_matches("example.com", "other.com")
         assert not domain_matches("www.example.com", "other.com")
 
+    def test_matching_compares_whole_labels(self):
+        """Suffix matches must fall on a label boundary."""
+        assert not domain_matches("fooexample.com", "*.example.com")
+        assert not domain_matches("wwwexample.com", "example.com")
+        assert not domain_matches("www.www.example.com", "example.com")
+
+    def test_invalid_domains_never_match(self):
+        """Malformed domains do not match anything, including themselves."""
+        assert not domain_matches("a..example.com", "a..example.com")
+        assert not domain_matches("", "example.com")
+        assert domain_matches("example.com.", "example.com/")
+
 
 class TestIdentifierMatching:
     """Test identifier matching logic."""
@@ -206,6 +220,28 @@ class TestIdentifierMatching:
         assert not identifiers_match([], [])
         assert not identifiers_match([{"type": "domain", "value": "example.com"}], [])
 
+    def test_many_identifiers(self):
+        """Exact and domain identifiers are both found among many agent identifiers."""
+        agent_ids = [{"type": "bundle_id", "value": f"com.example.app{i}"} for i in range(50)]
+        agent_ids.append({"type": "domain", "value": "*.example.com"})
+
+        assert identifiers_match([{"type": "bundle_id", "value": "com.example.app49"}], agent_ids)
+        assert identifiers_match([{"type": "domain", "value": "news.example.com"}], agent_ids)
+        assert not identifiers_match(
+            [
+                {"type": "bundle_id", "value": "com.example.app50"},
+                {"type": "roku_store_id", "value": "com.example.app1"},
+                {"type": "domain", "value": "example.org"},
+            ],
+            agent_ids,
+        )
+
+    def test_unhashable_values_do_not_match(self):
+        """Malformed non-string identifier values are ignored rather than raising."""
+        property_ids = [{"type": "bundle_id", "value": ["com.example.app"]}]
+        agent_ids = [{"type": "bundle_id", "value": ["com.example.app"]}]
+        assert not identifiers_match(property_ids, agent_ids)
+
 
 class TestVerifyAgentAuthorization:
     """Test agent authorization verification."""
@@ -329,6 +365,27 @@ class TestVerifyAgentAuthorization:
             adagents_data, "https://sales-agent.example.com", None, None
         )
 
+    def test_repeated_agent_entries_are_all_checked(self):
+        """Every entry for the same agent URL is considered, not just the first."""
+        adagents_data = {
+            "authorized_agents": [
+                {
+                    "url": "https://sales-agent.example.com",
+                    "properties": [{"property_type": "app", "identifiers": []}],
+                },
+                {
+                    "url": "http://sales-agent.example.com/",
+                    "properties": [{"property_type": "website", "identifiers": []}],
+                },
+            ]
+        }
+        assert verify_agent_authorization(
+            adagents_data, "https://sales-agent.example.com", "website", None
+        )
+        assert get_properties_by_agent(adagents_data, "https://sales-agent.example.com") == [
+            {"property_type": "app", "identifiers": []}
+        ]
+
     def test_invalid_adagents_data_not_dict(self):
         """Should raise error if adagents_data is not a dict."""
         with pytest.raises(AdagentsValidationError, match="must be a dictionary"):
@@ -367,6 +424,78 @@ class TestVerifyAgentAuthorization:
         )
 
 
+BATCH_ADAGENTS_DATA = {
+    "authorized_agents": [
+        "not a dict",
+        {
+            "url": "https://sales-agent.example.com/",
+            "properties": [
+                {
+                    "property_type": "website",
+                    "identifiers": [{"type": "domain", "value": "*.example.com"}],
+                }
+            ],
+        },
+        {
+            "url": "http://sales-agent.example.com",
+            "properties": [
+                {
+                    "property_type": "app",
+                    "identifiers": [{"type": "bundle_id", "value": "com.example.app"}],
+                }
+            ],
+        },
+        {"url": "https://open-agent.example.com"},
+    ]
+}
+
+BATCH_QUERIES = [
+    ("https://sales-agent.example.com", "website", [{"type": "domain", "value": "a.example.com"}]),
+    ("https://sales-agent.example.com", "website", [{"type": "domain", "value": "other.com"}]),
+    ("https://sales-agent.example.com", "app", [{"type": "bundle_id", "value": "com.example.app"}]),
+    ("https://sales-agent.example.com", "app", None),
+    ("https://sales-agent.example.com", "ctv", None),
+    ("https://sales-agent.example.com", None, None),
+    ("https://open-agent.example.com/", "website", [{"type": "domain", "value": "x.com"}]),
+    ("https://unknown-agent.example.com", None, None),
+]
+
+
+class TestVerifyAgentsAuthorization:
+    """Test the batched verify_agents_authorization API."""
+
+    @pytest.mark.parametrize(
+        "queries",
+        [BATCH_QUERIES, BATCH_QUERIES[:1], list(reversed(BATCH_QUERIES)), []],
+    )
+    def test_matches_per_query_results(self, queries):
+        """Each result equals verify_agent_authorization for the same query."""
+        expected = [
+            verify_agent_authorization(BATCH_ADAGENTS_DATA, url, ptype, pids)
+            for url, ptype, pids in queries
+        ]
+        assert verify_agents_authorization(BATCH_ADAGENTS_DATA, queries) == expected
+
+    def test_batch_results(self):
+        """Results follow URL normalization, property filters and open authorization."""
+        assert verify_agents_authorization(BATCH_ADAGENTS_DATA, BATCH_QUERIES) == [
+            True,
+            False,
+            True,
+            True,
+            False,
+            True,
+            True,
+            False,
+        ]
+
+    @pytest.mark.parametrize("adagents_data", [[], {}, {"authorized_agents": "not a list"}])
+    def test_invalid_adagents_data(self, adagents_data):
+        """Malformed data raises even when there are no queries."""
+        with pytest.raises(AdagentsValidationError):
+            verify_agents_authorization(adagents_data, [])
+
+
 class TestFetchAdagents:
     """Test fetching adagents.json from publisher domains."""
 
@@ -386,19 +515,46 @@ class TestFetchAdagents:
             ]
         }
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_adagents_data
-        mock_response.raise_for_status = MagicMock()
+        requests: list[httpx.Request] = []
+        async with make_client(mock_adagents_data, requests) as client:
+            result = await fetch_adagents("example.com", client=client)
+
+        assert result == mock_adagents_data
+        assert len(requests) == 1
+        assert str(requests[0].url) == "https://example.com/.well-known/adagents.json"
+
+    @pytest.mark.parametrize("prefix", [b"", b"\xef\xbb\xbf"])
+    async def test_fetch_parses_raw_body(self, prefix):
+        """Should parse the UTF-8 body, with or without a byte order mark."""
+        from adcp.adagents import fetch_adagents
 
-        mock_client = create_mock_httpx_client(mock_response)
+        body = prefix + b'{"authorized_agents": [{"url": "https://agent.example.com"}]}'
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        async with httpx.AsyncClient(transport=transport) as client:
+            result = await fetch_adagents("example.com", client=client)
 
-        result = await fetch_adagents("example.com", client=mock_client)
+        assert result == {"authorized_agents": [{"url": "https://agent.example.com"}]}
 
-        assert result == mock_adagents_data
-        mock_client.get.assert_called_once()
-        call_args = mock_client.get.call_args
-        assert "https://example.com/.well-known/adagents.json" in str(call_args)
+    @pytest.mark.parametrize("encoding", ["utf-16", "utf-16-be", "utf-32"])
+    async def test_fetch_parses_non_utf8_body(self, encoding):
+        """Should fall back to response.json() for UTF-16 and UTF-32 bodies."""
+        from adcp.adagents import fetch_adagents
+
+        body = '{"authorized_agents": [{"url": "https://agent.example.com"}]}'.encode(encoding)
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+        async with httpx.AsyncClient(transport=transport) as client:
+            result = await fetch_adagents("example.com", client=client)
+
+        assert result == {"authorized_agents": [{"url": "https://agent.example.com"}]}
+
+    async def test_fetch_invalid_json(self):
+        """Should raise a validation error for a body that is not JSON."""
+        from adcp.adagents import fetch_adagents
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"{oops"))
+        async with httpx.AsyncClient(transport=transport) as client:
+            with pytest.raises(AdagentsValidationError, match="Invalid JSON"):
+                await fetch_adagents("example.com", client=client)
 
 
 class TestVerifyAgentForProperty:
@@ -420,61 +576,63 @@ class TestVerifyAgentForProperty:
             ]
         }
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_adagents_data
-        mock_response.raise_for_status = MagicMock()
+        requests: list[httpx.Request] = []
+        async with make_client(mock_adagents_data, requests) as client:
+            # Verify authorized agent
+            result = await verify_agent_for_property(
+                publisher_domain="example.com",
+                agent_url="https://agent.example.com",
+                property_identifiers=[{"type": "property_id", "value": "site1"}],
+                client=client,
+            )
 
-        mock_client = create_mock_httpx_client(mock_response)
+        assert result is True
+        assert len(requests) == 1
 
-        # Verify authorized agent
-        result = await verify_agent_for_property(
-            publisher_domain="example.com",
-            agent_url="https://agent.example.com",
-            property_identifiers=[{"type": "property_id", "value": "site1"}],
-            client=mock_client,
-        )
 
-        assert result is True
-        mock_client.get.assert_called_once()
+@pytest.fixture(scope="module")
+def sample_adagents():
+    """Two agents with three tagged properties, shared read-only across tests."""
+    return {
+        "authorized_agents": [
+            {
+                "url": "https://agent1.example.com",
+                "properties": [
+                    {
+                        "property_type": "website",
+                        "name": "Site 1",
+                        "identifiers": [{"type": "domain", "value": "site1.com"}],
+                        "tags": ["premium", "news"],
+                    },
+                    {
+                        "property_type": "mobile_app",
+                        "name": "App 1",
+                        "identifiers": [{"type": "bundle_id", "value": "com.site1.app"}],
+                        "tags": ["mobile", "premium"],
+                    },
+                ],
+            },
+            {
+                "url": "https://agent2.example.com",
+                "properties": [
+                    {
+                        "property_type": "website",
+                        "name": "Site 2",
+                        "identifiers": [{"type": "domain", "value": "site2.com"}],
+                        "tags": ["sports"],
+                    }
+                ],
+            },
+        ]
+    }
 
 
 class TestGetAllProperties:
     """Test extracting all properties from adagents.json data."""
 
-    def test_get_all_properties(self):
+    def test_get_all_properties(self, sample_adagents):
         """Should extract all properties from all agents."""
-        adagents_data = {
-            "authorized_agents": [
-                {
-                    "url": "https://agent1.example.com",
-                    "properties": [
-                        {
-                            "property_type": "website",
-                            "name": "Site 1",
-                            "identifiers": [{"type": "domain", "value": "site1.com"}],
-                        },
-                        {
-                            "property_type": "mobile_app",
-                            "name": "App 1",
-                            "identifiers": [{"type": "bundle_id", "value": "com.site1.app"}],
-                        },
-                    ],
-                },
-                {
-                    "url": "https://agent2.example.com",
-                    "properties": [
-                        {
-                            "property_type": "website",
-                            "name": "Site 2",
-                            "identifiers": [{"type": "domain", "value": "site2.com"}],
-                        }
-                    ],
-                },
-            ]
-        }
-
-        properties = get_all_properties(adagents_data)
+        properties = get_all_properties(sample_adagents)
         assert len(properties) == 3
         assert properties[0]["name"] == "Site 1"
         assert properties[0]["agent_url"] == "https://agent1.example.com"
@@ -514,42 +672,9 @@ class TestGetAllProperties:
 class TestGetAllTags:
     """Test extracting all unique tags from adagents.json data."""
 
-    def test_get_all_tags(self):
+    def test_get_all_tags(self, sample_adagents):
         """Should extract all unique tags from properties."""
-        adagents_data = {
-            "authorized_agents": [
-                {
-                    "url": "https://agent1.example.com",
-                    "properties": [
-                        {
-                            "property_type": "website",
-                            "name": "Site 1",
-                            "identifiers": [{"type": "domain", "value": "site1.com"}],
-                            "tags": ["premium", "news"],
-                        },
-                        {
-                            "property_type": "mobile_app",
-                            "name": "App 1",
-                            "identifiers": [{"type": "bundle_id", "value": "com.site1.app"}],
-                            "tags": ["mobile", "premium"],
-                        },
-                    ],
-                },
-                {
-                    "url": "https://agent2.example.com",
-                    "properties": [
-                        {
-                            "property_type": "website",
-                            "name": "Site 2",
-                            "identifiers": [{"type": "domain", "value": "site2.com"}],
-                            "tags": ["sports"],
-                        }
-                    ],
-                },
-            ]
-        }
-
-        tags = get_all_tags(adagents_data)
+        tags = get_all_tags(sample_adagents)
         assert tags == {"premium", "news", "mobile", "sports"}
 
     def test_get_all_tags_no_tags(self):
@@ -576,82 +701,22 @@ class TestGetAllTags:
 class TestGetPropertiesByAgent:
     """Test getting properties for a specific agent."""
 
-    def test_get_properties_by_agent(self):
+    def test_get_properties_by_agent(self, sample_adagents):
         """Should return properties for specified agent."""
-        adagents_data = {
-            "authorized_agents": [
-                {
-                    "url": "https://agent1.example.com",
-                    "properties": [
-                        {
-                            "property_type": "website",
-                            "name": "Site 1",
-                            "identifiers": [{"type": "domain", "value": "site1.com"}],
-                        },
-                        {
-                            "property_type": "mobile_app",
-                            "name": "App 1",
-                            "identifiers": [{"type": "bundle_id", "value": "com.site1.app"}],
-                        },
-                    ],
-                },
-                {
-                    "url": "https://agent2.example.com",
-                    "properties": [
-                        {
-                            "property_type": "website",
-                            "name": "Site 2",
-                            "identifiers": [{"type": "domain", "value": "site2.com"}],
-                        }
-                    ],
-                },
-            ]
-        }
-
-        properties = get_properties_by_agent(adagents_data, "https://agent1.example.com")
+        properties = get_properties_by_agent(sample_adagents, "https://agent1.example.com")
         assert len(properties) == 2
         assert properties[0]["name"] == "Site 1"
         assert properties[1]["name"] == "App 1"
 
-    def test_get_properties_by_agent_protocol_agnostic(self):
+    def test_get_properties_by_agent_protocol_agnostic(self, sample_adagents):
         """Should match agent URL regardless of protocol."""
-        adagents_data = {
-            "authorized_agents": [
-                {
-                    "url": "https://agent1.example.com",
-                    "properties": [
-                        {
-                            "property_type": "website",
-                            "name": "Site 1",
-                            "identifiers": [{"type": "domain", "value": "site1.com"}],
-                        }
-                    ],
-                }
-            ]
-        }
-
-        properties = get_properties_by_agent(adagents_data, "http://agent1.example.com")
-        assert len(properties) == 1
+        properties = get_properties_by_agent(sample_adagents, "http://agent1.example.com")
+        assert len(properties) == 2
         assert properties[0]["name"] == "Site 1"
 
-    def test_get_properties_by_agent_not_found(self):
+    def test_get_properties_by_agent_not_found(self, sample_adagents):
         """Should return empty list for unknown agent."""
-        adagents_data = {
-            "authorized_agents": [
-                {
-                    "url": "https://agent1.example.com",
-                    "properties": [
-                        {
-                            "property_type": "website",
-                            "name": "Site 1",
-                            "identifiers": [{"type": "domain", "value": "site1.com"}],
-                        }
-                    ],
-                }
-            ]
-        }
-
-        properties = get_properties_by_agent(adagents_data, "https://unknown-agent.com")
+        properties = get_properties_by_agent(sample_adagents, "https://unknown-agent.com")
         assert len(properties) == 0
 
 
@@ -850,6 +915,50 @@ class TestFetchAgentAuthorizations:
             assert contexts["nytimes.com"].property_ids == ["nyt_prop1"]
             assert contexts["wsj.com"].property_ids == ["wsj_prop1"]
 
+    async def test_fetches_share_one_client(self):
+        """Without a client argument, every domain fetch reuses one pooled client."""
+        from unittest.mock import patch
+
+        adagents_data = {"authorized_agents": [{"url": "https://our-agent.com"}]}
+        clients = []
+
+        async def mock_fetch_adagents(domain, **kwargs):
+            clients.append(kwargs["client"])
+            return adagents_data
+
+        with patch("adcp.adagents.fetch_adagents", side_effect=mock_fetch_adagents):
+            contexts = await fetch_agent_authorizations(
+                "https://our-agent.com", ["nytimes.com", "wsj.com", "cnn.com"]
+            )
+
+        assert len(contexts) == 3
+        assert clients[0] is not None
+        assert all(c is clients[0] for c in clients)
+        assert clients[0].is_closed
+
+    async def test_context_uses_first_matching_entry(self):
+        """The context comes from the first entry listing the agent, even with no properties."""
+        from unittest.mock import patch
+
+        adagents_data = {
+            "authorized_agents": [
+                {"url": "https://other-agent.com", "properties": [{"id": "other"}]},
+                {"url": "http://our-agent.com/", "properties": []},
+                {"url": "https://our-agent.com", "properties": [{"id": "later"}]},
+            ]
+        }
+
+        with patch("adcp.adagents.fetch_adagents", new_callable=AsyncMock) as mock_fetch:
+            mock_fetch.side_effect = [adagents_data, {"authorized_agents": "not a list"}]
+
+            contexts = await fetch_agent_authorizations(
+                "https://our-agent.com", ["nytimes.com", "broken.com"]
+            )
+
+        assert list(contexts) == ["nytimes.com"]
+        assert contexts["nytimes.com"].property_ids == []
+        assert contexts["nytimes.com"].raw_properties == []
+
     async def test_skip_unauthorized_publishers(self):
         """Should skip publishers where agent is not authorized."""
         from unittest.mock import patch
@@ -120,6 +120,56 @@ async def test_get_products():
         assert isinstance(result.data, GetProductsResponse)
 
 
+@pytest.mark.asyncio
+async def test_activity_events_emitted_to_callback():
+    """Test that request/response activities reach on_activity."""
+    from unittest.mock import patch
+
+    from adcp.types._generated import GetProductsRequest
+    from adcp.types.core import ActivityType, TaskResult, TaskStatus
+
+    config = AgentConfig(
+        id="test_agent",
+        agent_uri="https://test.example.com",
+        protocol=Protocol.A2A,
+    )
+    activities = []
+    client = ADCPClient(config, on_activity=activities.append)
+
+    raw_result = TaskResult(status=TaskStatus.COMPLETED, data={"products": []}, success=True)
+    with patch.object(client.adapter, "get_products", return_value=raw_result):
+        await client.get_products(GetProductsRequest(brief="test campaign"))
+
+    assert [a.type for a in activities] == [
+        ActivityType.PROTOCOL_REQUEST,
+        ActivityType.PROTOCOL_RESPONSE,
+    ]
+    assert activities[0].operation_id == activities[1].operation_id
+    assert activities[1].status == TaskStatus.COMPLETED
+    assert all(a.agent_id == "test_agent" and a.task_type == "get_products" for a in activities)
+    assert activities[0].timestamp.tzinfo is not None
+    assert '"timestamp":"' in activities[0].model_dump_json()
+
+
+def test_activity_timestamp_is_datetime():
+    """Activity.timestamp is a datetime; ISO strings are parsed and JSON stays ISO 8601."""
+    from datetime import datetime, timezone
+
+    from adcp.types.core import Activity, ActivityType
+
+    activity = Activity(
+        type=ActivityType.PROTOCOL_REQUEST,
+        operation_id="op-1",
+        agent_id="a",
+        task_type="get_products",
+        timestamp="2025-01-02T03:04:05+00:00",
+    )
+
+    assert activity.timestamp == datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    assert Activity.model_fields["timestamp"].annotation is datetime
+    assert '"timestamp":"2025-01-02T03:04:05Z"' in activity.model_dump_json()
+
+
 @pytest.mark.asyncio
 async def test_all_client_methods():
     """Test that all AdCP tool methods exist and are callable."""
@@ -513,3 +563,105 @@ async def test_multi_agent_close_handles_adapter_failures():
         # Verify both adapters had close called
         mock_close_success.assert_called_once()
         mock_close_failure.assert_called_once()
+
+
+def test_task_result_factories():
+    """Test TaskResult.completed and TaskResult.failed builders."""
+    from adcp.types.core import TaskResult, TaskStatus
+
+    ok = TaskResult.completed({"x": 1}, message="done")
+    assert ok.status == TaskStatus.COMPLETED
+    assert ok.success is True
+    assert ok.data == {"x": 1}
+    assert ok.message == "done"
+
+    err = TaskResult.failed("boom")
+    assert err.status == TaskStatus.FAILED
+    assert err.success is False
+    assert err.error == "boom"
+    assert err.data is None
+
+
+def test_agent_config_mcp_url_candidates():
+    """Test MCP URL fallback candidates are computed from agent_uri."""
+    config = AgentConfig(id="a", agent_uri="https://test.example.com/", protocol=Protocol.MCP)
+    assert config.mcp_url_candidates == (
+        "https://test.example.com",
+        "https://test.example.com/mcp",
+    )
+
+    config = AgentConfig(id="a", agent_uri="https://test.example.com/mcp", protocol=Protocol.MCP)
+    assert config.mcp_url_candidates == ("https://test.example.com/mcp",)
+
+
+def test_agent_config_mcp_url_candidates_follow_model_copy():
+    """A copy with a new agent_uri derives its candidates from the new URI."""
+    config = AgentConfig(id="a", agent_uri="https://old.example.com", protocol=Protocol.MCP)
+    assert config.mcp_url_candidates[0] == "https://old.example.com"
+
+    moved = config.model_copy(update={"agent_uri": "https://new.example.com/mcp"})
+    assert moved.mcp_url_candidates == ("https://new.example.com/mcp",)
+    assert config.mcp_url_candidates[0] == "https://old.example.com"
+
+
+def test_core_models_are_frozen():
+    """Test that AgentConfig and TaskResult reject attribute assignment."""
+    from pydantic import ValidationError
+
+    from adcp.types.core import TaskResult
+
+    config = AgentConfig(id="a", agent_uri="https://test.example.com", protocol=Protocol.MCP)
+    with pytest.raises(ValidationError):
+        config.timeout = 10.0
+
+    result = TaskResult.completed({"x": 1})
+    with pytest.raises(ValidationError):
+        result.metadata = {}
+
+
+def test_enum_coerce():
+    """Test coerce maps raw values to members and rejects unknown values."""
+    from adcp.types.core import TaskStatus
+
+    assert TaskStatus.coerce("failed") is TaskStatus.FAILED
+    assert TaskStatus.coerce(TaskStatus.COMPLETED) is TaskStatus.COMPLETED
+    assert Protocol.coerce("mcp") is Protocol.MCP
+    with pytest.raises(ValueError):
+        Protocol.coerce("grpc")
+
+
+def test_task_result_metadata_passed_through():
+    """Test that pass-through metadata is stored without being re-validated."""
+    from adcp.types.core import TaskResult
+
+    metadata = {"task_id": "t1", "nested": {"a": [1, 2]}}
+    result = TaskResult.completed(None, metadata=metadata)
+
+    assert result.metadata is metadata
+    assert result.model_dump()["metadata"] == metadata
+
+
+def test_task_result_schema_independent_of_response_types():
+    """Test that TaskResult's schema does not inline any response model."""
+    from adcp.types.core import TaskResult
+
+    data_schema = TaskResult.__pydantic_core_schema__["schema"]["fields"]["data"]["schema"]
+    assert data_schema["type"] == "default"
+    assert data_schema["schema"]["type"] == "nullable"
+    assert data_schema["schema"]["schema"]["type"] == "any"
+
+
+def test_agent_config_interns_enumerated_strings():
+    """Test that configs parsed from JSON share their auth/transport strings."""
+    import json
+
+    raw = (
+        '{"id": "a", "agent_uri": "https://x.example.com", "protocol": "mcp",'
+        ' "auth_type": "bearer", "auth_header": "Authorization"}'
+    )
+    first = AgentConfig(**json.loads(raw))
+    second = AgentConfig(**json.loads(raw))
+
+    assert first.auth_type is second.auth_type
+    assert first.mcp_transport is second.mcp_transport
+    assert first.auth_header is second.auth_header
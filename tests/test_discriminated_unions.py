@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from typing import Annotated
+
 import pytest
-from pydantic import ValidationError
+from pydantic import Field, TypeAdapter, ValidationError
 
 # Use semantic aliases for response types
 from adcp import (
@@ -21,6 +23,7 @@ from adcp import (
     UrlPreviewRender,
     UrlVastAsset,
 )
+from adcp.types import Destination
 
 # Keep using generated names for authorization variants
 # Deployment and Destination now have semantic aliases
@@ -41,6 +44,15 @@ from adcp.types._generated import (
 PublisherProperties4 = PublisherPropertySelector2
 PublisherProperties5 = PublisherPropertySelector3
 
+# Lists of destinations validate in one pass, selecting each variant by its type tag
+DESTINATIONS_ADAPTER = TypeAdapter(list[Annotated[Destination, Field(discriminator="type")]])
+
+
+def error_fields(exc: ValidationError) -> set[str]:
+    """Field names that a ValidationError points at, read from its structured errors."""
+    errors = exc.errors(include_url=False, include_input=False, include_context=False)
+    return {str(loc) for err in errors for loc in err["loc"]}
+
 
 class TestAuthorizationDiscriminatedUnions:
     """Test authorization_type discriminated unions in adagents.json.
@@ -50,18 +62,70 @@ class TestAuthorizationDiscriminatedUnions:
     No model_validator needed because discrimination happens at type level.
     """
 
-    def test_property_ids_authorization(self):
-        """AuthorizedAgents (property_ids variant) requires property_ids and authorization_type."""
-        agent = AuthorizedAgents(
+    @pytest.mark.parametrize(
+        ("model", "authorization_type", "field", "value", "roots", "absent"),
+        [
+            (
+                AuthorizedAgents,
+                "property_ids",
+                "property_ids",
+                ["site1", "site2"],
+                ["site1", "site2"],
+                ("property_tags", "properties"),
+            ),
+            (
+                AuthorizedAgents1,
+                "property_tags",
+                "property_tags",
+                ["news", "sports"],
+                ["news", "sports"],
+                ("property_ids",),
+            ),
+            (
+                AuthorizedAgents2,
+                "inline_properties",
+                "properties",
+                [
+                    {
+                        "property_id": "site1",
+                        "property_type": "website",
+                        "name": "Example Site",
+                        "identifiers": [{"type": "domain", "value": "example.com"}],
+                    }
+                ],
+                None,
+                ("property_ids",),
+            ),
+            (
+                AuthorizedAgents3,
+                "publisher_properties",
+                "publisher_properties",
+                [
+                    {
+                        "publisher_domain": "example.com",
+                        "selection_type": "by_id",
+                        "property_ids": ["site1"],
+                    }
+                ],
+                None,
+                ("property_ids",),
+            ),
+        ],
+    )
+    def test_authorization_variant(self, model, authorization_type, field, value, roots, absent):
+        """Each AuthorizedAgents variant requires its own field, named by authorization_type."""
+        agent = model(
             url="https://agent.example.com",
             authorized_for="All properties",
-            authorization_type="property_ids",
-            property_ids=["site1", "site2"],
+            authorization_type=authorization_type,
+            **{field: value},
         )
-        assert agent.authorization_type == "property_ids"
-        assert [p.root for p in agent.property_ids] == ["site1", "site2"]
-        assert not hasattr(agent, "property_tags")
-        assert not hasattr(agent, "properties")
+        assert agent.authorization_type == authorization_type
+        assert len(getattr(agent, field)) == len(value)
+        if roots is not None:
+            assert agent.model_dump()[field] == roots
+        for name in absent:
+            assert name not in type(agent).model_fields
 
     def test_property_ids_authorization_from_json(self):
         """AuthorizedAgents (property_ids) validates from JSON dict."""
@@ -73,7 +137,7 @@ class TestAuthorizationDiscriminatedUnions:
         }
         agent = AuthorizedAgents.model_validate(data)
         assert agent.authorization_type == "property_ids"
-        assert [p.root for p in agent.property_ids] == ["site1", "site2"]
+        assert agent.model_dump()["property_ids"] == ["site1", "site2"]
 
     def test_property_ids_authorization_wrong_type_fails(self):
         """AuthorizedAgents (property_ids) rejects wrong authorization_type value."""
@@ -84,39 +148,7 @@ class TestAuthorizationDiscriminatedUnions:
                 authorization_type="property_tags",  # Wrong value for this variant
                 property_ids=["site1"],
             )
-        error_msg = str(exc_info.value)
-        assert "authorization_type" in error_msg.lower()
-
-    def test_property_tags_authorization(self):
-        """AuthorizedAgents1 requires property_tags and authorization_type."""
-        agent = AuthorizedAgents1(
-            url="https://agent.example.com",
-            authorized_for="All properties",
-            authorization_type="property_tags",
-            property_tags=["news", "sports"],
-        )
-        assert agent.authorization_type == "property_tags"
-        assert [p.root for p in agent.property_tags] == ["news", "sports"]
-        assert not hasattr(agent, "property_ids")
-
-    def test_inline_properties_authorization(self):
-        """AuthorizedAgents2 requires properties and authorization_type."""
-        agent = AuthorizedAgents2(
-            url="https://agent.example.com",
-            authorized_for="All properties",
-            authorization_type="inline_properties",
-            properties=[
-                {
-                    "property_id": "site1",
-                    "property_type": "website",
-                    "name": "Example Site",
-                    "identifiers": [{"type": "domain", "value": "example.com"}],
-                }
-            ],
-        )
-        assert agent.authorization_type == "inline_properties"
-        assert len(agent.properties) == 1
-        assert not hasattr(agent, "property_ids")
+        assert "authorization_type" in error_fields(exc_info.value)
 
     def test_inline_properties_authorization_from_json(self):
         """AuthorizedAgents2 (inline_properties) validates from JSON dict."""
@@ -137,47 +169,53 @@ class TestAuthorizationDiscriminatedUnions:
         assert agent.authorization_type == "inline_properties"
         assert len(agent.properties) == 1
 
-    def test_publisher_properties_authorization(self):
-        """AuthorizedAgents3 requires publisher_properties and type."""
-        agent = AuthorizedAgents3(
-            url="https://agent.example.com",
-            authorized_for="All properties",
-            authorization_type="publisher_properties",
-            publisher_properties=[
-                {
-                    "publisher_domain": "example.com",
-                    "selection_type": "by_id",
-                    "property_ids": ["site1"],
-                }
-            ],
-        )
-        assert agent.authorization_type == "publisher_properties"
-        assert len(agent.publisher_properties) == 1
-        assert not hasattr(agent, "property_ids")
+
+@pytest.fixture(scope="module")
+def success_response():
+    """CreateMediaBuySuccessResponse shared by the read-only tests below."""
+    return CreateMediaBuySuccessResponse(
+        media_buy_id="mb_123",
+        buyer_ref="ref_456",
+        packages=[],
+    )
+
+
+@pytest.fixture(scope="module")
+def error_response():
+    """CreateMediaBuyErrorResponse shared by the read-only tests below."""
+    return CreateMediaBuyErrorResponse(
+        errors=[{"code": "invalid_budget", "message": "Budget too low"}],
+    )
+
+
+@pytest.fixture(scope="module")
+def platform_destination():
+    """Destination1 (platform) shared by the read-only tests below."""
+    return Destination1(type="platform", platform="google_ads", account="123")
+
+
+@pytest.fixture(scope="module")
+def agent_destination():
+    """Destination2 (agent) shared by the read-only tests below."""
+    return Destination2(type="agent", agent_url="https://agent.example.com", account="123")
 
 
 class TestResponseUnions:
     """Test discriminated union response types."""
 
-    def test_create_media_buy_success_variant(self):
+    def test_create_media_buy_success_variant(self, success_response):
         """CreateMediaBuySuccessResponse should validate with required fields."""
-        success = CreateMediaBuySuccessResponse(
-            media_buy_id="mb_123",
-            buyer_ref="ref_456",
-            packages=[],
-        )
+        success = success_response
         assert success.media_buy_id == "mb_123"
         assert success.buyer_ref == "ref_456"
-        assert not hasattr(success, "errors")
+        assert "errors" not in type(success).model_fields
 
-    def test_create_media_buy_error_variant(self):
+    def test_create_media_buy_error_variant(self, error_response):
         """CreateMediaBuyErrorResponse should validate with errors field."""
-        error = CreateMediaBuyErrorResponse(
-            errors=[{"code": "invalid_budget", "message": "Budget too low"}],
-        )
+        error = error_response
         assert len(error.errors) == 1
         assert error.errors[0].code == "invalid_budget"
-        assert not hasattr(error, "media_buy_id")
+        assert "media_buy_id" not in type(error).model_fields
 
     def test_activate_signal_success_variant(self):
         """ActivateSignalSuccessResponse should validate with required fields."""
@@ -185,7 +223,7 @@ class TestResponseUnions:
             deployments=[],
         )
         assert success.deployments == []
-        assert not hasattr(success, "errors")
+        assert "errors" not in type(success).model_fields
 
     def test_activate_signal_error_variant(self):
         """ActivateSignalErrorResponse should validate with errors field."""
@@ -193,22 +231,18 @@ class TestResponseUnions:
             errors=[{"code": "unauthorized", "message": "Not authorized"}],
         )
         assert len(error.errors) == 1
-        assert not hasattr(error, "deployments")
+        assert "deployments" not in type(error).model_fields
 
 
 class TestDestinationDiscriminators:
     """Test destination discriminator fields."""
 
-    def test_platform_destination_requires_platform(self):
+    def test_platform_destination_requires_platform(self, platform_destination):
         """Destination1 (platform) requires platform field."""
-        dest = Destination1(
-            type="platform",
-            platform="google_ads",
-            account="123",
-        )
+        dest = platform_destination
         assert dest.type == "platform"
         assert dest.platform == "google_ads"
-        assert not hasattr(dest, "agent_url")
+        assert "agent_url" not in type(dest).model_fields
 
     def test_platform_destination_missing_platform_fails(self):
         """Destination1 without platform should fail."""
@@ -217,18 +251,14 @@ class TestDestinationDiscriminators:
                 type="platform",
                 account="123",
             )
-        assert "platform" in str(exc_info.value)
+        assert "platform" in error_fields(exc_info.value)
 
-    def test_agent_destination_requires_agent_url(self):
+    def test_agent_destination_requires_agent_url(self, agent_destination):
         """Destination2 (agent) requires agent_url field."""
-        dest = Destination2(
-            type="agent",
-            agent_url="https://agent.example.com",
-            account="123",
-        )
+        dest = agent_destination
         assert dest.type == "agent"
         assert str(dest.agent_url).rstrip("/") == "https://agent.example.com"
-        assert not hasattr(dest, "platform")
+        assert "platform" not in type(dest).model_fields
 
     def test_agent_destination_missing_agent_url_fails(self):
         """Destination2 without agent_url should fail."""
@@ -237,7 +267,7 @@ class TestDestinationDiscriminators:
                 type="agent",
                 account="123",
             )
-        assert "agent_url" in str(exc_info.value)
+        assert "agent_url" in error_fields(exc_info.value)
 
 
 class TestDeploymentDiscriminators:
@@ -254,7 +284,7 @@ class TestDeploymentDiscriminators:
         assert deployment.type == "platform"
         assert deployment.platform == "google_ads"
         assert deployment.is_live is True
-        assert not hasattr(deployment, "agent_url")
+        assert "agent_url" not in type(deployment).model_fields
 
     def test_agent_deployment_requires_agent_url(self):
         """Deployment2 (agent) requires agent_url field."""
@@ -267,7 +297,7 @@ class TestDeploymentDiscriminators:
         assert deployment.type == "agent"
         assert str(deployment.agent_url).rstrip("/") == "https://agent.example.com"
         assert deployment.is_live is True
-        assert not hasattr(deployment, "platform")
+        assert "platform" not in type(deployment).model_fields
 
 
 class TestUnionTypeValidation:
@@ -293,61 +323,76 @@ class TestUnionTypeValidation:
         assert isinstance(response, CreateMediaBuyErrorResponse)
         assert len(response.errors) == 1
 
-    def test_platform_destination_from_dict(self):
-        """Destination1 should validate platform variant from dict."""
-        data = {"type": "platform", "platform": "google_ads", "account": "123"}
-        dest = Destination1.model_validate(data)
-        assert isinstance(dest, Destination1)
-        assert dest.type == "platform"
+    def test_destinations_from_dicts_select_variant_by_type(self):
+        """A list of destination dicts validates in one pass through the Destination union."""
+        dests = DESTINATIONS_ADAPTER.validate_python(
+            [
+                {"type": "platform", "platform": "google_ads", "account": "123"},
+                {"type": "agent", "agent_url": "https://agent.example.com", "account": "123"},
+                {"type": "platform", "platform": "the_trade_desk"},
+            ]
+        )
+        assert [type(dest) for dest in dests] == [Destination1, Destination2, Destination1]
+        assert [dest.type for dest in dests] == ["platform", "agent", "platform"]
 
-    def test_agent_destination_from_dict(self):
-        """Destination2 should validate agent variant from dict."""
-        data = {
-            "type": "agent",
-            "agent_url": "https://agent.example.com",
-            "account": "123",
-        }
-        dest = Destination2.model_validate(data)
-        assert isinstance(dest, Destination2)
-        assert dest.type == "agent"
+    def test_destinations_reject_unknown_type(self):
+        """An unknown destination type fails on the discriminator."""
+        with pytest.raises(ValidationError) as exc_info:
+            DESTINATIONS_ADAPTER.validate_python([{"type": "carrier_pigeon"}])
+        assert exc_info.value.errors()[0]["type"] == "union_tag_invalid"
+
+    def test_deployments_list_selects_variant_by_type(self):
+        """ActivateSignalSuccessResponse picks each deployment variant from its type tag."""
+        response = ActivateSignalSuccessResponse.model_validate(
+            {
+                "deployments": [
+                    {"type": "platform", "platform": "google_ads", "is_live": True},
+                    {"type": "agent", "agent_url": "https://agent.example.com", "is_live": False},
+                ]
+            }
+        )
+        assert isinstance(response.deployments[0], Deployment1)
+        assert isinstance(response.deployments[1], Deployment2)
+
+    def test_deployments_list_rejects_unknown_type(self):
+        """An unknown deployment type fails on the discriminator, not per variant."""
+        with pytest.raises(ValidationError) as exc_info:
+            ActivateSignalSuccessResponse.model_validate(
+                {"deployments": [{"type": "carrier_pigeon", "is_live": True}]}
+            )
+        assert exc_info.value.errors()[0]["type"] == "union_tag_invalid"
 
 
 class TestSerializationRoundtrips:
     """Test that discriminated unions serialize and deserialize correctly."""
 
-    def test_success_response_roundtrip(self):
+    def test_success_response_roundtrip(self, success_response):
         """CreateMediaBuySuccessResponse should roundtrip through JSON."""
-        original = CreateMediaBuySuccessResponse(
-            media_buy_id="mb_123",
-            buyer_ref="ref_456",
-            packages=[],
-        )
+        original = success_response
         json_str = original.model_dump_json()
         parsed = CreateMediaBuySuccessResponse.model_validate_json(json_str)
         assert parsed.media_buy_id == original.media_buy_id
         assert parsed.buyer_ref == original.buyer_ref
 
-    def test_error_response_roundtrip(self):
+    def test_error_response_roundtrip(self, error_response):
         """CreateMediaBuyErrorResponse should roundtrip through JSON."""
-        original = CreateMediaBuyErrorResponse(
-            errors=[{"code": "invalid", "message": "Invalid"}],
-        )
+        original = error_response
         json_str = original.model_dump_json()
         parsed = CreateMediaBuyErrorResponse.model_validate_json(json_str)
         assert len(parsed.errors) == len(original.errors)
         assert parsed.errors[0].code == original.errors[0].code
 
-    def test_platform_destination_roundtrip(self):
+    def test_platform_destination_roundtrip(self, platform_destination):
         """Destination1 should roundtrip through JSON."""
-        original = Destination1(type="platform", platform="google_ads", account="123")
+        original = platform_destination
         json_str = original.model_dump_json()
         parsed = Destination1.model_validate_json(json_str)
         assert parsed.type == original.type
         assert parsed.platform == original.platform
 
-    def test_agent_destination_roundtrip(self):
+    def test_agent_destination_roundtrip(self, agent_destination):
         """Destination2 should roundtrip through JSON."""
-        original = Destination2(type="agent", agent_url="https://agent.example.com", account="123")
+        original = agent_destination
         json_str = original.model_dump_json()
         parsed = Destination2.model_validate_json(json_str)
         assert parsed.type == original.type
@@ -453,8 +498,7 @@ class TestPublisherPropertyValidation:
                 selection_type="by_id",
                 # Missing property_ids - should fail
             )
-        error_msg = str(exc_info.value)
-        assert "property_ids" in error_msg.lower()
+        assert "property_ids" in error_fields(exc_info.value)
 
     def test_publisher_property_by_tag_without_property_tags_fails(self):
         """PublisherProperties5 requires property_tags field."""
@@ -464,8 +508,7 @@ class TestPublisherPropertyValidation:
                 selection_type="by_tag",
                 # Missing property_tags - should fail
             )
-        error_msg = str(exc_info.value)
-        assert "property_tags" in error_msg.lower()
+        assert "property_tags" in error_fields(exc_info.value)
 
 
 class TestProductValidation:
@@ -569,7 +612,7 @@ class TestPreviewRenderDiscriminators:
                 output_format="html",  # Wrong discriminator value
                 preview_url="https://preview.example.com/creative",
             )
-        assert "output_format" in str(exc_info.value).lower()
+        assert "output_format" in error_fields(exc_info.value)
 
     def test_html_preview_render_rejects_wrong_discriminator(self):
         """HtmlPreviewRender rejects output_format='url'."""
@@ -580,7 +623,7 @@ class TestPreviewRenderDiscriminators:
                 output_format="url",  # Wrong discriminator value
                 preview_html="<div>Preview HTML</div>",
             )
-        assert "output_format" in str(exc_info.value).lower()
+        assert "output_format" in error_fields(exc_info.value)
 
 
 class TestVastAssetDiscriminators:
@@ -613,7 +656,7 @@ class TestVastAssetDiscriminators:
                 delivery_type="inline",  # Wrong discriminator value
                 url="https://vast.example.com/ad.xml",
             )
-        assert "delivery_type" in str(exc_info.value).lower()
+        assert "delivery_type" in error_fields(exc_info.value)
 
     def test_inline_vast_asset_rejects_wrong_discriminator(self):
         """InlineVastAsset rejects delivery_type='url'."""
@@ -622,7 +665,7 @@ class TestVastAssetDiscriminators:
                 delivery_type="url",  # Wrong discriminator value
                 content="<VAST>...</VAST>",
             )
-        assert "delivery_type" in str(exc_info.value).lower()
+        assert "delivery_type" in error_fields(exc_info.value)
 
 
 class TestDaastAssetDiscriminators:
@@ -655,7 +698,7 @@ class TestDaastAssetDiscriminators:
                 delivery_type="inline",  # Wrong discriminator value
                 url="https://daast.example.com/ad.xml",
             )
-        assert "delivery_type" in str(exc_info.value).lower()
+        assert "delivery_type" in error_fields(exc_info.value)
 
     def test_inline_daast_asset_rejects_wrong_discriminator(self):
         """InlineDaastAsset rejects delivery_type='url'."""
@@ -664,7 +707,7 @@ class TestDaastAssetDiscriminators:
                 delivery_type="url",  # Wrong discriminator value
                 content="<DAAST>...</DAAST>",
             )
-        assert "delivery_type" in str(exc_info.value).lower()
+        assert "delivery_type" in error_fields(exc_info.value)
 
 
 class TestSubAssetDiscriminators:
@@ -703,7 +746,7 @@ class TestSubAssetDiscriminators:
                 asset_kind="text",  # Wrong discriminator value
                 content_uri="https://cdn.example.com/logo.png",
             )
-        assert "asset_kind" in str(exc_info.value).lower()
+        assert "asset_kind" in error_fields(exc_info.value)
 
     def test_text_sub_asset_rejects_wrong_discriminator(self):
         """TextSubAsset rejects asset_kind='media'."""
@@ -714,7 +757,7 @@ class TestSubAssetDiscriminators:
                 asset_kind="media",  # Wrong discriminator value
                 content="Buy Now!",
             )
-        assert "asset_kind" in str(exc_info.value).lower()
+        assert "asset_kind" in error_fields(exc_info.value)
 
 
 class TestSemanticAliasDiscriminatorRoundtrips:
@@ -0,0 +1,42 @@
+"""Guard against hand-written models being defined more than once.
+
+Each duplicate class definition costs its own pydantic schema build at import
+time, so adcp.types should define every hand-written model exactly once.
+Generated code (generated_poc/, _generated.py) is excluded: it is regenerated
+from the schemas and names its per-file variants independently.
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import pkgutil
+
+from pydantic import BaseModel
+
+import adcp.types
+
+
+def _hand_written_modules():
+    for module_info in pkgutil.walk_packages(adcp.types.__path__, "adcp.types."):
+        if "generated" in module_info.name:
+            continue
+        yield importlib.import_module(module_info.name)
+
+
+def test_hand_written_models_are_defined_once():
+    """Every BaseModel subclass in adcp.types is defined in exactly one module."""
+    definitions: dict[str, list[str]] = {}
+    for module in _hand_written_modules():
+        for obj in vars(module).values():
+            if (
+                inspect.isclass(obj)
+                and issubclass(obj, BaseModel)
+                and obj.__module__ == module.__name__
+            ):
+                definitions.setdefault(obj.__qualname__, []).append(module.__name__)
+
+    duplicates = {name: modules for name, modules in definitions.items() if len(modules) > 1}
+    assert not duplicates, f"Models defined in more than one module: {duplicates}"
+    assert "TaskResult" in definitions
+    assert definitions["AgentConfig"] == ["adcp.types.core"]
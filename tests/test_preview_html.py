@@ -1,5 +1,6 @@
 """Tests for preview URL generation functionality."""
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
@@ -17,12 +18,15 @@ from adcp.types._generated import (
     ListCreativeFormatsResponse,
     PreviewCreativeResponse1,
     Product,
+    TextAsset,
 )
 from adcp.types.core import TaskResult, TaskStatus
 from adcp.utils.preview_cache import (
     PreviewURLGenerator,
     _create_sample_asset,
     _create_sample_manifest_for_format,
+    _make_manifest_cache_key,
+    add_preview_urls_to_formats,
 )
 
 
@@ -101,6 +105,196 @@ async def test_preview_creative():
             mock_call.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_concurrent_preview_requests_share_one_call():
+    """Concurrent lookups for the same manifest issue a single preview request."""
+    config = AgentConfig(
+        id="creative_agent",
+        agent_uri="https://creative.example.com",
+        protocol=Protocol.MCP,
+    )
+
+    client = ADCPClient(config)
+    generator = PreviewURLGenerator(client)
+
+    format_id = make_format_id("display_300x250")
+    manifest = CreativeManifest(
+        format_id=format_id,
+        assets={"image": ImageAsset(url="https://example.com/img.jpg")},
+    )
+
+    mock_preview_response = PreviewCreativeResponse1(
+        response_type="single",
+        expires_at="2025-12-01T00:00:00Z",
+        previews=[
+            {
+                "preview_id": "prev-1",
+                "input": {"name": "Default"},
+                "renders": [
+                    {
+                        "render_id": "render-1",
+                        "role": "primary",
+                        "output_format": "url",
+                        "preview_url": "https://preview.example.com/abc123",
+                    }
+                ],
+            }
+        ],
+    )
+    calls = 0
+
+    async def slow_preview(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return TaskResult(status=TaskStatus.COMPLETED, data=mock_preview_response, success=True)
+
+    with patch.object(client, "preview_creative", side_effect=slow_preview):
+        results = await asyncio.gather(
+            *(generator.get_preview_data_for_manifest(format_id, manifest) for _ in range(3))
+        )
+
+    assert calls == 1
+    assert results[0] is not None
+    assert results[0]["preview_url"] == "https://preview.example.com/abc123"
+    assert all(result is results[0] for result in results)
+    assert generator._inflight == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cancelled", [0, 1], ids=["leader", "waiter"])
+async def test_cancelling_one_concurrent_preview_caller_spares_the_others(cancelled):
+    """Cancelling one caller never cancels the others sharing its in-flight request."""
+    config = AgentConfig(
+        id="creative_agent",
+        agent_uri="https://creative.example.com",
+        protocol=Protocol.MCP,
+    )
+
+    client = ADCPClient(config)
+    generator = PreviewURLGenerator(client)
+
+    format_id = make_format_id("display_300x250")
+    manifest = CreativeManifest(
+        format_id=format_id,
+        assets={"image": ImageAsset(url="https://example.com/img.jpg")},
+    )
+
+    mock_preview_response = PreviewCreativeResponse1(
+        response_type="single",
+        expires_at="2099-12-01T00:00:00Z",
+        previews=[
+            {
+                "preview_id": "prev-1",
+                "input": {"name": "Default"},
+                "renders": [
+                    {
+                        "render_id": "render-1",
+                        "role": "primary",
+                        "output_format": "url",
+                        "preview_url": "https://preview.example.com/abc123",
+                    }
+                ],
+            }
+        ],
+    )
+    release = asyncio.Event()
+
+    async def slow_preview(request):
+        await release.wait()
+        return TaskResult(status=TaskStatus.COMPLETED, data=mock_preview_response, success=True)
+
+    with patch.object(client, "preview_creative", side_effect=slow_preview):
+        tasks = [
+            asyncio.create_task(generator.get_preview_data_for_manifest(format_id, manifest))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)  # Task 0 leads the request; the others wait on it
+        tasks[cancelled].cancel()
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert isinstance(results[cancelled], asyncio.CancelledError)
+    others = [result for i, result in enumerate(results) if i != cancelled]
+    if cancelled == 0:
+        # The leader's request was abandoned, so waiters see a failed preview
+        assert others == [None, None]
+    else:
+        assert all(
+            result["preview_url"] == "https://preview.example.com/abc123" for result in others
+        )
+    assert generator._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_preview_batch_sends_duplicate_manifests_once():
+    """Repeated manifests in a batch are requested once and fanned out to each slot."""
+    from types import SimpleNamespace
+
+    config = AgentConfig(
+        id="creative_agent",
+        agent_uri="https://creative.example.com",
+        protocol=Protocol.MCP,
+    )
+
+    client = ADCPClient(config)
+    generator = PreviewURLGenerator(client)
+
+    banner = make_format_id("display_300x250")
+    leaderboard = make_format_id("display_728x90")
+    banner_manifest = CreativeManifest(
+        format_id=banner,
+        assets={"image": ImageAsset(url="https://example.com/img.jpg")},
+    )
+    leaderboard_manifest = CreativeManifest(
+        format_id=leaderboard,
+        assets={"image": ImageAsset(url="https://example.com/wide.jpg")},
+    )
+
+    def batch_result(preview_id):
+        return {
+            "success": True,
+            "response": {
+                "expires_at": "2025-12-01T00:00:00Z",
+                "previews": [
+                    {
+                        "preview_id": preview_id,
+                        "input": {"name": "Default"},
+                        "renders": [
+                            {
+                                "render_id": "render-1",
+                                "preview_url": f"https://preview.example.com/{preview_id}",
+                            }
+                        ],
+                    }
+                ],
+            },
+        }
+
+    mock_result = TaskResult(
+        status=TaskStatus.COMPLETED,
+        data=SimpleNamespace(results=[batch_result("banner"), batch_result("leaderboard")]),
+        success=True,
+    )
+
+    with patch.object(client, "preview_creative", return_value=mock_result) as mock_call:
+        results = await generator.get_preview_data_batch(
+            [
+                (banner, banner_manifest),
+                (leaderboard, leaderboard_manifest),
+                (banner, banner_manifest),
+            ]
+        )
+
+    mock_call.assert_called_once()
+    batch_request = mock_call.call_args.args[0]
+    assert len(batch_request.requests) == 2
+    assert batch_request.requests[0].creative_manifest is banner_manifest
+    assert results[0]["preview_id"] == "banner"
+    assert results[1]["preview_id"] == "leaderboard"
+    assert results[2] is results[0]
+
+
 @pytest.mark.asyncio
 async def test_get_preview_data_for_manifest():
     """Test generating preview data for a manifest."""
@@ -179,7 +373,7 @@ async def test_preview_data_caching():
     # Parsed result from _parse_response
     mock_preview_response = PreviewCreativeResponse1(
         response_type="single",
-        expires_at="2025-12-01T00:00:00Z",
+        expires_at="2099-12-01T00:00:00Z",
         previews=[
             {
                 "preview_id": "prev-1",
@@ -406,6 +600,254 @@ async def test_list_creative_formats_with_preview_urls():
                 assert "preview_url" in formats_with_previews[0]["preview_data"]
 
 
+@pytest.mark.asyncio
+async def test_switching_preview_output_format_requests_new_previews():
+    """URL and HTML previews of the same format are cached apart on one client."""
+    config = AgentConfig(
+        id="creative_agent",
+        agent_uri="https://creative.example.com",
+        protocol=Protocol.MCP,
+    )
+    client = ADCPClient(config)
+    fmt = Format(
+        format_id=make_format_id("display_300x250"),
+        name="Display 300x250",
+        type="display",
+        assets_required=[{"asset_id": "image", "asset_type": "image", "item_type": "individual"}],
+    )
+    mock_raw_result = TaskResult(status=TaskStatus.COMPLETED, data={"formats": []}, success=True)
+    mock_parsed_result = TaskResult(
+        status=TaskStatus.COMPLETED,
+        data=ListCreativeFormatsResponse(formats=[fmt], errors=None),
+        success=True,
+    )
+    mock_preview_result = TaskResult(
+        status=TaskStatus.COMPLETED,
+        data=PreviewCreativeResponse1(
+            response_type="single",
+            expires_at="2099-12-01T00:00:00Z",
+            previews=[
+                {
+                    "preview_id": "prev-1",
+                    "input": {"name": "Default"},
+                    "renders": [
+                        {
+                            "render_id": "render-1",
+                            "role": "primary",
+                            "output_format": "url",
+                            "preview_url": "https://preview.example.com/abc123",
+                        }
+                    ],
+                }
+            ],
+        ),
+        success=True,
+    )
+
+    with (
+        patch.object(client.adapter, "list_creative_formats", return_value=mock_raw_result),
+        patch.object(client.adapter, "_parse_response", return_value=mock_parsed_result),
+        patch.object(client, "preview_creative", return_value=mock_preview_result) as preview,
+    ):
+        await client.list_creative_formats(ListCreativeFormatsRequest(), fetch_previews=True)
+        await client.list_creative_formats(
+            ListCreativeFormatsRequest(), fetch_previews=True, preview_output_format="html"
+        )
+        await client.list_creative_formats(
+            ListCreativeFormatsRequest(), fetch_previews=True, preview_output_format="html"
+        )
+
+    assert preview.await_count == 2
+    output_formats = [call.args[0].output_format.value for call in preview.await_args_list]
+    assert output_formats == ["url", "html"]
+
+
+@pytest.mark.asyncio
+async def test_individual_preview_requests_respect_concurrency_limit():
+    """Non-batch preview fan-out keeps at most `concurrency` requests in flight."""
+    config = AgentConfig(
+        id="creative_agent",
+        agent_uri="https://creative.example.com",
+        protocol=Protocol.MCP,
+    )
+    client = ADCPClient(config)
+    formats = [
+        Format(
+            format_id=make_format_id(f"display_{i}"),
+            name=f"Display {i}",
+            type="display",
+            assets_required=[
+                {"asset_id": "image", "asset_type": "image", "item_type": "individual"}
+            ],
+        )
+        for i in range(6)
+    ]
+    in_flight = 0
+    peak = 0
+
+    async def fake_preview(self, format_id, manifest, output_format="url"):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"preview_url": f"https://preview.example.com/{format_id.id}"}
+
+    with patch.object(PreviewURLGenerator, "get_preview_data_for_manifest", fake_preview):
+        results = await add_preview_urls_to_formats(formats, client, use_batch=False, concurrency=2)
+
+    assert peak == 2
+    assert all("preview_data" in result for result in results)
+
+
+@pytest.mark.asyncio
+async def test_individual_preview_requests_build_each_sample_manifest_once():
+    """The non-batch path reuses the sample manifests prepared up front."""
+    from adcp.utils import preview_cache
+
+    config = AgentConfig(
+        id="creative_agent",
+        agent_uri="https://creative.example.com",
+        protocol=Protocol.MCP,
+    )
+    formats = [
+        Format(
+            format_id=make_format_id(f"display_{i}"),
+            name=f"Display {i}",
+            type="display",
+            assets_required=[
+                {"asset_id": "image", "asset_type": "image", "item_type": "individual"}
+            ],
+        )
+        for i in range(3)
+    ]
+
+    async def fake_preview(self, format_id, manifest, output_format="url"):
+        return {"preview_url": f"https://preview.example.com/{format_id.id}"}
+
+    with (
+        patch.object(PreviewURLGenerator, "get_preview_data_for_manifest", fake_preview),
+        patch.object(
+            preview_cache,
+            "_create_sample_manifest_for_format",
+            wraps=_create_sample_manifest_for_format,
+        ) as create_manifest,
+    ):
+        results = await add_preview_urls_to_formats(formats, ADCPClient(config), use_batch=False)
+
+    assert create_manifest.call_count == len(formats)
+    assert all("preview_data" in result for result in results)
+
+
+def test_preview_cache_drops_expired_and_least_recently_used_entries():
+    """Cached previews expire with the agent's expires_at and are bounded in number."""
+    config = AgentConfig(
+        id="creative_agent",
+        agent_uri="https://creative.example.com",
+        protocol=Protocol.MCP,
+    )
+    generator = PreviewURLGenerator(ADCPClient(config), max_cache_size=2)
+
+    generator._store_cached("expired", {"expires_at": "2020-01-01T00:00:00Z"})
+    assert generator._get_cached("expired") is None
+    assert "expired" not in generator._preview_cache
+
+    generator._store_cached("a", {"expires_at": "2099-01-01 00:00:00+00:00"})
+    generator._store_cached("b", {"expires_at": None})
+    assert generator._get_cached("a") is not None  # "a" is now most recently used
+    generator._store_cached("c", {})
+
+    assert list(generator._preview_cache) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_client_reuses_preview_generator_across_calls():
+    """A creative agent client keeps one preview generator, so its cache survives calls."""
+    config = AgentConfig(
+        id="creative_agent",
+        agent_uri="https://creative.example.com",
+        protocol=Protocol.MCP,
+    )
+    client = ADCPClient(config)
+    fmt = Format(
+        format_id=make_format_id("display_300x250"),
+        name="Display 300x250",
+        type="display",
+        assets_required=[{"asset_id": "image", "asset_type": "image", "item_type": "individual"}],
+    )
+    generator = client._get_preview_generator()
+    assert client._get_preview_generator() is generator
+
+    with patch.object(
+        generator, "get_preview_data_for_manifest", return_value={"preview_url": "u"}
+    ) as get_preview:
+        await add_preview_urls_to_formats([fmt], client, generator=generator)
+
+    get_preview.assert_awaited_once()
+
+
+def test_manifest_cache_key_ignores_nested_key_order():
+    """Cache keys depend on manifest content, not on dict insertion order."""
+    format_id = make_format_id("display_300x250")
+    first = {"assets": {"image": {"url": "a", "width": 300}, "click": {"url": "b"}}}
+    second = {"assets": {"click": {"url": "b"}, "image": {"width": 300, "url": "a"}}}
+
+    assert _make_manifest_cache_key(format_id, first) == _make_manifest_cache_key(format_id, second)
+    assert _make_manifest_cache_key(format_id, first) != _make_manifest_cache_key(
+        make_format_id("display_728x90"), first
+    )
+    assert len(_make_manifest_cache_key(format_id, first)) == 16
+
+
+def test_manifest_cache_key_from_model():
+    """Manifest models are keyed by their serialized content."""
+    format_id = make_format_id("display_300x250")
+    manifest = CreativeManifest(
+        format_id=format_id,
+        assets={"image": ImageAsset(url="https://example.com/img.jpg")},
+    )
+    same = CreativeManifest(
+        format_id=format_id,
+        assets={"image": ImageAsset(url="https://example.com/img.jpg")},
+    )
+    other = CreativeManifest(
+        format_id=format_id,
+        assets={"image": ImageAsset(url="https://example.com/other.jpg")},
+    )
+
+    assert _make_manifest_cache_key(format_id, manifest) == _make_manifest_cache_key(
+        format_id, same
+    )
+    assert _make_manifest_cache_key(format_id, manifest) != _make_manifest_cache_key(
+        format_id, other
+    )
+
+
+def test_manifest_cache_key_from_model_ignores_asset_order():
+    """Equal manifest models hash alike whatever their asset order, and match their dicts."""
+    format_id = make_format_id("display_300x250")
+    first = CreativeManifest(
+        format_id=format_id,
+        assets={
+            "image": ImageAsset(url="https://example.com/img.jpg"),
+            "headline": TextAsset(content="Hello"),
+        },
+    )
+    second = CreativeManifest(
+        format_id=format_id,
+        assets={
+            "headline": TextAsset(content="Hello"),
+            "image": ImageAsset(url="https://example.com/img.jpg"),
+        },
+    )
+
+    assert first == second
+    assert _make_manifest_cache_key(format_id, first) == _make_manifest_cache_key(format_id, second)
+    assert _make_manifest_cache_key(format_id, first) == _make_manifest_cache_key(
+        format_id, second.model_dump(mode="json", exclude_none=True)
+    )
+
+
 def test_create_sample_asset():
     """Test sample asset creation."""
     from adcp.types._generated import HtmlAsset, ImageAsset, TextAsset, UrlAsset, VideoAsset
@@ -430,6 +872,11 @@ def test_create_sample_asset():
     assert isinstance(html_asset, HtmlAsset)
     assert "<div>" in html_asset.content
 
+    fallback_asset = _create_sample_asset("audio")
+    assert isinstance(fallback_asset, UrlAsset)
+    assert "sample-asset" in str(fallback_asset.url)
+    assert _create_sample_asset("image") is not image_asset  # Fresh model per call
+
 
 def test_create_sample_manifest_for_format():
     """Test creating sample manifest for a format."""
@@ -1,5 +1,6 @@
 """Tests for protocol adapters."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -149,6 +150,18 @@ class TestA2AAdapter:
             assert "create_media_buy" in tools
             assert "list_creative_formats" in tools
 
+    @pytest.mark.asyncio
+    async def test_shared_http_client_is_reused_and_not_closed(self, a2a_config):
+        """Test that a caller-provided HTTP client is used but left open on close."""
+        shared_client = AsyncMock()
+        adapter = A2AAdapter(a2a_config, http_client=shared_client)
+
+        assert await adapter._get_client() is shared_client
+
+        await adapter.close()
+
+        shared_client.aclose.assert_not_called()
+
 
 class TestMCPAdapter:
     """Tests for MCP protocol adapter."""
@@ -298,6 +311,24 @@ class TestMCPAdapter:
             assert "get_products" in tools
             assert "create_media_buy" in tools
 
+    @pytest.mark.asyncio
+    async def test_list_tools_cached_per_session(self, mcp_config):
+        """Test that MCP tool names are fetched once and cached as a tuple."""
+        adapter = MCPAdapter(mcp_config)
+
+        mock_session = AsyncMock()
+        mock_tool = MagicMock()
+        mock_tool.name = "get_products"
+        mock_session.list_tools.return_value = MagicMock(tools=[mock_tool])
+
+        with patch.object(adapter, "_get_session", return_value=mock_session):
+            first = await adapter.list_tools()
+            second = await adapter.list_tools()
+
+        assert first == ("get_products",)
+        assert second is first
+        mock_session.list_tools.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_close_session(self, mcp_config):
         """Test closing MCP session."""
@@ -312,6 +343,38 @@ class TestMCPAdapter:
         assert adapter._exit_stack is None
         assert adapter._session is None
 
+    @pytest.mark.asyncio
+    async def test_async_context_manager_prewarms_and_closes(self, mcp_config):
+        """Test that async with connects on entry and closes on exit."""
+        adapter = MCPAdapter(mcp_config)
+        mock_session = AsyncMock()
+
+        with patch.object(adapter, "_get_session", return_value=mock_session) as get_session:
+            with patch.object(adapter, "close", new=AsyncMock()) as close:
+                async with adapter as entered:
+                    assert entered is adapter
+                    get_session.assert_awaited_once()
+                    close.assert_not_awaited()
+
+                close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_connect_creates_one_session(self, mcp_config):
+        """Test that concurrent callers share a single session creation."""
+        adapter = MCPAdapter(mcp_config)
+        mock_session = AsyncMock()
+
+        async def create_session():
+            await asyncio.sleep(0)
+            adapter._session = mock_session
+            return mock_session
+
+        with patch.object(adapter, "_create_session", side_effect=create_session) as create:
+            sessions = await asyncio.gather(*(adapter._get_session() for _ in range(5)))
+
+        assert all(session is mock_session for session in sessions)
+        create.assert_awaited_once()
+
     def test_serialize_mcp_content_with_dicts(self, mcp_config):
         """Test serializing MCP content that's already dicts."""
         adapter = MCPAdapter(mcp_config)
@@ -346,6 +409,30 @@ class TestMCPAdapter:
         assert result[0] == {"type": "text", "text": "Pydantic v2"}
         assert isinstance(result[0], dict)
 
+    def test_parse_response_preserves_protocol_fields(self, mcp_config):
+        """Test that parsing keeps status, message, metadata and debug info."""
+        from pydantic import BaseModel
+
+        from adcp.types.core import DebugInfo, TaskResult
+
+        adapter = MCPAdapter(mcp_config)
+
+        class MockResponse(BaseModel):
+            value: int
+
+        debug_info = DebugInfo(request={"tool": "t"}, response={})
+        raw = TaskResult.completed(
+            {"value": 1}, message="ok", metadata={"task_id": "t1"}, debug_info=debug_info
+        )
+
+        result = adapter._parse_response(raw, MockResponse)
+
+        assert result.data == MockResponse(value=1)
+        assert result.message == "ok"
+        assert result.metadata == {"task_id": "t1"}
+        assert result.debug_info is debug_info
+        assert raw.data == {"value": 1}
+
     def test_serialize_mcp_content_mixed(self, mcp_config):
         """Test serializing mixed MCP content (dicts and Pydantic objects)."""
         from pydantic import BaseModel
@@ -288,3 +288,85 @@ def test_public_api_has_version():
     assert hasattr(adcp, "__version__"), "adcp package should export __version__"
     assert isinstance(adcp.__version__, str), "__version__ should be a string"
     assert len(adcp.__version__) > 0, "__version__ should not be empty"
+
+
+def test_types_package_resolves_lazy_exports():
+    """Lazily re-exported names in adcp.types resolve to their defining objects."""
+    import adcp.types
+    from adcp.types import aliases, core
+
+    for name in aliases.__all__:
+        if name in adcp.types.__all__:
+            assert getattr(adcp.types, name) is getattr(aliases, name)
+
+    assert adcp.types.UrlVastAsset is aliases.UrlVastAsset
+    assert adcp.types.AgentConfig is core.AgentConfig
+    assert adcp.types.aliases is aliases
+    assert "UrlVastAsset" in dir(adcp.types)
+
+
+def test_types_package_resolves_generated_exports():
+    """Every name in adcp.types.__all__ resolves, including renamed generated types."""
+    import adcp.types
+    from adcp.types import _generated
+
+    for name in adcp.types.__all__:
+        assert getattr(adcp.types, name) is not None
+
+    assert adcp.types.Product is _generated.Product
+    assert adcp.types.AssetType is _generated.AssetContentType
+    assert adcp.types.GeneratedTaskStatus is _generated.TaskStatus
+    assert adcp.types.generated is _generated
+
+
+def test_types_package_unknown_attribute_raises():
+    """Unknown names still raise AttributeError from adcp.types."""
+    import pytest
+
+    import adcp.types
+
+    with pytest.raises(AttributeError, match="NotARealType"):
+        adcp.types.NotARealType  # noqa: B018
+
+
+def test_importing_adcp_defers_client_and_generated_models():
+    """import adcp does not load the client or generated models until used."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, adcp; "
+        "assert 'adcp.client' not in sys.modules; "
+        "assert 'adcp.types._generated' not in sys.modules; "
+        "adcp.ADCPClient; "
+        "assert 'adcp.client' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_adcp_package_resolves_submodules_lazily():
+    """Package submodules stay reachable as attributes of adcp and are listed by dir()."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, adcp; "
+        "assert 'adcp.client' not in sys.modules; "
+        "names = ('adagents', 'client', 'config', 'protocols', 'simple', 'testing', "
+        "'utils', 'validation'); "
+        "assert set(names) <= set(dir(adcp)); "
+        "assert all(getattr(adcp, n) is sys.modules['adcp.' + n] for n in names)"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_adcp_package_resolves_all_exports():
+    """Every name in adcp.__all__ resolves through the lazy exports."""
+    import adcp
+    from adcp.types import _generated
+
+    for name in adcp.__all__:
+        assert getattr(adcp, name) is not None
+
+    assert adcp.Product is _generated.Product
+    assert adcp.generated is _generated
@@ -135,3 +135,24 @@ class TestParseJSONOrText:
 
         with pytest.raises(ValueError, match="doesn't match expected schema"):
             parse_json_or_text(data, SampleResponse)
+
+    def test_parse_union_type_uses_first_matching_variant(self):
+        """Test that Union response types match variants in declaration order."""
+
+        class ErrorResponse(BaseModel):
+            errors: list[str]
+
+        result = parse_json_or_text({"errors": ["boom"]}, SampleResponse | ErrorResponse)
+        assert isinstance(result, ErrorResponse)
+
+        result = parse_json_or_text({"message": "ok", "count": 1}, SampleResponse | ErrorResponse)
+        assert isinstance(result, SampleResponse)
+
+    def test_union_type_not_matching_raises_error(self):
+        """Test that data matching no Union variant raises ValueError."""
+
+        class ErrorResponse(BaseModel):
+            errors: list[str]
+
+        with pytest.raises(ValueError, match="SampleResponse, ErrorResponse"):
+            parse_json_or_text({"wrong": "data"}, SampleResponse | ErrorResponse)
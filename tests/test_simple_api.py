@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
-
 import pytest
 
 from adcp.testing import test_agent
@@ -16,8 +14,28 @@ from adcp.types._generated import (
 from adcp.types.core import TaskResult, TaskStatus
 
 
+@pytest.fixture
+def mock_method(monkeypatch):
+    """Replace an async client method with a stub returning result for one test.
+
+    install() returns the list of positional-argument tuples the stub was awaited with.
+    """
+
+    def install(client, name, result):
+        calls = []
+
+        async def method(*args, **kwargs):
+            calls.append(args)
+            return result
+
+        monkeypatch.setattr(client, name, method)
+        return calls
+
+    return install
+
+
 @pytest.mark.asyncio
-async def test_get_products_simple_api():
+async def test_get_products_simple_api(mock_method):
     """Test client.simple.get_products with kwargs."""
     # Create mock response (using model_construct to bypass validation for test data)
     mock_product = Product.model_construct(
@@ -31,35 +49,112 @@ async def test_get_products_simple_api():
     )
 
     # Mock the client's get_products method
-    with patch.object(test_agent, "get_products", new=AsyncMock(return_value=mock_result)):
-        # Call simplified API with kwargs
-        result = await test_agent.simple.get_products(brief="Coffee subscription service")
+    calls = mock_method(test_agent, "get_products", mock_result)
+
+    # Call simplified API with kwargs
+    result = await test_agent.simple.get_products(brief="Coffee subscription service")
 
-        # Verify it returns unwrapped data
-        assert isinstance(result, GetProductsResponse)
-        assert len(result.products) == 1
-        assert result.products[0].product_id == "prod_1"
+    # Verify it returns unwrapped data
+    assert isinstance(result, GetProductsResponse)
+    assert len(result.products) == 1
+    assert result.products[0].product_id == "prod_1"
 
-        # Verify the underlying call was made correctly
-        test_agent.get_products.assert_called_once()
-        call_args = test_agent.get_products.call_args[0][0]
-        assert call_args.brief == "Coffee subscription service"
+    # Verify the underlying call was made correctly
+    assert len(calls) == 1
+    call_args = calls[0][0]
+    assert call_args.brief == "Coffee subscription service"
 
 
 @pytest.mark.asyncio
-async def test_get_products_simple_api_failure():
-    """Test client.simple.get_products raises exception on failure."""
+@pytest.mark.parametrize(
+    ("result_kwargs", "match"),
+    [
+        (
+            {"status": TaskStatus.FAILED, "success": False, "error": "Test error"},
+            "get_products failed: Test error",
+        ),
+        (
+            {
+                "status": TaskStatus.SUBMITTED,
+                "submitted": {"webhook_url": "https://hook.example.com", "operation_id": "op_1"},
+            },
+            "get_products failed",
+        ),
+        (
+            {"status": TaskStatus.NEEDS_INPUT, "needs_input": {"message": "Which market?"}},
+            "get_products failed",
+        ),
+    ],
+    ids=["failed", "submitted", "needs_input"],
+)
+async def test_get_products_simple_api_failure(mock_method, result_kwargs, match):
+    """Test client.simple.get_products raises unless the task completed with data."""
     from adcp.exceptions import ADCPSimpleAPIError
 
-    # Create mock failure response
+    # Create mock response without data
+    mock_result = TaskResult[GetProductsResponse](data=None, **result_kwargs)
+
+    mock_method(test_agent, "get_products", mock_result)
+
+    # Should raise ADCPSimpleAPIError on failure
+    with pytest.raises(ADCPSimpleAPIError, match=match):
+        await test_agent.simple.get_products(brief="Test")
+
+
+@pytest.mark.asyncio
+async def test_get_products_simple_api_skip_validation(mock_method):
+    """Test client.simple.get_products(validate=False) builds the request without validation."""
+    from adcp.types._generated import GetProductsRequest
+
+    mock_response = GetProductsResponse.model_construct(products=[])
+    mock_result = TaskResult[GetProductsResponse](
+        status=TaskStatus.COMPLETED, data=mock_response, success=True
+    )
+
+    calls = mock_method(test_agent, "get_products", mock_result)
+
+    # An int brief would fail validation; validate=False passes it through untouched
+    result = await test_agent.simple.get_products(validate=False, brief=123)
+
+    assert result is mock_response
+    call_args = calls[0][0]
+    assert isinstance(call_args, GetProductsRequest)
+    assert call_args.brief == 123
+    assert call_args.model_fields_set == {"brief"}
+
+
+@pytest.mark.asyncio
+async def test_get_products_simple_api_skip_validation_nested_model(mock_method):
+    """validate=False passes nested model instances through and serializes them cleanly."""
+    import warnings
+
+    from adcp.types._generated import BrandManifest
+
+    mock_response = GetProductsResponse.model_construct(products=[])
     mock_result = TaskResult[GetProductsResponse](
-        status=TaskStatus.FAILED, data=None, success=False, error="Test error"
+        status=TaskStatus.COMPLETED, data=mock_response, success=True
     )
+    calls = mock_method(test_agent, "get_products", mock_result)
+    brand = BrandManifest(name="Acme")
 
-    with patch.object(test_agent, "get_products", new=AsyncMock(return_value=mock_result)):
-        # Should raise ADCPSimpleAPIError on failure
-        with pytest.raises(ADCPSimpleAPIError, match="get_products failed"):
-            await test_agent.simple.get_products(brief="Test")
+    await test_agent.simple.get_products(validate=False, brief="Test", brand_manifest=brand)
+
+    call_args = calls[0][0]
+    assert call_args.brand_manifest is brand
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert call_args.model_dump(mode="json")["brand_manifest"]["name"] == "Acme"
+
+
+@pytest.mark.asyncio
+async def test_get_products_simple_api_skip_validation_rejects_nested_dict(mock_method):
+    """validate=False refuses raw dicts for model-typed fields instead of sending them as-is."""
+    calls = mock_method(test_agent, "get_products", None)
+
+    with pytest.raises(TypeError, match="brand_manifest"):
+        await test_agent.simple.get_products(validate=False, brand_manifest={"name": "Acme"})
+
+    assert calls == []
 
 
 def test_simple_api_has_no_sync_methods():
@@ -73,7 +168,7 @@ def test_simple_api_has_no_sync_methods():
 
 
 @pytest.mark.asyncio
-async def test_list_creative_formats_simple_api():
+async def test_list_creative_formats_simple_api(mock_method):
     """Test client.simple.list_creative_formats with kwargs."""
     from adcp.types._generated import Format
 
@@ -88,14 +183,15 @@ async def test_list_creative_formats_simple_api():
         status=TaskStatus.COMPLETED, data=mock_response, success=True
     )
 
-    with patch.object(test_agent, "list_creative_formats", new=AsyncMock(return_value=mock_result)):
-        # Call simplified API
-        result = await test_agent.simple.list_creative_formats()
+    mock_method(test_agent, "list_creative_formats", mock_result)
+
+    # Call simplified API
+    result = await test_agent.simple.list_creative_formats()
 
-        # Verify it returns unwrapped data
-        assert isinstance(result, ListCreativeFormatsResponse)
-        assert len(result.formats) == 1
-        assert result.formats[0].format_id["id"] == "banner_300x250"
+    # Verify it returns unwrapped data
+    assert isinstance(result, ListCreativeFormatsResponse)
+    assert len(result.formats) == 1
+    assert result.formats[0].format_id["id"] == "banner_300x250"
 
 
 def test_simple_api_exists_on_client():
@@ -139,7 +235,7 @@ def test_simple_api_on_freshly_constructed_client():
 
 
 @pytest.mark.asyncio
-async def test_preview_creative_simple_api():
+async def test_preview_creative_simple_api(mock_method):
     """Test client.simple.preview_creative."""
     from adcp.testing import creative_agent
 
@@ -166,23 +262,24 @@ async def test_preview_creative_simple_api():
         status=TaskStatus.COMPLETED, data=mock_response, success=True
     )
 
-    with patch.object(creative_agent, "preview_creative", new=AsyncMock(return_value=mock_result)):
-        # Call simplified API with new schema structure
-        from adcp.types._generated import CreativeManifest, FormatId
+    mock_method(creative_agent, "preview_creative", mock_result)
 
-        format_id = FormatId(agent_url="https://creative.example.com", id="banner_300x250")
-        creative_manifest = CreativeManifest.model_construct(format_id=format_id, assets={})
+    # Call simplified API with new schema structure
+    from adcp.types._generated import CreativeManifest, FormatId
 
-        result = await creative_agent.simple.preview_creative(
-            request_type="single",
-            format_id=format_id,
-            creative_manifest=creative_manifest,
-        )
+    format_id = FormatId(agent_url="https://creative.example.com", id="banner_300x250")
+    creative_manifest = CreativeManifest.model_construct(format_id=format_id, assets={})
+
+    result = await creative_agent.simple.preview_creative(
+        request_type="single",
+        format_id=format_id,
+        creative_manifest=creative_manifest,
+    )
 
-        # Verify it returns unwrapped data
-        assert isinstance(result, PreviewCreativeResponse1)
-        assert result.previews is not None
-        assert len(result.previews) == 1
+    # Verify it returns unwrapped data
+    assert isinstance(result, PreviewCreativeResponse1)
+    assert result.previews is not None
+    assert len(result.previews) == 1
 
 
 def test_simple_api_methods():
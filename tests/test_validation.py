@@ -0,0 +1,87 @@
+"""Tests for runtime validation of adagents.json and product structures."""
+
+from __future__ import annotations
+
+import pytest
+
+from adcp.validation import (
+    ValidationError,
+    validate_adagents,
+    validate_agent_authorization,
+    validate_product,
+    validate_publisher_properties_item,
+)
+
+
+def test_agent_with_single_authorization_field_is_valid():
+    """Agents naming exactly one authorization field pass validation."""
+    validate_agent_authorization({"url": "https://agent.example.com", "property_ids": ["p1"]})
+    validate_agent_authorization(
+        {
+            "authorization_type": "inline_properties",
+            "properties": [{"property_type": "website", "name": "Example"}],
+        }
+    )
+
+
+def test_agent_authorization_type_requires_matching_field():
+    """The authorization_type discriminator must name a field that is present."""
+    with pytest.raises(ValidationError, match="authorization_type='property_tags' must have"):
+        validate_agent_authorization(
+            {"authorization_type": "property_tags", "property_ids": ["p1"]}
+        )
+
+    with pytest.raises(ValidationError, match="invalid authorization_type: everything"):
+        validate_agent_authorization({"authorization_type": "everything", "property_ids": ["p1"]})
+
+
+def test_agent_authorization_fields_are_mutually_exclusive():
+    """Errors list the conflicting fields in a stable order."""
+    with pytest.raises(
+        ValidationError, match="cannot have multiple fields: property_ids, property_tags"
+    ):
+        validate_agent_authorization({"property_tags": ["news"], "property_ids": ["p1"]})
+
+    with pytest.raises(ValidationError, match="must have exactly one of"):
+        validate_agent_authorization({"property_ids": None})
+
+
+def test_publisher_properties_items_are_validated():
+    """Items under publisher_properties are checked for agents and products."""
+    bad_item = {"publisher_domain": "example.com", "selection_type": "by_id"}
+
+    with pytest.raises(ValidationError, match="must have property_ids"):
+        validate_adagents({"agents": [{"publisher_properties": [bad_item]}]})
+
+    with pytest.raises(ValidationError, match="must have property_ids"):
+        validate_product({"publisher_properties": [bad_item]})
+
+    validate_adagents(
+        {
+            "agents": [
+                {
+                    "publisher_properties": [
+                        {"publisher_domain": "example.com", "property_tags": ["news"]}
+                    ]
+                }
+            ]
+        }
+    )
+
+
+def test_publisher_properties_item_selectors():
+    """Exactly one selector is allowed and it must match selection_type when given."""
+    validate_publisher_properties_item({"selection_type": "by_tag", "property_tags": ["news"]})
+    validate_publisher_properties_item({"property_ids": ["p1"]})
+
+    with pytest.raises(ValidationError, match="selection_type='by_tag' must have property_tags"):
+        validate_publisher_properties_item({"selection_type": "by_tag", "property_ids": ["p1"]})
+
+    with pytest.raises(ValidationError, match="invalid selection_type: all"):
+        validate_publisher_properties_item({"selection_type": "all", "property_ids": ["p1"]})
+
+    with pytest.raises(ValidationError, match="mutually exclusive"):
+        validate_publisher_properties_item({"property_ids": ["p1"], "property_tags": ["news"]})
+
+    with pytest.raises(ValidationError, match="At least one is required"):
+        validate_publisher_properties_item({"property_ids": None})